@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2020-05-19
-# modified: 2021-05-08
+# modified: 2026-10-18
 #
 
 from abc import ABC, abstractmethod
@@ -134,6 +134,11 @@ class Behaviour(ABC, Subscriber):
         abstract class and is meant to be extended by subclasses. It is not
         called when the behaviour is suppressed.
 
+        This is always called on the event loop, as behaviours act upon the
+        message bus and message factory. CPU-bound work should instead be
+        placed in compute(), which is offloaded with the 'thread' or 'process'
+        mode.
+
         :param message:  the Message passed along by the message bus
         '''
         raise NotImplementedError('execute() must be implemented in subclasses.')
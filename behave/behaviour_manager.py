@@ -7,10 +7,10 @@
 #
 # author:   Murray Altheim
 # created:  2021-02-16
-# modified: 2025-05-08
+# modified: 2026-10-18
 #
 
-import os, inspect, importlib.util # to locate Behaviours
+import os, importlib # to locate Behaviours
 
 import asyncio
 import random
@@ -26,8 +26,10 @@ from core.orientation import Orientation
 from core.message import Message
 from core.message_factory import MessageFactory
 from core.subscriber import Subscriber
+from core.priority_aging import PriorityAging
 from core.util import Util
 from behave.behaviour import Behaviour
+from behave.behaviour_manifest import BehaviourManifest
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class BehaviourManager(Subscriber):
@@ -41,6 +43,11 @@ class BehaviourManager(Subscriber):
     See the note under suppress_all_behaviours() regarding the stored state
     of Behaviours when this manager is itself suppressed.
 
+    If 'aging' is enabled in the behaviour configuration, a request for a
+    Behaviour refused because a higher priority Behaviour is running gains
+    effective priority the longer it is repeatedly refused, so that it will
+    eventually pre-empt the running Behaviour.
+
     :param name:         the subscriber name (for logging)
     :param config:       the application configuration
     :param message_bus:  the message bus
@@ -60,6 +67,7 @@ class BehaviourManager(Subscriber):
         self._clip_event_list  = True #_cfg.get('clip_event_list') # used for printing only
         self._clip_length      = 42   #_cfg.get('clip_length')
         self._behaviours       = {}
+        self._aging            = PriorityAging(config['kros'].get('behaviour'))
         self._find_behaviours()
         self._log.info('ready.')
 
@@ -68,32 +76,39 @@ class BehaviourManager(Subscriber):
         '''
         Loads a dictionary with instantiated Behaviours found in the current
         directory.
-        '''
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        for filename in os.listdir(current_dir):
-            if filename.endswith(".py") and filename != os.path.basename(__file__):
-                module_path = os.path.join(current_dir, filename)
-                module_name = filename[:-3]
-                spec = importlib.util.spec_from_file_location(module_name, module_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    try:
-                        spec.loader.exec_module(module)
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            if issubclass(obj, Behaviour) and obj is not Behaviour:
-                                key = name.lower()
-                                if key not in self._behaviours:
-                                    _behaviour = obj(
-                                        self._config,
-                                        self._message_bus,
-                                        self._message_factory,
-                                        self._level
-                                    )
-                                    # we don't need this if there is self-registration
-                                    self._behaviours[_behaviour.name] = _behaviour
-                    except Exception as e:
-                        stack_trace = traceback.format_exc()
-                        self._log.error("{} thrown loading filename '{}' for behaviour: {}\n{}".format(type(e), filename, e, stack_trace))
+
+        The Behaviour classes are located from a cached manifest of the
+        package rather than by executing each of its modules, so that only
+        the modules of enabled Behaviours are imported, once, via the normal
+        import system. A Behaviour is enabled unless its configuration flag,
+        'enable_<name>_behaviour' in the 'kros.behaviour' section, is False.
+        '''
+        _cfg = self._config['kros'].get('behaviour')
+        _package = __name__.rpartition('.')[0]
+        _manifest = BehaviourManifest(os.path.dirname(os.path.abspath(__file__)))
+        _found = _manifest.behaviours()
+        self._log.debug('found %d behaviour classes in manifest (%d modules parsed).', len(_found), _manifest.parsed)
+        for _module_name, _class_name in _found:
+            key = _class_name.lower()
+            if not _cfg.get('enable_{}_behaviour'.format(key), True):
+                self._log.info("behaviour '{}' disabled.".format(key))
+                continue
+            try:
+                _class = getattr(importlib.import_module('{}.{}'.format(_package, _module_name)), _class_name)
+                if not issubclass(_class, Behaviour):
+                    raise TypeError('{} is not a Behaviour.'.format(_class_name))
+                if key not in self._behaviours:
+                    _behaviour = _class(
+                        self._config,
+                        self._message_bus,
+                        self._message_factory,
+                        self._level
+                    )
+                    # we don't need this if there is self-registration
+                    self._behaviours[_behaviour.name] = _behaviour
+            except Exception as e:
+                stack_trace = traceback.format_exc()
+                self._log.error("{} thrown loading module '{}' for behaviour: {}\n{}".format(type(e), _module_name, e, stack_trace))
         # list registered behaviours
         if len(self._behaviours) > 0:
             self._log.info("registered {} behaviours:".format(len(self._behaviours)))
@@ -273,23 +288,26 @@ class BehaviourManager(Subscriber):
 #       self._log.info('designated trigger behaviour: ' + Fore.YELLOW + '{}'.format(_trigger_behaviour.name))
         if self._active_behaviour is None: # no current active behaviour so just release this one
             self._log.info('no current behaviour; releasing behaviour (suppressed? {}) '.format(_behaviour.suppressed) + Fore.YELLOW + '{}'.format(_behaviour.name))
+            self._aging.served(_event)
             self._active_behaviour = _behaviour
             _behaviour.on_trigger(message)
 
         elif self._active_behaviour is _behaviour:
             # if the current active behaviour is already this one, we ignore the message
             self._log.info('the requested behaviour ' + Fore.YELLOW + '{}'.format(_behaviour.name) + Fore.CYAN + ' is already executing.')
+            self._aging.served(_event)
             _behaviour.on_trigger(message)
 
         elif self._active_behaviour.suppressed:
             self._log.info('current behaviour was suppressed; releasing behaviour ' + Fore.YELLOW + '{}'.format(_behaviour.name))
+            self._aging.served(_event)
             self._active_behaviour = _behaviour
             _behaviour.on_trigger(message)
 
         else:
             self._log.info('there is a behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name)
                     + Fore.CYAN + ' already running; comparing…')
-            _compare = _event.compare_to_priority_of(self._active_behaviour.trigger_event)
+            _compare = self._compare_to_active(_event)
             if _compare == 1:
                 self._log.info('requested behaviour ' + Fore.YELLOW + '{}'.format(_event.name) + Fore.CYAN
                         + ' is HIGHER priority than existing behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name))
@@ -297,6 +315,7 @@ class BehaviourManager(Subscriber):
                 self._log.info('suppressing old behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name))
                 self._active_behaviour.suppress()
                 self._log.info('setting new behaviour ' + Fore.YELLOW + '{}'.format(_behaviour.name) + Fore.CYAN + ' as active…')
+                self._aging.served(_event)
                 self._active_behaviour = _behaviour
                 self._log.info('releasing new behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name))
                 self._active_behaviour.release()
@@ -306,11 +325,39 @@ class BehaviourManager(Subscriber):
                 self._log.info('requested behaviour ' + Fore.YELLOW + '{}'.format(_event.name) + Fore.CYAN
                         + ' is LOWER priority than existing behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name)
                         + Fore.CYAN + ' (no change)')
+                self._aging.waiting(_event)
             else: # _compare == 0:
                 # same priority, no change
                 self._log.info('requested behaviour ' + Fore.YELLOW + '{}'.format(_event.name) + Fore.CYAN
                         + ' has the SAME priority as existing behaviour ' + Fore.YELLOW + '{}'.format(self._active_behaviour.name)
                         + Fore.CYAN + ' (no change)')
+                self._aging.waiting(_event)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _compare_to_active(self, event):
+        '''
+        As with Event.compare_to_priority_of(), returns 1 if the event is a
+        higher priority than the trigger event of the active Behaviour, -1 if
+        lower, or 0 if the same, but using the event's effective (aged)
+        priority.
+        '''
+        _priority = self._aging.effective_priority(event)
+        _active_priority = self._active_behaviour.trigger_event.priority
+        if _priority < _active_priority:
+            return 1
+        elif _priority > _active_priority:
+            return -1
+        else:
+            return 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self):
+        '''
+        Prints the worker pool statistics and the per-event wait-time and
+        starvation statistics of Behaviour requests.
+        '''
+        Subscriber.print_statistics(self)
+        self._aging.print_statistics(self._log, self.name)
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def print_info(self):
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# A cached index of the Behaviour classes found in the behave package.
+#
+
+import os
+import ast
+import json
+
+# the name of the root class of all Behaviours
+ROOT_CLASS = 'Behaviour'
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class BehaviourManifest(object):
+    '''
+    Indexes the Behaviour classes defined in the modules of a package
+    directory without importing or executing them: each module's source
+    is parsed and its class definitions and their base class names noted.
+    A class is a Behaviour if it names Behaviour, or another Behaviour
+    found in the package, as a base class.
+
+    The index is cached as JSON, by default in the package's __pycache__
+    directory, keyed by the modification time and size of each module, so
+    that only new or changed modules are parsed again. Failing to read or
+    write the cache is not an error, it only means modules are re-parsed.
+
+    :param directory:   the package directory
+    :param cache_path:  the optional path of the cache file
+    '''
+    def __init__(self, directory, cache_path=None):
+        self._directory  = directory
+        self._cache_path = cache_path if cache_path is not None \
+                else os.path.join(directory, '__pycache__', 'behaviour-manifest.json')
+        self._parsed     = 0 # modules parsed rather than taken from the cache
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def parsed(self):
+        '''
+        Returns the number of modules parsed by the last call to behaviours().
+        '''
+        return self._parsed
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def behaviours(self):
+        '''
+        Returns a list of ( module name, class name ) tuples for the
+        Behaviour classes in the package, sorted by module then class name,
+        updating the cache if any module has changed.
+        '''
+        _cached  = self._read_cache()
+        _entries = {}
+        self._parsed = 0
+        for _filename in sorted(os.listdir(self._directory)):
+            if not _filename.endswith('.py') or _filename.startswith('__'):
+                continue
+            _stat  = os.stat(os.path.join(self._directory, _filename))
+            _entry = _cached.get(_filename)
+            if _entry is None or _entry['mtime_ns'] != _stat.st_mtime_ns or _entry['size'] != _stat.st_size:
+                _entry = { 'mtime_ns': _stat.st_mtime_ns, 'size': _stat.st_size, 'classes': self._parse(_filename) }
+                self._parsed += 1
+            _entries[_filename] = _entry
+        if self._parsed > 0 or _entries.keys() != _cached.keys():
+            self._write_cache(_entries)
+        # a class is a Behaviour if any base is, repeated to catch subclasses of subclasses
+        _bases = { ( _filename[:-3], _class_name ): _base_names
+                for _filename, _entry in _entries.items() for _class_name, _base_names in _entry['classes'] }
+        _behaviour_names = { ROOT_CLASS }
+        _found = set()
+        while True:
+            _added = { _key for _key, _base_names in _bases.items()
+                    if _key not in _found and _behaviour_names.intersection(_base_names) }
+            if not _added:
+                break
+            _found.update(_added)
+            _behaviour_names.update(_class_name for _module_name, _class_name in _added)
+        return sorted(_found)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _parse(self, filename):
+        '''
+        Returns a list of [ class name, [ base names ] ] for the top-level
+        classes of the module, or an empty list if it cannot be parsed.
+        '''
+        try:
+            with open(os.path.join(self._directory, filename), 'r', encoding='utf-8') as _file:
+                _tree = ast.parse(_file.read(), filename=filename)
+        except (OSError, SyntaxError, ValueError):
+            return []
+        _classes = []
+        for _node in _tree.body:
+            if isinstance(_node, ast.ClassDef):
+                _base_names = []
+                for _base in _node.bases:
+                    if isinstance(_base, ast.Name):
+                        _base_names.append(_base.id)
+                    elif isinstance(_base, ast.Attribute):
+                        _base_names.append(_base.attr)
+                _classes.append([ _node.name, _base_names ])
+        return _classes
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _read_cache(self):
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as _file:
+                _cached = json.load(_file)
+            return _cached if isinstance(_cached, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _write_cache(self, entries):
+        '''
+        Writes the cache to a temporary file then renames it, so that a
+        concurrent reader never sees a partial file.
+        '''
+        _tmp_path = self._cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(_tmp_path, 'w', encoding='utf-8') as _file:
+                json.dump(entries, _file, separators=(',',':'))
+            os.replace(_tmp_path, self._cache_path)
+        except OSError:
+            pass
+
+#EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2020-05-19
-# modified: 2025-05-08
+# modified: 2026-10-18
 #
 
 from abc import ABC, abstractmethod
@@ -21,6 +21,7 @@ import core.globals as globals
 globals.init()
 
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.component import Component
 from core.subscriber import Subscriber
 from core.util import Util
@@ -28,6 +29,7 @@ from core.event import Event, Group
 from core.fsm import State
 from behave.behaviour import Behaviour
 from core.publisher import Publisher
+from core.rate import AsyncRate
 from behave.trigger_behaviour import TriggerBehaviour
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -59,12 +61,12 @@ class Idle(Behaviour, Publisher):
         Publisher.__init__(self, Idle.CLASS_NAME, config, message_bus, message_factory, suppressed=False, level=level)
         # subscribe to all non-IDLE events
         self.add_events([member for member in Group if member not in (Group.NONE, Group.IDLE, Group.OTHER)])
-        _cfg = self._config['kros'].get('behaviour').get('idle')
-        self._idle_threshold_sec  = _cfg.get('idle_threshold_sec') # int value
+        _cfg = ConfigSection.of(self._config, 'kros.behaviour.idle')
+        self._idle_threshold_sec  = _cfg.idle_threshold_sec # int value
         self._log.info('idle threshold: {:d} sec.'.format(self._idle_threshold_sec))
-        _loop_freq_hz             = _cfg.get('loop_freq_hz')
+        _loop_freq_hz             = _cfg.loop_freq_hz
         self._log.info('idle loop frequency: {:d}Hz.'.format(_loop_freq_hz))
-        self._idle_loop_delay_sec = 1.0 / _loop_freq_hz
+        self._rate                = AsyncRate(_loop_freq_hz, name=Idle.CLASS_NAME, level=level)
         self._counter = itertools.count()
         self._idle_loop_running   = False
         self._value               = None
@@ -150,6 +152,7 @@ class Idle(Behaviour, Publisher):
                 + ( '; (suppressed, type \'u\' to release)' if self.suppressed else '.') )
 #       self.suppress()
         self._hello()
+        self._rate.reset()
         while f_is_enabled():
             _count = next(self._counter)
             self._log.debug('[{:005d}] begin idle loop…; suppressed? {}'.format(_count, self.suppressed))
@@ -197,9 +200,10 @@ class Idle(Behaviour, Publisher):
             else:
                 self._log.info(Fore.BLACK + '[{:005d}] idle suppressed.'.format(_count))
 
-            await asyncio.sleep(self._idle_loop_delay_sec)
+            await self._rate.wait()
             self._log.debug('[{:005d}] end idle loop.'.format(_count))
 
+        self._rate.print_statistics()
         self._log.info('idle loop complete.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -7,35 +7,38 @@
 #
 # author:   Murray Altheim
 # created:  2021-09-03
-# modified: 2021-09-04
+# modified: 2026-10-18
 #
 
-import sys, re
 import logging
 from logging.handlers import RotatingFileHandler
 
+from core.log_formatter import strip_ansi
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class AnsiFilteringRotatingFileHandler(RotatingFileHandler):
     '''
     Extends RotatingFileHandler to filter out ANSI character sequences from
     the emitted output.
+
+    The Logger no longer uses this, its file output formatted as plain text
+    by a PlainFormatter, but it remains for handlers whose formatter is not
+    ANSI-aware.
     '''
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None):
         RotatingFileHandler.__init__(self, filename=filename, mode='a', maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=False)
         # ready.
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def emit(self, record):
-        self._filter(record)
-        RotatingFileHandler.emit(self, record)
-
-    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _filter(self, record):
-        record.msg = self._escape_ansi(record.msg)
+    def format(self, record):
+        '''
+        Strips the formatted line rather than the record, which is shared
+        with any other handlers.
+        '''
+        return strip_ansi(RotatingFileHandler.format(self, record))
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def _escape_ansi(self, line):
-        ansi_escape = re.compile(r'(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]')
-        return ansi_escape.sub('', line)
+        return strip_ansi(line)
 
 #EOF
@@ -6,12 +6,14 @@
 #
 # author:   Murray Altheim
 # created:  2020-01-02
-# modified: 2021-04-26
+# modified: 2026-10-18
 #
 
 import itertools
+import asyncio
+import time
 import datetime as dt
-from asyncio.queues import PriorityQueue
+from asyncio.queues import PriorityQueue, QueueEmpty
 from colorama import init, Fore, Style
 init()
 
@@ -19,21 +21,79 @@ from core.logger import Logger
 from core.event import Event
 from core.component import Component
 from core.controller import Controller
+from core.rate import AsyncRate
+from core.timing_stats import TimingStats
+from core.priority_aging import PriorityAging
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Arbitrator(Component):
     '''
     Arbitrates a stream of events from a MessageBus according to priority,
     returning to a Controller when polled the highest priority of them.
+
+    In the default (immediate) mode each payload is passed to the controllers
+    as it arrives. In windowed mode payloads are collected over each control
+    tick, and once per tick only the highest priority payload (or the top k
+    payloads, in priority order) are passed to the controllers, the rest
+    being discarded.
+
+    Payloads are dispatched to each controller by its own long-lived task,
+    so controllers are called concurrently and a slow controller neither
+    delays the others nor the message bus. A controller's callback may be
+    a coroutine, in which case it is subject to the controller's timeout.
+    With 'skip_stale' set (it is off by default), a controller that falls
+    behind skips to the newest payload, discarding the rest of its backlog
+    rather than working through it.
+
+    As events are compared by strict priority, in windowed mode a steady
+    stream of high priority payloads would starve lower priority ones. With
+    'aging' enabled, the effective priority of an event passed over rises
+    with the time it has been waiting, up to 'max_aging'. Per-event wait
+    times and starvation counts are kept whether or not aging is enabled.
+
+    In windowed mode the arbitrator runs its own tick loop unless driven by
+    the system clock (see use_clock()), in which case it arbitrates as the
+    clock's arbitration phase, aligned with the other phases of each tick.
+
+    :param config:  the application configuration
+    :param level:   the log level
     '''
-    def __init__(self, level):
+    _TICK_LOOP = '__arbitrator-tick-loop'
+
+    def __init__(self, config, level):
         self._log = Logger('arbitrator', level)
         Component.__init__(self, self._log, suppressed=False, enabled=True)
+        _cfg = config['kros'].get('arbitrator') or {}
+        self._windowed    = _cfg.get('windowed', False)
+        _tick_hz          = _cfg.get('tick_hz', 20) # 50ms
+        if _tick_hz <= 0:
+            raise ValueError('expected a positive tick frequency, not: {}'.format(_tick_hz))
+        self._rate        = AsyncRate(_tick_hz, name='arbitrator', level=level) if self._windowed else None
+        self._top_k       = _cfg.get('top_k', 1)
+        if not isinstance(self._top_k, int) or self._top_k < 1:
+            raise ValueError('expected top k as a positive int, not: {}'.format(self._top_k))
         self._counter     = itertools.count()
         self._count       = 0
+        self._sequence    = itertools.count() # tie-breaker for payloads of equal priority
         self._queue       = PriorityQueue()
         self._controllers = []
-        self._log.info('ready.')
+        self._tick_task   = None
+        self._clocked     = False # if True ticks are driven by the ClockPublisher
+        self._tick_count  = 0
+        self._delivered   = 0 # payloads passed to controllers
+        self._discarded   = 0 # payloads reduced away in windowed mode
+        self._timeout_ms  = _cfg.get('controller_timeout_ms', 50) # default per controller
+        self._skip_stale  = _cfg.get('skip_stale', False)
+        self._dispatch_queues = {} # controller to its queue of payloads
+        self._dispatch_tasks  = []
+        self._latency     = {} # controller to TimingStats
+        self._timeouts    = {} # controller to count of timeouts
+        self._skipped     = {} # controller to count of stale payloads skipped
+        self._aging       = PriorityAging(_cfg)
+        if self._windowed:
+            self._log.info('ready: windowed arbitration at {:d}Hz, top {:d}.'.format(int(_tick_hz), self._top_k))
+        else:
+            self._log.info('ready.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def set_log_level(self, level):
@@ -51,6 +111,9 @@ class Arbitrator(Component):
         from the MessageBus its callback(Payload) method is called.
         '''
         self._controllers.append(controller)
+        self._latency[controller]  = TimingStats('{} latency'.format(controller.name))
+        self._timeouts[controller] = 0
+        self._skipped[controller]  = 0
         self._log.info('registered controller: \'{}\''.format(controller.name))
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -62,6 +125,54 @@ class Arbitrator(Component):
         '''
         return self._count
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def windowed(self):
+        return self._windowed
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def use_clock(self, clock):
+        '''
+        Has the ClockPublisher drive windowed arbitration as its arbitration
+        phase, rather than the arbitrator's own tick loop. This has no effect
+        in immediate mode.
+
+        :param clock:  the ClockPublisher
+        '''
+        if not self._windowed:
+            self._log.warning('not windowed: arbitration not driven by clock.')
+            return
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            self._tick_task = None
+        self._clocked = True
+        clock.add_phase('arbitrate', self.tick, clock.PHASE_ARBITRATE)
+        self._log.info('windowed arbitration driven by clock.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self):
+        '''
+        Prints the arbitration statistics.
+        '''
+        if self._windowed:
+            self._log.info('arbitrator:' + Fore.YELLOW + '\t{} payloads; {} ticks; {} delivered; {} discarded.'.format(
+                    self._count, self._tick_count, self._delivered, self._discarded))
+        else:
+            self._log.info('arbitrator:' + Fore.YELLOW + '\t{} payloads.'.format(self._count))
+        for _controller in self._controllers:
+            self._log.info(Fore.YELLOW + '\t{}; {} timeouts; {} stale skipped.'.format(
+                    self._latency[_controller], self._timeouts[_controller], self._skipped[_controller]))
+        self._aging.print_statistics(self._log, 'arbitrator')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def aging(self):
+        '''
+        Returns the PriorityAging holding the per-event wait-time and
+        starvation statistics.
+        '''
+        return self._aging
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     async def arbitrate(self, payload):
         '''
@@ -70,16 +181,23 @@ class Arbitrator(Component):
 
         If the Event Group is CLOCK this will trigger the callback without
         arbitration.
+
+        In windowed mode the payload is simply added to the queue, to be
+        arbitrated upon the next control tick.
         '''
-        self._log.debug('arbitrating payload: {}'.format(payload.event.name))
+        self._log.debug('arbitrating payload: %s', payload.event.name)
         if self._suppressed:
-            self._queue.clear()
+            self._clear_queue()
         else:
             _start_time = dt.datetime.now()
             self._count = next(self._counter)
 #           self._log.debug('[{:03d}] putting payload: \'{}\' onto queue…'.format(self._count, payload.event.name))
-            if len(self._controllers) > 0:
-                await self._queue.put((payload.priority, payload))
+            if len(self._controllers) > 0 and self._windowed:
+                if self._tick_task is None and not self._clocked:
+                    self._tick_task = asyncio.create_task(self._tick_loop(), name=Arbitrator._TICK_LOOP)
+                self._queue.put_nowait((payload.priority, next(self._sequence), payload, time.perf_counter()))
+            elif len(self._controllers) > 0:
+                await self._queue.put((payload.priority, next(self._sequence), payload, time.perf_counter()))
 #               self._log.debug('payload \'{}\' put onto queue: {} element{}.'.format(
 #                       payload.event.name, self._queue.qsize(), '' if self._queue.qsize() == 1 else 's'))
                 await self.trigger_callback()
@@ -93,8 +211,135 @@ class Arbitrator(Component):
     async def trigger_callback(self):
         self._log.debug('trigger callback.')
         _tuple = await self._queue.get()
-        _payload = _tuple[1]
-        for controller in self._controllers:
-            controller.callback(_payload)
+        _payload = _tuple[2]
+        self._aging.served(_payload.event, _tuple[3])
+        self._delivered += 1
+        self._dispatch(_payload)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _tick_loop(self):
+        '''
+        The windowed mode loop, calling tick() upon each control tick. The
+        ticks are paced by an AsyncRate so that the time taken by tick() does
+        not accumulate as drift. The task name's '__' prefix protects it from
+        the message bus' clear_tasks().
+        '''
+        self._log.info('starting tick loop…')
+        self._rate.reset()
+        while self.enabled:
+            await self._rate.wait()
+            self.tick()
+        self._rate.print_statistics()
+        self._log.info('tick loop complete.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def tick(self, count=None):
+        '''
+        Reduces the payloads collected during the window to the top k by
+        (effective) priority and passes them to the controllers. The events
+        of the payloads discarded are noted as waiting.
+
+        :param count:  the clock's tick count, if driven by the clock (unused)
+        '''
+        self._tick_count += 1
+        if self._queue.empty() or self._suppressed:
+            return
+        _entries = []
+        while not self._queue.empty():
+            _entries.append(self._queue.get_nowait())
+        if self._aging.enabled:
+            _now = time.perf_counter()
+            _entries.sort(key=lambda e: ( self._aging.effective_priority(e[2].event, _now), e[1] ))
+        _selected = _entries[:self._top_k]
+        _served = set()
+        for _entry in _selected:
+            self._aging.served(_entry[2].event, _entry[3])
+            _served.add(_entry[2].event)
+        for _entry in _entries[self._top_k:]:
+            if _entry[2].event not in _served:
+                self._aging.waiting(_entry[2].event, _entry[3])
+        self._discarded += len(_entries) - len(_selected)
+        self._delivered += len(_selected)
+        for _entry in _selected:
+            self._dispatch(_entry[2])
+
+    # dispatch ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    def _dispatch(self, payload):
+        '''
+        Queues the payload for each controller's dispatch task without waiting,
+        starting the tasks upon first use. If skipping stale payloads, any
+        payload a controller has yet to receive is discarded first.
+        '''
+        for _controller in self._controllers:
+            _queue = self._dispatch_queues.get(_controller)
+            if _queue is None:
+                _queue = self._dispatch_queues[_controller] = asyncio.Queue()
+                self._dispatch_tasks.append(asyncio.create_task(self._dispatch_loop(_controller),
+                        name='__arbitrator-dispatch-{}'.format(_controller.name)))
+            if self._skip_stale:
+                while not _queue.empty():
+                    _queue.get_nowait()
+                    _queue.task_done()
+                    self._skipped[_controller] += 1
+            _queue.put_nowait(payload)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _dispatch_loop(self, controller):
+        '''
+        Passes each queued payload to the controller's callback, awaiting it
+        (subject to the controller's timeout) if a coroutine, and recording
+        its latency. Exceptions are logged and the loop continues.
+        '''
+        _queue   = self._dispatch_queues[controller]
+        _latency = self._latency[controller]
+        _timeout_ms = controller.callback_timeout_ms
+        _timeout_sec = ( _timeout_ms if _timeout_ms is not None else self._timeout_ms ) / 1000.0
+        while True:
+            _payload = await _queue.get()
+            _start_time = dt.datetime.now()
+            try:
+                _result = controller.callback(_payload)
+                if asyncio.iscoroutine(_result):
+                    await asyncio.wait_for(_result, timeout=_timeout_sec)
+            except asyncio.TimeoutError:
+                self._timeouts[controller] += 1
+                self._log.warning('controller \'%s\' timed out on payload: %s', controller.name, _payload.event.name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._log.error('{} thrown by controller \'{}\': {}'.format(type(e), controller.name, e))
+            finally:
+                _latency.record((dt.datetime.now() - _start_time).total_seconds() * 1000.0)
+                _queue.task_done()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _clear_queue(self):
+        '''
+        Clears the priority queue without waiting (asyncio.PriorityQueue has
+        no clear() method), returning the number of payloads discarded.
+        '''
+        _count = 0
+        while not self._queue.empty():
+            try:
+                self._queue.get_nowait()
+                _count += 1
+            except QueueEmpty:
+                break
+        return _count
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def disable(self):
+        '''
+        Disables the arbitrator, cancelling the tick loop and dispatch tasks.
+        '''
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            self._tick_task = None
+        for _task in self._dispatch_tasks:
+            _task.cancel()
+        self._dispatch_tasks.clear()
+        self._dispatch_queues.clear()
+        Component.disable(self)
 
 # EOF
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+
+import itertools
+import asyncio
+import time
+from colorama import init, Fore, Style
+init()
+
+from core.logger import Logger, Level
+from core.config_section import ConfigSection
+from core.publisher import Publisher
+from core.rate import AsyncRate
+from core.timing_stats import TimingStats
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ClockPublisher(Publisher):
+    '''
+    The optional system clock, publishing a regular tick (typically 50ms/20Hz)
+    scheduled by a drift-free AsyncRate, so that components may operate in
+    one aligned pass per tick rather than each in its own loop waking at an
+    arbitrary offset.
+
+    There are two ways to use the clock:
+
+    * as a phase within the tick: a callback registered with add_phase() is
+      called upon each tick with the tick count, in order of its phase (e.g.,
+      PHASE_SENSE, then PHASE_ARBITRATE, then PHASE_ACT). The callback may
+      be a coroutine, in which case it is awaited before the next phase.
+
+    * as a subscriber to ticks: a component with its own loop may replace
+      its sleep with 'await clock.wait_for_tick()', waking just after each
+      tick's phases have completed.
+
+    Ticks are not published as messages on the message bus, since the bus'
+    publish delay and message expiry are incompatible with a 50ms period,
+    and ticks would otherwise reset the idle timer.
+
+    :param config:          the application configuration
+    :param message_bus:     the asynchronous message bus
+    :param message_factory: the factory for messages
+    :param level:           the optional log level
+    '''
+    _CLOCK_LOOP = '__clock-loop'
+
+    PHASE_SENSE     = 10
+    PHASE_ARBITRATE = 50
+    PHASE_ACT       = 90
+
+    def __init__(self, config, message_bus, message_factory, level=Level.INFO):
+        Publisher.__init__(self, 'clock', config, message_bus, message_factory, suppressed=False, level=level)
+        _cfg = ConfigSection.of(self._config, 'kros.publisher.clock')
+        _loop_freq_hz  = _cfg.loop_freq_hz
+        self._log.info('clock frequency: {:d}Hz'.format(_loop_freq_hz))
+        self._rate     = AsyncRate(_loop_freq_hz, name='clock', level=level)
+        self._counter  = itertools.count(1)
+        self._tick     = 0
+        self._phases   = [] # sorted list of (order, name, callback)
+        self._stats    = {} # phase name to TimingStats
+        self._tick_future = None
+        self._log.info('ready.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def tick(self):
+        '''
+        Returns the count of the most recent tick.
+        '''
+        return self._tick
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def period_sec(self):
+        return self._rate.period_sec
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def add_phase(self, name, callback, order=PHASE_ACT):
+        '''
+        Adds a callback to be called upon each tick with the tick count,
+        after any phases of a lower order. Phases of the same order are
+        called in the order they were added.
+
+        :param name:      the unique name of the phase
+        :param callback:  the function or coroutine function to call
+        :param order:     the order of the phase within the tick
+        '''
+        if name in self._stats:
+            raise ValueError('phase \'{}\' already added.'.format(name))
+        if not callable(callback):
+            raise TypeError('expected a callable callback, not: {}'.format(type(callback)))
+        self._phases.append((order, name, callback))
+        self._phases.sort(key=lambda p: p[0]) # stable for equal orders
+        self._stats[name] = TimingStats('{} phase'.format(name))
+        self._log.info('added phase \'{}\' at order {:d}.'.format(name, order))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def remove_phase(self, name):
+        '''
+        Removes the named phase, returning True if it existed.
+        '''
+        _count = len(self._phases)
+        self._phases = [ _phase for _phase in self._phases if _phase[1] != name ]
+        self._stats.pop(name, None)
+        return len(self._phases) < _count
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def wait_for_tick(self):
+        '''
+        Waits until the phases of the next tick have completed, returning
+        the tick count. Returns None, immediately if the clock is not enabled,
+        or upon the clock being disabled while waiting.
+        '''
+        if not self.enabled:
+            return None
+        if self._tick_future is None:
+            self._tick_future = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(self._tick_future)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def enable(self):
+        if not self.enabled:
+            Publisher.enable(self)
+            if self._message_bus.get_task_by_name(ClockPublisher._CLOCK_LOOP):
+                raise Exception('already enabled.')
+            else:
+                self._log.info('creating task for clock loop…')
+                self._message_bus.loop.create_task(self._clock_loop(lambda: self.enabled), name=ClockPublisher._CLOCK_LOOP)
+                self._log.info('enabled.')
+        else:
+            self._log.warning('failed to enable clock loop.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _clock_loop(self, f_is_enabled):
+        '''
+        Upon each tick call each phase in order, then wake any subscribers
+        waiting for the tick. The phases are skipped while suppressed.
+        '''
+        self._log.info('starting clock loop with {:d} phase{}.'.format(len(self._phases), '' if len(self._phases) == 1 else 's'))
+        self._rate.reset()
+        while f_is_enabled():
+            self._tick = next(self._counter)
+            if not self.suppressed:
+                for _order, _name, _callback in self._phases:
+                    _start_time = time.perf_counter()
+                    try:
+                        _result = _callback(self._tick)
+                        if asyncio.iscoroutine(_result):
+                            await _result
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        self._log.error('{} thrown by phase \'{}\' on tick {:d}: {}'.format(type(e), _name, self._tick, e))
+                    finally:
+                        _stats = self._stats.get(_name)
+                        if _stats is not None:
+                            _stats.record(( time.perf_counter() - _start_time ) * 1000.0)
+            if self._tick_future is not None:
+                self._tick_future.set_result(self._tick)
+                self._tick_future = None
+            await self._rate.wait()
+        self.print_statistics()
+        self._log.info('clock loop complete.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self):
+        '''
+        Prints the rate statistics and the execution time of each phase.
+        '''
+        self._log.info('clock:' + Fore.YELLOW + '\t{:d} ticks; {:d} phase{}.'.format(
+                self._tick, len(self._phases), '' if len(self._phases) == 1 else 's'))
+        self._rate.print_statistics()
+        for _order, _name, _callback in self._phases:
+            self._log.info(Fore.YELLOW + '\t[{:d}] {}'.format(_order, self._stats[_name]))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def disable(self):
+        '''
+        Disable the clock, releasing any subscribers waiting for a tick
+        with a tick count of None.
+        '''
+        Publisher.disable(self)
+        if self._tick_future is not None and not self._tick_future.done():
+            self._tick_future.set_result(None)
+        self._tick_future = None
+
+#EOF
@@ -7,9 +7,12 @@
 #
 # author:   Murray Altheim
 # created:  2020-04-15
-# modified: 2024-06-19
+# modified: 2026-10-18
 
+import os
 import pprint
+import pickle
+import hashlib
 from colorama import init, Fore, Style
 init()
 try:
@@ -19,6 +22,9 @@ except ImportError:
 
 from core.logger import Level, Logger
 
+# the C (libyaml) loader if available, otherwise the pure-Python loader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class ConfigLoader(object):
     '''
@@ -29,16 +35,31 @@ class ConfigLoader(object):
         self._log.info('ready.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def configure(self, filename='config.yaml'):
+    def configure(self, filename='config.yaml', use_cache=True):
         '''
         Read and return configuration from the specified YAML file.
 
+        The parsed configuration is cached as a pickle in the __pycache__
+        directory alongside the YAML file, keyed by the file's modification
+        time and a hash of its contents, and is used in place of parsing
+        the file if the file is unchanged. If the cache cannot be read or
+        written the file is simply parsed. A new copy of the configuration
+        is returned by each call.
+
         Pretty-prints the configuration object if the log level is set to DEBUG.
 
-        :param filename:  the optional name of the YAML file to load. Default: config.yaml
+        :param filename:   the optional name of the YAML file to load. Default: config.yaml
+        :param use_cache:  if False always parse the YAML file and don't write the cache
         '''
         self._log.info('reading from YAML configuration file {}…'.format(filename))
-        _config = yaml.safe_load(open(filename, 'r'))
+        _config = self._read_cache(filename) if use_cache else None
+        if _config is None:
+            with open(filename, 'rb') as _file:
+                _stat = os.fstat(_file.fileno())
+                _data = _file.read()
+            _config = yaml.load(_data, Loader=_YAML_LOADER)
+            if use_cache:
+                self._write_cache(filename, _stat, _data, _config)
         if self._log.level == Level.DEBUG:
             self._log.debug('YAML configuration as read:')
             print(Fore.BLUE)
@@ -48,6 +69,58 @@ class ConfigLoader(object):
         self._log.info('configuration read.')
         return _config
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_cache_path(self, filename):
+        _directory, _basename = os.path.split(os.path.abspath(filename))
+        return os.path.join(_directory, '__pycache__', _basename + '.pickle')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _read_cache(self, filename):
+        '''
+        Returns the cached configuration for the YAML file, or None if there
+        is no valid cache. If the file's modification time and size match
+        the cache it is trusted without reading the file, otherwise the
+        file's hash is compared, so that touching the file doesn't
+        invalidate the cache.
+        '''
+        try:
+            _stat = os.stat(filename)
+            with open(self._get_cache_path(filename), 'rb') as _file:
+                _mtime_ns, _size, _digest, _config = pickle.load(_file)
+            if _mtime_ns == _stat.st_mtime_ns and _size == _stat.st_size:
+                self._log.info('configuration read from cache.')
+                return _config
+            with open(filename, 'rb') as _file:
+                _stat = os.fstat(_file.fileno())
+                _data = _file.read()
+            if hashlib.sha1(_data).hexdigest() == _digest:
+                self._write_cache(filename, _stat, _data, _config)
+                self._log.info('configuration read from cache (file touched but unchanged).')
+                return _config
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self._log.warning('ignoring configuration cache: {}'.format(e))
+        return None
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _write_cache(self, filename, stat, data, config):
+        '''
+        Writes the configuration parsed from the data of the YAML file to the
+        cache, via a temporary file so that a partial cache is never read.
+        The file's status is that taken as its data was read.
+        '''
+        _cache_path = self._get_cache_path(filename)
+        _tmp_path = _cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(_cache_path), exist_ok=True)
+            with open(_tmp_path, 'wb') as _file:
+                pickle.dump(( stat.st_mtime_ns, stat.st_size, hashlib.sha1(data).hexdigest(), config ),
+                        _file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(_tmp_path, _cache_path)
+        except OSError as e:
+            self._log.debug('unable to write configuration cache: %s', e)
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def export(self, config, filename='.config.yaml', comments=None):
         '''
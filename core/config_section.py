@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# A frozen, attribute-accessible view of a section of the configuration.
+#
+
+from collections.abc import Mapping
+
+from core.config_error import ConfigurationError
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ConfigSection(Mapping):
+    '''
+    An immutable copy of a section (a dict) of the configuration, whose
+    values may be read either as a dict, e.g., section.get('loop_freq_hz'),
+    or as attributes, e.g., section.loop_freq_hz. Nested sections are
+    themselves ConfigSections and lists become tuples, all converted once
+    upon construction, so that reading a value is a single lookup.
+
+    A missing key read as an attribute raises an AttributeError, whereas
+    get() returns None, as for a dict.
+
+    :param section:  the dict to copy
+    '''
+    __slots__ = ( '_dict', )
+
+    def __init__(self, section):
+        if not isinstance(section, Mapping):
+            raise TypeError('expected a dict, not: {}'.format(type(section)))
+        object.__setattr__(self, '_dict', { _key: ConfigSection._freeze(_value) for _key, _value in section.items() })
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def _freeze(value):
+        if isinstance(value, ConfigSection):
+            return value
+        elif isinstance(value, Mapping):
+            return ConfigSection(value)
+        elif isinstance(value, (list, tuple)):
+            return tuple(ConfigSection._freeze(_item) for _item in value)
+        return value
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def of(config, path):
+        '''
+        Returns the section of the configuration at the dotted path, e.g.,
+        'kros.publisher.clock', as a ConfigSection, raising a
+        ConfigurationError if any part of the path is missing.
+
+        :param config:  the application configuration (a dict or ConfigSection)
+        :param path:    the dotted path of the section
+        '''
+        _section = config
+        for _key in path.split('.'):
+            _value = _section.get(_key) if isinstance(_section, Mapping) else None
+            if not isinstance(_value, Mapping):
+                raise ConfigurationError('no configuration section \'{}\' found in \'{}\'.'.format(_key, path))
+            _section = _value
+        return _section if isinstance(_section, ConfigSection) else ConfigSection(_section)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def __getattr__(self, name):
+        if name == '_dict': # not yet set, e.g., when copied
+            raise AttributeError(name)
+        try:
+            return self._dict[name]
+        except KeyError:
+            raise AttributeError('no configuration value \'{}\'.'.format(name)) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError('configuration section is read-only.')
+
+    def __delattr__(self, name):
+        raise AttributeError('configuration section is read-only.')
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __iter__(self):
+        return iter(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def __reduce__(self):
+        return ( ConfigSection, ( self._dict, ) )
+
+    def __repr__(self):
+        return 'ConfigSection({})'.format(self._dict)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def to_dict(self):
+        '''
+        Returns a mutable copy of the section as nested dicts and lists.
+        '''
+        return { _key: ConfigSection._thaw(_value) for _key, _value in self._dict.items() }
+
+    @staticmethod
+    def _thaw(value):
+        if isinstance(value, ConfigSection):
+            return value.to_dict()
+        elif isinstance(value, tuple):
+            return [ ConfigSection._thaw(_item) for _item in value ]
+        return value
+
+#EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2020-02-21
-# modified: 2024-10-31
+# modified: 2026-10-18
 #
 
 import time, itertools
@@ -24,8 +24,17 @@ class Controller(Component):
     '''
     A default controller class that receives callbacks (to the 'callback'
     method) when Events appear on the MessageBus' Arbitratror.
+
+    The callback may be overridden as a coroutine, e.g., for a controller
+    communicating with hardware, in which case the Arbitrator awaits it
+    subject to a timeout.
+
+    :param message_bus:  the message bus
+    :param level:        the log level
+    :param timeout_ms:   the optional callback timeout, otherwise the
+                         Arbitrator's default is used
     '''
-    def __init__(self, message_bus, level):
+    def __init__(self, message_bus, level, timeout_ms=None):
         self._log = Logger('controller', level)
         Component.__init__(self, self._log, suppressed=False, enabled=True)
         self._message_bus          = message_bus
@@ -34,6 +43,7 @@ class Controller(Component):
         self._event_count          = next(self._event_counter)
         self._state_change_counter = itertools.count()
         self._state_change_count   = next(self._state_change_counter)
+        self._timeout_ms           = timeout_ms
         self._message_bus.register_controller(self)
         self._log.info('ready.')
 
@@ -46,6 +56,15 @@ class Controller(Component):
     def name(self):
         return 'def-controller'
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def callback_timeout_ms(self):
+        '''
+        Returns the timeout in milliseconds for a coroutine callback, or None
+        if the Arbitrator's default applies.
+        '''
+        return self._timeout_ms
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def get_current_message(self):
         return self._current_message
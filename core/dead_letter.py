@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# A bounded store of messages retired without being fully handled, used to
+# find bottlenecks under load without resorting to DEBUG logging.
+#
+
+from collections import deque
+from datetime import datetime as dt
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class DeadLetter(object):
+    '''
+    A record of a dead message, retaining only what is needed for diagnosis
+    rather than the message itself.
+
+    :param message:  the retired message
+    :param reason:   the reason for retirement
+    '''
+    def __init__(self, message, reason):
+        self._name           = message.name
+        self._event          = message.event
+        self._value          = message.value
+        self._age            = message.age
+        self._sent           = message.sent
+        self._reason         = reason
+        self._unacknowledged = message.unacknowledged_names
+        self._timestamp      = dt.now()
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def event(self):
+        return self._event
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def age(self):
+        '''
+        The age of the message in milliseconds when retired.
+        '''
+        return self._age
+
+    @property
+    def sent(self):
+        return self._sent
+
+    @property
+    def reason(self):
+        return self._reason
+
+    @property
+    def unacknowledged(self):
+        '''
+        The names of the subscribers that never acknowledged the message.
+        '''
+        return self._unacknowledged
+
+    @property
+    def timestamp(self):
+        return self._timestamp
+
+    def __str__(self):
+        return '{}: event: {}; value: {}; age: {:d}ms; sent: {}; reason: {}; unacknowledged by: {}'.format(
+                self._name, self._event.name, self._value, self._age, self._sent, self._reason,
+                ', '.join(self._unacknowledged) if self._unacknowledged else '[none]')
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class DeadLetterStore(object):
+    '''
+    A ring buffer of the most recent DeadLetters, along with per-event and
+    per-subscriber counters that are not bounded by the buffer's capacity.
+
+    :param capacity:  the maximum number of dead letters retained
+    '''
+    def __init__(self, capacity=100):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError('expected capacity as a positive int, not: {}'.format(capacity))
+        self._letters           = deque(maxlen=capacity)
+        self._event_counts      = {}
+        self._subscriber_counts = {}
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def add(self, message, reason):
+        '''
+        Records the message, displacing the oldest record if full.
+        '''
+        _letter = DeadLetter(message, reason)
+        self._letters.append(_letter)
+        self._event_counts[_letter.event] = self._event_counts.get(_letter.event, 0) + 1
+        for _name in _letter.unacknowledged:
+            self._subscriber_counts[_name] = self._subscriber_counts.get(_name, 0) + 1
+        return _letter
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def query(self, event=None, subscriber=None, reason=None, limit=None):
+        '''
+        Returns a list of the retained dead letters, most recent first,
+        optionally filtered.
+
+        :param event:       only those with this Event
+        :param subscriber:  only those never acknowledged by the named subscriber
+        :param reason:      only those retired for this reason
+        :param limit:       the maximum number returned
+        '''
+        _result = []
+        for _letter in reversed(self._letters):
+            if event is not None and _letter.event is not event:
+                continue
+            if subscriber is not None and subscriber not in _letter.unacknowledged:
+                continue
+            if reason is not None and _letter.reason != reason:
+                continue
+            _result.append(_letter)
+            if limit is not None and len(_result) >= limit:
+                break
+        return _result
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def event_counts(self):
+        '''
+        Returns a copy of the dict of total dead letter counts by Event.
+        '''
+        return dict(self._event_counts)
+
+    @property
+    def subscriber_counts(self):
+        '''
+        Returns a copy of the dict of total counts of dead letters never
+        acknowledged by each subscriber, by subscriber name.
+        '''
+        return dict(self._subscriber_counts)
+
+    @property
+    def capacity(self):
+        return self._letters.maxlen
+
+    def clear(self):
+        '''
+        Clears the retained dead letters and all counters.
+        '''
+        self._letters.clear()
+        self._event_counts.clear()
+        self._subscriber_counts.clear()
+
+    def __len__(self):
+        return len(self._letters)
+
+#EOF
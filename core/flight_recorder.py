@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# An in-memory ring of recent log records at all levels, dumped to a file on
+# error, on shutdown or on demand.
+#
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from datetime import datetime as dt
+
+from core.log_formatter import strip_ansi
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class FlightRecorder(object):
+    '''
+    A fixed-size ring of the most recent log records of all Loggers at all
+    levels, regardless of the level of each Logger, so that the DEBUG
+    history leading up to a failure is available without running at DEBUG
+    level. Only the raw message and its arguments are captured, as a tuple
+    appended to a deque; they are formatted only if the ring is dumped.
+
+    Since arguments are captured by reference, a mutable argument changed
+    after it was logged will be dumped in its changed state.
+
+    :param capacity:   the number of records retained
+    :param directory:  the directory to which dumps are written
+    '''
+    def __init__(self, capacity=2000, directory='./log'):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError('expected capacity as a positive int, not: {}'.format(capacity))
+        self._ring      = deque(maxlen=capacity)
+        self._directory = directory
+        self._lock      = threading.Lock() # serialises dumps
+        self.append     = self._ring.append # bound, to keep the cost of recording to a minimum
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def capacity(self):
+        return self._ring.maxlen
+
+    @property
+    def size(self):
+        return len(self._ring)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def resize(self, capacity):
+        '''
+        Changes the capacity of the ring, retaining the most recent records.
+
+        :param capacity:  the number of records retained
+        '''
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError('expected capacity as a positive int, not: {}'.format(capacity))
+        self._ring  = deque(self._ring, maxlen=capacity)
+        self.append = self._ring.append
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def record(self, name, levelno, message, args):
+        '''
+        Records a log message. Loggers call append() directly with the same
+        tuple, to avoid the cost of this call.
+
+        :param name:     the name of the Logger
+        :param levelno:  the numeric level, as in the logging module
+        :param message:  the message, possibly containing %-style placeholders
+        :param args:     the tuple of arguments for the message
+        '''
+        self.append(( time.time(), name, levelno, message, args ))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def lines(self):
+        '''
+        Returns the recorded records formatted as plain text lines, oldest
+        first.
+        '''
+        _lines = []
+        for _time, _name, _levelno, _message, _args in list(self._ring):
+            if _args:
+                try:
+                    _message = _message % _args
+                except Exception as e:
+                    _message = '{} (args: {}; {})'.format(_message, _args, e)
+            _lines.append('{}.{:03d}Z\t|{}|{:<8}|{}'.format(
+                    time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(_time)), int(_time % 1 * 1000),
+                    _name, logging.getLevelName(_levelno), strip_ansi(str(_message))))
+        return _lines
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def dump(self, reason=None):
+        '''
+        Writes the recorded records to a new timestamped file in the dump
+        directory, returning its path, or None if there was nothing to dump.
+        The ring is not cleared.
+
+        :param reason:  the optional reason for the dump, written as its first line
+        '''
+        with self._lock:
+            _lines = self.lines()
+            if not _lines:
+                return None
+            os.makedirs(self._directory, exist_ok=True)
+            _ts = dt.utcnow().isoformat().replace(':','_').replace('-','_').replace('.','_')
+            _path = os.path.join(self._directory, 'flight-{}.log'.format(_ts))
+            with open(_path, 'w', encoding='utf-8') as _file:
+                _file.write('# flight recorder: {:d} of {:d} records; reason: {}\n'.format(
+                        len(_lines), self._ring.maxlen, reason if reason else 'on demand'))
+                _file.write('\n'.join(_lines))
+                _file.write('\n')
+            return _path
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def clear(self):
+        self._ring.clear()
+
+#EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2020-01-19
-# modified: 2021-06-26
+# modified: 2026-10-18
 #
 
 from enum import Enum
@@ -58,7 +58,7 @@ class FiniteStateMachine(object):
         exceptions or logging warnings if the transition is either invalid or
         ill-advised (resp.).
         '''
-        self._log.debug('transition in {} from {} to {}.'.format(self._task_name, self._state.name, next_state.name))
+        self._log.debug('transition in %s from %s to %s.', self._task_name, self._state.name, next_state.name)
         # transition table:
         if self._state is State.NONE:
             if next_state is State.INITIAL:
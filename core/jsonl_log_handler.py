@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# A structured log sink, writing one compact JSON object per line (JSONL),
+# with rotation by size and background compression of rotated segments.
+#
+
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import queue
+import shutil
+import threading
+import logging
+
+from core.log_formatter import strip_ansi
+
+# the name of the optional LogRecord attribute holding a dict of extra fields
+FIELDS_ATTRIBUTE = 'kros_fields'
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class JsonlFormatter(logging.Formatter):
+    '''
+    Formats a record as a single-line JSON object whose keys are always in
+    the same order, beginning with the timestamp and logger name so that
+    a reader can filter on them without parsing the whole line:
+
+        {"t":<ns since epoch>,"name":"<logger>","level":"<level>","msg":"<message>"[,"fields":{…}]}
+
+    The message is plain text: any ANSI escape codes are stripped. Optional
+    fields are taken from a 'kros_fields' dict passed with the record as an
+    'extra', e.g.,
+
+        log.info('obstacle', extra={ 'kros_fields': { 'range_mm': 220 } })
+    '''
+    def format(self, record):
+        _message = strip_ansi(record.getMessage())
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            _message = _message + '\n' + record.exc_text
+        _line = '{{"t":{:d},"name":{},"level":"{}","msg":{}'.format(
+                int(record.created * 1_000_000_000), json.dumps(record.name), record.levelname, json.dumps(_message))
+        _fields = getattr(record, FIELDS_ATTRIBUTE, None)
+        if _fields:
+            _line += ',"fields":' + json.dumps(_fields, separators=(',',':'), default=str)
+        return _line + '}'
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class SegmentCompressor(object):
+    '''
+    Compresses rotated log segments with gzip on a daemon thread, so that
+    the thread writing the log is not held up. Each segment is written to
+    a temporary file, renamed to '<segment>.gz' once complete, and only
+    then is the uncompressed segment deleted.
+
+    As this runs beneath the logging of the named logger, a failure is
+    reported directly to stderr rather than logged, which could recurse.
+
+    :param name:  the name of the logger whose segments are compressed
+    '''
+    def __init__(self, name):
+        self._name   = name
+        self._queue  = queue.Queue()
+        self._thread = None
+        self._lock   = threading.Lock()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def submit(self, path):
+        '''
+        Queues the segment file for compression, starting the compressor
+        thread if necessary.
+
+        :param path:  the path of the uncompressed segment
+        '''
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='log-compressor', daemon=True)
+                self._thread.start()
+        self._queue.put(path)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def join(self):
+        '''
+        Waits until all queued segments have been compressed.
+        '''
+        self._queue.join()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _run(self):
+        while True:
+            _path = self._queue.get()
+            try:
+                _tmp_path = _path + '.gz.tmp'
+                with open(_path, 'rb') as _in, gzip.open(_tmp_path, 'wb') as _out:
+                    shutil.copyfileobj(_in, _out)
+                os.replace(_tmp_path, _path + '.gz')
+                os.remove(_path)
+            except Exception as e:
+                # leave the uncompressed segment in place
+                sys.stderr.write('{}: failed to compress log segment {}: {}\n'.format(self._name, _path, e))
+            finally:
+                self._queue.task_done()
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class JsonlRotatingFileHandler(logging.FileHandler):
+    '''
+    Writes records as JSONL to the named file. When the file exceeds the
+    maximum size it is closed and renamed as the next numbered segment,
+    e.g., 'kros-<timestamp>.001.jsonl', and compressed to '.jsonl.gz' in
+    the background, and a new file is begun. Only the most recent segments
+    are retained. Segment numbers are padded to three digits but are not
+    limited to them, i.e., the thousandth segment is '.1000.jsonl'.
+
+    Unlike RotatingFileHandler, the rollover check uses a running count of
+    the bytes written rather than formatting each record twice.
+
+    :param filename:      the path of the current log file
+    :param max_bytes:     the approximate size at which to rotate (0 to never rotate)
+    :param backup_count:  the number of rotated segments to retain (0 to retain all)
+    :param compress:      if True gzip rotated segments in the background
+    :param name:          the name of the logger, used to report compression failures
+    '''
+    def __init__(self, filename, max_bytes=1048576, backup_count=10, compress=True, name='jsonl'):
+        logging.FileHandler.__init__(self, filename, mode='w', encoding='utf-8', delay=False)
+        self.setFormatter(JsonlFormatter())
+        self._max_bytes    = max_bytes
+        self._backup_count = backup_count
+        self._compressor   = SegmentCompressor(name) if compress else None
+        self._root, self._ext = os.path.splitext(self.baseFilename)
+        self._segment_re   = re.compile(re.escape(self._root) + r'\.(\d+)' + re.escape(self._ext) + r'(\.gz)?$')
+        self._terminator_bytes = len(self.terminator.encode(self.encoding))
+        self._segment      = 0
+        self._size         = 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def segments(self):
+        '''
+        Returns a list of ( number, path ) for the rotated segments of this
+        log, compressed or not, sorted by segment number, i.e., oldest first.
+        '''
+        _segments = []
+        for _path in glob.glob('{}.*{}*'.format(glob.escape(self._root), self._ext)):
+            _match = self._segment_re.match(_path)
+            if _match:
+                _segments.append(( int(_match.group(1)), _path ))
+        return sorted(_segments)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def emit(self, record):
+        try:
+            _line = self.format(record)
+            _bytes = ( len(_line) if _line.isascii() else len(_line.encode(self.encoding)) ) + self._terminator_bytes
+            if self._max_bytes > 0 and self._size + _bytes >= self._max_bytes and self._size > 0:
+                self.do_rollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(_line + self.terminator)
+            self.flush()
+            self._size += _bytes
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def do_rollover(self):
+        '''
+        Closes the current file, renames it as the next segment, queues it
+        for compression, prunes old segments and opens a new file.
+        '''
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self._segment += 1
+        _segment_path = '{}.{:03d}{}'.format(self._root, self._segment, self._ext) # at least three digits
+        os.replace(self.baseFilename, _segment_path)
+        if self._compressor:
+            self._compressor.submit(_segment_path)
+        self._prune()
+        self.stream = self._open()
+        self._size = 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _prune(self):
+        '''
+        Deletes the oldest compressed segments beyond the backup count.
+        Segments still awaiting compression are left for a later prune.
+        '''
+        if self._backup_count <= 0:
+            return
+        _oldest = self._segment - self._backup_count
+        for _number, _path in self.segments():
+            if _number > _oldest:
+                break
+            if _path.endswith('.gz'):
+                os.remove(_path)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def close(self):
+        '''
+        Closes the file, waiting for any compression in progress, then
+        prunes any segments that were awaiting compression.
+        '''
+        logging.FileHandler.close(self)
+        if self._compressor:
+            self._compressor.join()
+            self._prune()
+
+#EOF
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Reads JSONL logs as written by the JsonlRotatingFileHandler, including its
+# compressed segments, filtering by logger name and time range.
+#
+# usage:  python3 -m core.jsonl_log_reader [-n NAME]… [--start NS] [--end NS] FILE…
+#
+
+import sys
+import gzip
+import json
+import argparse
+from datetime import datetime as dt
+
+_T_PREFIX = '{"t":'
+_NAME_KEY = ',"name":'
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class JsonlLogReader(object):
+    '''
+    Iterates over the records of one or more JSONL log files (which may be
+    gzipped segments), yielding each as a dict of 't', 'name', 'level',
+    'msg' and optionally 'fields'.
+
+    As the writer always begins a line with its timestamp and logger name,
+    lines are filtered on those by slicing the raw line, and only lines
+    that pass are parsed as JSON. Lines that are not in that form (e.g.,
+    written by some other tool) are parsed and filtered normally.
+
+    :param paths:     the log files, read in the order provided
+    :param names:     the optional collection of logger names to include
+    :param start_ns:  the optional earliest timestamp (ns since epoch) to include
+    :param end_ns:    the optional latest timestamp (ns since epoch) to include
+    '''
+    def __init__(self, paths, names=None, start_ns=None, end_ns=None):
+        self._paths    = list(paths)
+        self._names    = set(names) if names else None
+        self._start_ns = start_ns
+        self._end_ns   = end_ns
+        # the encoded name fragments as they appear in a line
+        self._name_keys = { _NAME_KEY + json.dumps(_name) + ',' for _name in self._names } if self._names else None
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def __iter__(self):
+        for _path in self._paths:
+            yield from self._read(_path)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _read(self, path):
+        _open = gzip.open if path.endswith('.gz') else open
+        with _open(path, 'rt', encoding='utf-8') as _file:
+            for _line in _file:
+                if not _line.startswith(_T_PREFIX):
+                    _record = self._parse(_line)
+                    if _record is not None and self._accepts(_record):
+                        yield _record
+                    continue
+                _comma = _line.find(',', len(_T_PREFIX))
+                try:
+                    _t = int(_line[len(_T_PREFIX):_comma])
+                except ValueError:
+                    continue
+                if self._start_ns is not None and _t < self._start_ns:
+                    continue
+                if self._end_ns is not None and _t > self._end_ns:
+                    continue
+                if self._name_keys is not None and not any(_line.startswith(_key, _comma) for _key in self._name_keys):
+                    continue
+                _record = self._parse(_line)
+                if _record is not None:
+                    yield _record
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _parse(self, line):
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None # e.g., a line truncated by a crash
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _accepts(self, record):
+        _t = record.get('t', 0)
+        return ( self._start_ns is None or _t >= self._start_ns ) \
+                and ( self._end_ns is None or _t <= self._end_ns ) \
+                and ( self._names is None or record.get('name') in self._names )
+
+# ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+def main():
+    parser = argparse.ArgumentParser(description='Prints records from KROS JSONL logs, filtered by logger and time.')
+    parser.add_argument('files', nargs='+', help='log files or segments (.jsonl or .jsonl.gz), in order')
+    parser.add_argument('--name',  '-n', action='append', help='include the named logger (may be repeated)')
+    parser.add_argument('--start', '-s', type=int, help='earliest timestamp, in ns since the epoch')
+    parser.add_argument('--end',   '-e', type=int, help='latest timestamp, in ns since the epoch')
+    args = parser.parse_args()
+    for _record in JsonlLogReader(args.files, names=args.name, start_ns=args.start, end_ns=args.end):
+        _ts = dt.utcfromtimestamp(_record['t'] / 1e9).isoformat(timespec='microseconds')
+        print('{}Z  {:<14}  {:<8} {}{}'.format(_ts, _record['name'], _record['level'], _record['msg'],
+                '' if 'fields' not in _record else '  {}'.format(_record['fields'])))
+
+# ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+if __name__== "__main__":
+    main()
+
+#EOF
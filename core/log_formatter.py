@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Formatters for log records whose style is carried as structured metadata
+# rather than as ANSI escape codes embedded in the message.
+#
+
+import re
+import logging
+from colorama import init, Fore, Style
+init()
+
+# the name of the LogRecord attribute holding a (color, token, emphasis) tuple
+STYLE_ATTRIBUTE = 'kros_style'
+
+_ESC = '\x1b'
+_ANSI_ESCAPE = re.compile(r'(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]')
+
+# ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+def strip_ansi(text):
+    '''
+    Returns the text stripped of any ANSI escape sequences. The regular
+    expression is only applied if the text contains an escape character.
+    '''
+    return _ANSI_ESCAPE.sub('', text) if _ESC in text else text
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ConsoleFormatter(logging.Formatter):
+    '''
+    Formats a record for the console, preceding its message by the level
+    token in the color of its style metadata, if any.
+
+    The arguments are as for logging.Formatter.
+    '''
+    def formatMessage(self, record):
+        _style = getattr(record, STYLE_ATTRIBUTE, None)
+        if _style is not None:
+            _color, _token, _emphasis = _style
+            record.message = _color + _token + ' : ' + _emphasis + record.message + Style.RESET_ALL
+        return logging.Formatter.formatMessage(self, record)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PlainFormatter(logging.Formatter):
+    '''
+    Formats a record as plain text (e.g., for a log file), preceding its
+    message by the level token of its style metadata, if any, and ignoring
+    its color. Any ANSI escape codes embedded in the message itself by the
+    caller are stripped.
+
+    :param fmt:      the format string, as for logging.Formatter
+    :param datefmt:  the date format string, as for logging.Formatter
+    '''
+    def formatMessage(self, record):
+        _message = strip_ansi(record.message)
+        _style = getattr(record, STYLE_ATTRIBUTE, None)
+        if _style is not None:
+            _message = _style[1] + ' : ' + _message
+        record.message = _message
+        return logging.Formatter.formatMessage(self, record)
+
+#EOF
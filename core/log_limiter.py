@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Rate limiting and sampling of the records of a single Logger.
+#
+
+import time
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class LogLimiter(object):
+    '''
+    Decides whether each record of a Logger is written or suppressed, first
+    sampling 1-in-K records, then passing those sampled through a token
+    bucket that permits a sustained rate of N records per second with an
+    allowance for bursts. Suppressed records are counted, so that a summary
+    of them may be periodically written in their place.
+
+    Configuration, from the section dict provided:
+
+      max_per_sec:  the sustained number of records per second (default unlimited)
+      burst:        the number of records permitted at once (default max_per_sec)
+      sample:       write only 1-in-K records (default 1, i.e., all)
+
+    :param cfg:          the configuration section
+    :param summary_sec:  the minimum interval between summaries
+    '''
+    def __init__(self, cfg, summary_sec=10.0):
+        self._max_per_sec = cfg.get('max_per_sec')
+        self._sample      = cfg.get('sample', 1)
+        self._burst       = cfg.get('burst', self._max_per_sec)
+        if self._max_per_sec is not None and self._max_per_sec <= 0:
+            raise ValueError('expected a positive max_per_sec, not: {}'.format(self._max_per_sec))
+        if not isinstance(self._sample, int) or self._sample < 1:
+            raise ValueError('expected sample as a positive int, not: {}'.format(self._sample))
+        if self._burst is not None and self._burst < 1:
+            raise ValueError('expected a burst of at least 1, not: {}'.format(self._burst))
+        self._summary_sec  = summary_sec
+        self._tokens       = self._burst
+        self._last_time    = time.monotonic()
+        self._summary_time = self._last_time
+        self._count        = 0 # records seen, for sampling
+        self._suppressed   = 0 # records suppressed since the last summary
+        self._total_suppressed = 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def total_suppressed(self):
+        return self._total_suppressed
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def allow(self):
+        '''
+        Returns True if the next record should be written, otherwise counts
+        it as suppressed and returns False.
+        '''
+        self._count += 1
+        if self._sample > 1 and self._count % self._sample != 1:
+            self._suppressed += 1
+            self._total_suppressed += 1
+            return False
+        if self._max_per_sec is not None:
+            _now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + ( _now - self._last_time ) * self._max_per_sec)
+            self._last_time = _now
+            if self._tokens < 1.0:
+                self._suppressed += 1
+                self._total_suppressed += 1
+                return False
+            self._tokens -= 1.0
+        return True
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def summary(self, force=False):
+        '''
+        If records have been suppressed and the summary interval has passed
+        (or if forced), returns a summary message and resets the count of
+        suppressed records; otherwise returns None.
+
+        :param force:  if True ignore the summary interval
+        '''
+        if self._suppressed == 0:
+            return None
+        _now = time.monotonic()
+        _elapsed_sec = _now - self._summary_time
+        if not force and _elapsed_sec < self._summary_sec:
+            return None
+        _message = 'rate limit suppressed {:d} record{} in {:.1f}s.'.format(
+                self._suppressed, '' if self._suppressed == 1 else 's', _elapsed_sec)
+        self._suppressed = 0
+        self._summary_time = _now
+        return _message
+
+#EOF
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Support for the Logger's queue mode, where log records are enqueued without
+# blocking by the calling thread and written by a dedicated thread.
+#
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class DroppingQueueHandler(QueueHandler):
+    '''
+    Extends QueueHandler to enqueue records without blocking upon a bounded
+    queue, counting rather than raising upon records dropped when the queue
+    is full.
+
+    As with QueueHandler, a record's message is merged with its arguments
+    by the calling thread, since an argument may be a mutable object that
+    changes before the writer thread gets to it. This costs the calling
+    thread the '%' formatting of each record that passes the level check,
+    but the remainder of the formatting (the formatter, the traceback of
+    any exception) is still left to the writer thread. As this handler
+    replaces the logger's own handlers the record is modified in place
+    rather than copied.
+
+    :param log_queue:  the bounded queue
+    '''
+    def __init__(self, log_queue):
+        QueueHandler.__init__(self, log_queue)
+        self._dropped = 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def dropped(self):
+        return self._dropped
+
+    def prepare(self, record):
+        record.msg  = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class _TargetDispatcher(logging.Handler):
+    '''
+    Passes each dequeued record to the handlers of the logger that created
+    it, so that each logger retains its own handlers and formatters.
+    '''
+    def __init__(self, targets):
+        logging.Handler.__init__(self)
+        self._targets = targets
+
+    def handle(self, record):
+        for _handler in self._targets.get(record.name, ()):
+            if record.levelno >= _handler.level:
+                _handler.handle(record)
+
+    def emit(self, record):
+        pass
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class _Writer(QueueListener):
+    '''
+    Extends QueueListener so that stopping upon a full queue waits for room
+    for the sentinel rather than raising queue.Full.
+    '''
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class LogQueue(object):
+    '''
+    A bounded queue of log records and the dedicated writer thread that
+    formats and writes them. Attaching a logging.Logger moves its handlers
+    to the writer thread, replacing them with a non-blocking queue handler,
+    so that console and file I/O latency is not borne by the caller (e.g.,
+    the event loop). When the queue is full records are dropped and counted.
+
+    :param capacity:  the maximum number of records buffered
+    '''
+    def __init__(self, capacity=1000):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError('expected capacity as a positive int, not: {}'.format(capacity))
+        self._queue    = queue.Queue(maxsize=capacity)
+        self._targets  = {} # logger name to list of its handlers
+        self._handler  = DroppingQueueHandler(self._queue)
+        self._listener = _Writer(self._queue, _TargetDispatcher(self._targets))
+        self._listener.start()
+        self._stopped  = False
+        atexit.register(self.stop)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def attach(self, log):
+        '''
+        Moves the handlers of the logging.Logger to the writer thread. This
+        has no effect if the logger is already attached.
+
+        :param log:  the logging.Logger
+        '''
+        if self._stopped or self._handler in log.handlers:
+            return
+        _handlers = list(log.handlers)
+        for _handler in _handlers:
+            log.removeHandler(_handler)
+        self._targets[log.name] = self._targets.get(log.name, []) + _handlers
+        log.addHandler(self._handler)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def detach_all(self):
+        '''
+        Restores the handlers of all attached loggers, so that they once
+        again write synchronously.
+        '''
+        for _name, _handlers in self._targets.items():
+            _log = logging.getLogger(_name)
+            _log.removeHandler(self._handler)
+            for _handler in _handlers:
+                _log.addHandler(_handler)
+        self._targets.clear()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def capacity(self):
+        return self._queue.maxsize
+
+    @property
+    def size(self):
+        '''
+        The number of records currently awaiting the writer thread.
+        '''
+        return self._queue.qsize()
+
+    @property
+    def dropped(self):
+        '''
+        The number of records dropped because the queue was full.
+        '''
+        return self._handler.dropped
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def stop(self):
+        '''
+        Writes any records remaining in the queue, stops the writer thread
+        and restores the loggers' handlers. This is also called at exit.
+        '''
+        if not self._stopped:
+            self._stopped = True
+            self._listener.stop()
+            self.detach_all()
+
+#EOF
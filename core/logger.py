@@ -7,10 +7,12 @@
 #
 # author:   Murray Altheim
 # created:  2020-01-14
-# modified: 2024-05-19
+# modified: 2026-10-18
 #
 
 import os, logging, math, traceback, threading
+import time
+from time import time as _time, perf_counter_ns as _perf_counter_ns
 from logging.handlers import RotatingFileHandler
 from datetime import datetime as dt
 from enum import Enum
@@ -21,7 +23,11 @@ import core.globals as globals
 globals.init()
 
 from core.util import Util
-from core.ansi_filtering_file_handler import AnsiFilteringRotatingFileHandler
+from core.log_formatter import STYLE_ATTRIBUTE, ConsoleFormatter, PlainFormatter
+from core.log_queue import LogQueue
+from core.log_limiter import LogLimiter
+from core.flight_recorder import FlightRecorder
+from core.jsonl_log_handler import JsonlRotatingFileHandler
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Level(Enum):
@@ -69,94 +75,170 @@ class Logger(object):
     __color_error    = Fore.RED    + Style.NORMAL
     __color_critical = Fore.WHITE  + Style.NORMAL
     __color_reset    = Style.RESET_ALL
-
-    def __init__(self, name, log_to_console=True, log_to_file=False, level=Level.INFO):
+    # i18n?
+    __DEBUG_TOKEN    = 'DEBUG'
+    __INFO_TOKEN     = 'INFO '
+    __WARN_TOKEN     = 'WARN '
+    __ERROR_TOKEN    = 'ERROR'
+    __FATAL_TOKEN    = 'FATAL'
+    # style metadata passed with each record, applied by the formatters
+    __debug_style    = { STYLE_ATTRIBUTE: ( __color_debug,    __DEBUG_TOKEN, '' ) }
+    __info_style     = { STYLE_ATTRIBUTE: ( __color_info,     __INFO_TOKEN,  '' ) }
+    __notice_style   = { STYLE_ATTRIBUTE: ( __color_notice,   __INFO_TOKEN,  '' ) }
+    __warning_style  = { STYLE_ATTRIBUTE: ( __color_warning,  __WARN_TOKEN,  '' ) }
+    __error_style    = { STYLE_ATTRIBUTE: ( __color_error,    __ERROR_TOKEN, Style.NORMAL ) }
+    __critical_style = { STYLE_ATTRIBUTE: ( __color_critical, __FATAL_TOKEN, Style.BRIGHT ) }
+    __instances      = {} # name to Logger: Loggers are cached by name
+    __instance_lock  = threading.Lock()
+    __console_handler = None # the stream handler shared by all Loggers
+    __log_queue      = None # the shared LogQueue when in queue mode
+    __limiters       = {} # logger name to LogLimiter, for rate-limited loggers
+    __recorder       = FlightRecorder() # records all messages at all levels, or None
+    _include_timestamp = True
+    _date_format     = '%Y-%m-%dT%H:%M:%S'
+#   _date_format     = '%Y-%m-%dT%H:%M:%S.%f'
+#   _date_format     = '%H:%M:%S'
+    _1st_col_width   = 14
+
+    def __new__(cls, name, *args, **kwargs):
+        '''
+        Returns the existing Logger of the given name if there is one, so
+        that creating a Logger is in most cases just a dictionary lookup.
+        '''
+        _logger = Logger.__instances.get(name)
+        if _logger is None:
+            with Logger.__instance_lock:
+                _logger = Logger.__instances.get(name)
+                if _logger is None:
+                    _logger = object.__new__(cls)
+                    _logger._name = None # not yet initialised
+                    Logger.__instances[name] = _logger
+        return _logger
+
+    def __init__(self, name, log_to_console=True, log_to_file=False, level=None):
         '''
         Writes to a named log with the provided level, defaulting to a
         console (stream) handler unless 'log_to_file' is True, in which
         case only write to file, not to the console.
 
+        Loggers are cached by name: constructing a Logger with the name of
+        an existing one returns that Logger, its level unchanged unless a
+        level is provided. All Loggers share a single console handler and a
+        single file handler.
+
+        As nearly all callers provide the level as the second positional
+        argument, a Level provided there is treated as the level.
+
         :param name:           the name identified with the log output
         :param log_to_console:  if True will log to console (default True)
         :param log_to_file:    if True will subsequentially log to file, for all loggers (default False)
-        :param level:          the log level
-        '''
-        # configuration preliminaries ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-        if log_to_file:
-            _log_to_file = log_to_file
-            globals.put('log-to-file', True)
-        elif globals and globals.has('log-to-file'):
-            _log_to_file = globals.get('log-to-file')
-        else:
-            _log_to_file = False
-
-        # get or create log statistics object
-        _log_stats = globals.get('log-stats')
-        if not _log_stats:
-            _log_stats = LogStats()
-            globals.put('log-stats', _log_stats)
-        self._log_stats = _log_stats
-
-        # configuration ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-        _strip_ansi_codes       = True # used only with file output, to strip ANSI characters from log data
-        self._include_timestamp = True
-        self._date_format       = '%Y-%m-%dT%H:%M:%S'
-#       self._date_format       = '%Y-%m-%dT%H:%M:%S.%f'
-#       self._date_format       = '%H:%M:%S'
-        # i18n?
-        self.__DEBUG_TOKEN = 'DEBUG'
-        self.__INFO_TOKEN  = 'INFO '
-        self.__WARN_TOKEN  = 'WARN '
-        self.__ERROR_TOKEN = 'ERROR'
-        self.__FATAL_TOKEN = 'FATAL'
-        self._mf           = '{}{} : {}{}'
-        _1st_col_width     = 14
+        :param level:          the optional log level (default INFO)
+        '''
+        if isinstance(log_to_console, Level):
+            level, log_to_console = log_to_console, True
+        if self._name is not None: # cached
+            if log_to_file and not self._fh:
+                self._add_file_handler(log_to_file)
+            if level is not None and level is not self._level:
+                self.level = level
+            return
+        if level is None:
+            level = Level.INFO
 
         # create logger  ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+        self._log_stats = Logger._get_log_stats()
+        self._counts    = self._log_stats.register(name)
         self.__mutex = threading.Lock()
         self.__log   = logging.getLogger(name)
         self.__log.propagate = False
-        self._name   = name
         self._fh     = None # optional file handler
         self._sh     = None # optional stream handler
+        self._level_value = level.value # set early as logging may precede the level setter
+        self._name   = name
         if not self.__log.handlers:
             if log_to_console: # log to console ┈┈┈┈┈┈┈┈┈┈┈┈
-                self._sh = logging.StreamHandler()
-                if self._include_timestamp:
-                    self._sh.setFormatter(logging.Formatter(Fore.BLUE + Style.DIM + '%(asctime)s.%(msecs)3fZ\t:' \
-                            + Fore.RESET + ' %(name)s ' + ( ' '*(_1st_col_width-len(name)) ) + ' : %(message)s', datefmt=self._date_format))
-#                   self._sh.setFormatter(logging.Formatter('%(asctime)s.%(msecs)06f  %(name)s ' + ( ' '*(_1st_col_width-len(name)) ) + ' : %(message)s', datefmt=self._date_format))
-                else:
-                    self._sh.setFormatter(logging.Formatter('%(name)s ' + ( ' '*(_1st_col_width-len(name)) ) + ' : %(message)s'))
+                self._sh = Logger._get_console_handler()
                 self.__log.addHandler(self._sh)
-            if _log_to_file: # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-                # if ./log/ directory doesn't exist, create it
-                if not os.path.exists('./log'):
-                    try:
-                        os.makedirs('./log')
-                    except OSError as e:
-                        raise Exception('could not create ./log directory: {}'.format(e))
-                _ts = dt.utcfromtimestamp(dt.utcnow().timestamp()).isoformat().replace(':','_').replace('-','_').replace('.','_')
-                _filename = './log/kros-{}.csv'.format(_ts)
-                self.info("logging to file: {}".format(_filename))
-                # do we already have a file handler?
-                if globals.has('log-file-handler'): # use existing file handler
-                    self._fh = globals.get('log-file-handler')
-                elif _strip_ansi_codes: # using new ANSI filtering file handler
-                    self._fh = AnsiFilteringRotatingFileHandler(filename=_filename, mode='w', maxBytes=262144, backupCount=10)
-                    globals.put('log-file-handler', self._fh)
-                else: # using new rotating file handler
-                    self._fh = RotatingFileHandler(filename=_filename, mode='w', maxBytes=262144, backupCount=10)
-                    globals.put('log-file-handler', self._fh)
-#               self._fh.setLevel(level.value)
-                if self._include_timestamp:
-                    self._fh.setFormatter(logging.Formatter('%(asctime)s.%(msecs)03dZ\t|%(name)s|%(message)s', datefmt=self._date_format))
-                else:
-                    self._fh.setFormatter(logging.Formatter('%(name)s|%(message)s'))
-                self.__log.addHandler(self._fh)
+            self._add_file_handler(log_to_file)
+        if Logger.__log_queue:
+            Logger.__log_queue.attach(self.__log)
 
         self.level = level
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def _get_log_stats():
+        '''
+        Returns the global log statistics, creating them if necessary.
+        '''
+        _log_stats = globals.get('log-stats')
+        if not _log_stats:
+            _log_stats = LogStats()
+            globals.put('log-stats', _log_stats)
+        return _log_stats
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def _get_console_handler():
+        '''
+        Returns the console (stream) handler shared by all Loggers, creating
+        it if necessary. Each record's logger name is padded to the width
+        of the first column by the formatter.
+        '''
+        if Logger.__console_handler is None:
+            _sh = logging.StreamHandler()
+            _name_column = ' %(name)-{:d}s  : %(message)s'.format(Logger._1st_col_width)
+            if Logger._include_timestamp:
+                _sh.setFormatter(ConsoleFormatter(Fore.BLUE + Style.DIM + '%(asctime)s.%(msecs)3fZ\t:' \
+                        + Fore.RESET + _name_column, datefmt=Logger._date_format))
+            else:
+                _sh.setFormatter(ConsoleFormatter(_name_column[1:]))
+            Logger.__console_handler = _sh
+        return Logger.__console_handler
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _add_file_handler(self, log_to_file):
+        '''
+        If logging to file, either as requested or as previously requested
+        for all loggers, adds the file handler shared by all Loggers,
+        creating it if necessary.
+
+        :param log_to_file:  if True will subsequentially log to file, for all loggers
+        '''
+        if log_to_file:
+            _log_to_file = log_to_file
+            globals.put('log-to-file', True)
+        elif globals and globals.has('log-to-file'):
+            _log_to_file = globals.get('log-to-file')
+        else:
+            _log_to_file = False
+        if not _log_to_file:
+            return
+        # do we already have a file handler?
+        if globals.has('log-file-handler'): # use existing file handler
+            self._fh = globals.get('log-file-handler')
+        else:
+            # if ./log/ directory doesn't exist, create it
+            if not os.path.exists('./log'):
+                try:
+                    os.makedirs('./log')
+                except OSError as e:
+                    raise Exception('could not create ./log directory: {}'.format(e))
+            _ts = dt.utcfromtimestamp(dt.utcnow().timestamp()).isoformat().replace(':','_').replace('-','_').replace('.','_')
+            _jsonl = globals.has('log-format') and globals.get('log-format') == 'jsonl'
+            _filename = './log/kros-{}.{}'.format(_ts, 'jsonl' if _jsonl else 'csv')
+            self.info("logging to file: {}".format(_filename))
+            if _jsonl: # using new structured (JSONL) file handler, with its own formatter
+                self._fh = JsonlRotatingFileHandler(filename=_filename, max_bytes=1048576, backup_count=10, name=self._name)
+            else: # using new rotating file handler
+                self._fh = RotatingFileHandler(filename=_filename, mode='w', maxBytes=262144, backupCount=10)
+                if Logger._include_timestamp:
+                    self._fh.setFormatter(PlainFormatter('%(asctime)s.%(msecs)03dZ\t|%(name)s|%(message)s', datefmt=Logger._date_format))
+                else:
+                    self._fh.setFormatter(PlainFormatter('%(name)s|%(message)s'))
+            globals.put('log-file-handler', self._fh)
+        self.__log.addHandler(self._fh)
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @property
     def name(self):
@@ -174,8 +256,124 @@ class Logger(object):
         system should be made after this call.
         '''
 #       self.suppress()
+        for _name, _limiter in Logger.__limiters.items():
+            _summary = _limiter.summary(force=True)
+            if _summary:
+                logging.getLogger(_name).info(_summary, extra=self.__notice_style)
+        Logger.disable_queue_mode()
         logging.shutdown()
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def enable_queue_mode(capacity=1000):
+        '''
+        Enables queue mode for all Loggers, existing and subsequently created:
+        rather than being written synchronously by the calling thread, each
+        record is enqueued without blocking and is formatted and written by
+        a dedicated thread. If the bounded queue of records is full further
+        records are dropped (and counted) until there is room. This is global
+        across all Loggers.
+
+        :param capacity:  the maximum number of records buffered
+        '''
+        if Logger.__log_queue is None:
+            Logger.__log_queue = LogQueue(capacity)
+            for _name in Logger.__instances:
+                Logger.__log_queue.attach(logging.getLogger(_name))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def disable_queue_mode():
+        '''
+        Writes any queued records, stops the writer thread and returns all
+        Loggers to writing synchronously, reporting any dropped records.
+        '''
+        _log_queue = Logger.__log_queue
+        if _log_queue is not None:
+            Logger.__log_queue = None
+            _log_queue.stop()
+            if _log_queue.dropped > 0:
+                logging.getLogger('logger').warning('{:d} log records dropped in queue mode.'.format(_log_queue.dropped))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def configure_rate_limits(cfg):
+        '''
+        Configures rate limiting and sampling for the named Loggers, existing
+        or subsequently created, replacing any prior configuration. Only the
+        debug, info and notice messages of a limited Logger are limited;
+        warnings and errors are always written. In place of suppressed
+        records a summary of their number is written at most once per
+        summary interval, and for each Logger upon close().
+
+        The configuration is the 'kros.logger' section, e.g.,
+
+            rate_limit_summary_sec: 10
+            rate_limits:
+                'pub:queue':  { max_per_sec: 2, burst: 5 }
+                'beh:idle':   { sample: 10 }
+
+        :param cfg:  the logger configuration section
+        '''
+        _summary_sec = cfg.get('rate_limit_summary_sec', 10.0)
+        _limits = cfg.get('rate_limits') or {}
+        Logger.__limiters = { _name: LogLimiter(_limit_cfg, _summary_sec) for _name, _limit_cfg in _limits.items() }
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def configure_flight_recorder(capacity):
+        '''
+        Sets the capacity of the flight recorder, retaining its most recent
+        records, or if the capacity is zero disables it.
+
+        :param capacity:  the number of records retained
+        '''
+        if not capacity:
+            Logger.__recorder = None
+        elif Logger.__recorder is None:
+            Logger.__recorder = FlightRecorder(capacity)
+        else:
+            Logger.__recorder.resize(capacity)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def dump_flight_recorder(reason=None):
+        '''
+        Writes the flight recorder's most recent messages of all Loggers at
+        all levels to a timestamped file in the ./log directory, returning
+        its path, or None if disabled or empty. This is safe to call from a
+        signal handler or exception handler, and never raises.
+
+        :param reason:  the optional reason for the dump
+        '''
+        _recorder = Logger.__recorder
+        if _recorder is None:
+            return None
+        try:
+            _path = _recorder.dump(reason)
+            if _path:
+                logging.getLogger('logger').warning('flight recorder dumped to: {}'.format(_path))
+            return _path
+        except Exception as e:
+            logging.getLogger('logger').error('could not dump flight recorder: {}'.format(e))
+            return None
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def get_flight_recorder():
+        '''
+        Returns the FlightRecorder, or None if disabled.
+        '''
+        return Logger.__recorder
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def get_log_queue():
+        '''
+        Returns the shared LogQueue if in queue mode, otherwise None.
+        '''
+        return Logger.__log_queue
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def suppress(self):
         '''
@@ -207,11 +405,8 @@ class Logger(object):
         Set the level of this logger to the argument.
         '''
         self._level = level
-        self.__log.setLevel(self._level.value)
-        if self._fh:
-            self._fh.setLevel(level.value)
-        if self._sh:
-            self._sh.setLevel(level.value)
+        self._level_value = level.value
+        self.__log.setLevel(self._level.value) # the shared handlers are not levelled
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def is_at_least(self, level):
@@ -224,6 +419,19 @@ class Logger(object):
         '''
         return self._level.value >= level.value
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def enabled_for(self, level):
+        '''
+        Returns True if a message of the argument level would be logged,
+        i.e., this logger is not suppressed and its level is at or below
+        the argument. This is a cheap check, for use in guarding a message
+        whose arguments are themselves expensive to compute, e.g.,
+
+            if self._log.enabled_for(Level.DEBUG):
+                self._log.debug('queue: %s', self._describe_queue())
+        '''
+        return not type(self).__suppress and level._value_ >= self._level_value # _value_ avoids the slower Enum property
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @property
     def stats(self):
@@ -241,82 +449,145 @@ class Logger(object):
         return type(self).__suppress
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def debug(self, message):
+    def debug(self, message, *args):
         '''
         Prints a debug message.
 
-        The optional 'end' argument is for special circumstances where a different end-of-line is desired.
+        Any arguments are merged into the message %-style, only if the
+        message is actually logged (see enabled_for()).
         '''
-        if not self.suppressed:
-            self._log_stats.debug_count()
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.DEBUG, message, args ))
+        if not type(self).__suppress and self._level_value <= logging.DEBUG:
             with self.__mutex:
-                self.__log.debug(self._mf.format(Logger.__color_debug, self.__DEBUG_TOKEN, message, Logger.__color_reset))
+                if Logger.__limiters and not self.__allow():
+                    return
+                self._counts[LogStats.DEBUG] += 1
+                _start_ns = _perf_counter_ns()
+                self.__log.debug(message, *args, extra=self.__debug_style)
+                self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def info(self, message):
+    def info(self, message, *args):
         '''
         Prints an informational message.
 
-        The optional 'end' argument is for special circumstances where a different end-of-line is desired.
+        Any arguments are merged into the message %-style, only if the
+        message is actually logged (see enabled_for()).
         '''
-        if not self.suppressed:
-            self._log_stats.info_count()
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.INFO, message, args ))
+        if not type(self).__suppress and self._level_value <= logging.INFO:
             with self.__mutex:
-                self.__log.info(self._mf.format(Logger.__color_info, self.__INFO_TOKEN, message, Logger.__color_reset))
+                if Logger.__limiters and not self.__allow():
+                    return
+                self._counts[LogStats.INFO] += 1
+                _start_ns = _perf_counter_ns()
+                self.__log.info(message, *args, extra=self.__info_style)
+                self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def notice(self, message):
+    def notice(self, message, *args):
         '''
         Functionally identical to info() except it prints the message brighter.
 
-        The optional 'end' argument is for special circumstances where a different end-of-line is desired.
+        Any arguments are merged into the message %-style, only if the
+        message is actually logged (see enabled_for()).
         '''
-        if not self.suppressed:
-            self._log_stats.info_count()
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.INFO, message, args ))
+        if not type(self).__suppress and self._level_value <= logging.INFO:
             with self.__mutex:
-                self.__log.info(self._mf.format(Logger.__color_notice, self.__INFO_TOKEN, message, Logger.__color_reset))
+                if Logger.__limiters and not self.__allow():
+                    return
+                self._counts[LogStats.INFO] += 1
+                _start_ns = _perf_counter_ns()
+                self.__log.info(message, *args, extra=self.__notice_style)
+                self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def __allow(self):
+        '''
+        Returns True if this logger is not rate-limited or if its limiter
+        allows the record, first writing any summary of suppressed records
+        that is due.
+        '''
+        _limiter = Logger.__limiters.get(self._name)
+        if _limiter is None:
+            return True
+        if not _limiter.allow():
+            return False
+        _summary = _limiter.summary()
+        if _summary:
+            self.__log.info(_summary, extra=self.__notice_style)
+        return True
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def warning(self, message):
+    def warning(self, message, *args):
         '''
         Prints a warning message.
 
-        The optional 'end' argument is for special circumstances where a different end-of-line is desired.
+        Any arguments are merged into the message %-style, only if the
+        message is actually logged (see enabled_for()).
         '''
-        if not self.suppressed:
-            self._log_stats.warn_count()
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.WARNING, message, args ))
+        if not type(self).__suppress and self._level_value <= logging.WARNING:
             with self.__mutex:
-                self.__log.warning(self._mf.format(Logger.__color_warning, self.__WARN_TOKEN, message, Logger.__color_reset))
+                self._counts[LogStats.WARN] += 1
+                _start_ns = _perf_counter_ns()
+                self.__log.warning(message, *args, extra=self.__warning_style)
+                self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def error(self, message):
+    def error(self, message, *args):
         '''
         Prints an error message.
 
-        The optional 'end' argument is for special circumstances where a different end-of-line is desired.
+        Any arguments are merged into the message %-style, only if the
+        message is actually logged (see enabled_for()).
         '''
-        if not self.suppressed:
-            self._log_stats.error_count()
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.ERROR, message, args ))
+        if not type(self).__suppress and self._level_value <= logging.ERROR:
             with self.__mutex:
-                self.__log.error(self._mf.format(Logger.__color_error, self.__ERROR_TOKEN, Style.NORMAL + message, Logger.__color_reset))
+                self._counts[LogStats.ERROR] += 1
+                _start_ns = _perf_counter_ns()
+                self.__log.error(message, *args, extra=self.__error_style)
+                self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def critical(self, message):
+    def critical(self, message, *args):
         '''
         Prints a critical or otherwise application-fatal message.
         '''
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.CRITICAL, message, args ))
         with self.__mutex:
-            self._log_stats.critical_count()
-            self.__log.critical(self._mf.format(Logger.__color_critical, self.__FATAL_TOKEN, Style.BRIGHT + message, Logger.__color_reset))
+            self._counts[LogStats.CRITICAL] += 1
+            _start_ns = _perf_counter_ns()
+            self.__log.critical(message, *args, extra=self.__critical_style)
+            self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def file(self, message):
+    def file(self, message, *args):
         '''
         This is just info() but without any formatting.
         '''
+        _recorder = Logger.__recorder
+        if _recorder is not None:
+            _recorder.append(( _time(), self._name, logging.INFO, message, args ))
         with self.__mutex:
-            self._log_stats.info_count()
-            self.__log.info(message)
+            self._counts[LogStats.INFO] += 1
+            _start_ns = _perf_counter_ns()
+            self.__log.info(message, *args)
+            self._counts[LogStats.NANOS] += _perf_counter_ns() - _start_ns
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def heading(self, title, message=None, info=None):
@@ -328,7 +599,6 @@ class Logger(object):
         :param info:     an optional second message to display right-justified; ignored if None.
         '''
         if not self.suppressed:
-            self._log_stats.info_count()
             _H = '┈'
             MAX_WIDTH = 100
             MARGIN = 27
@@ -374,34 +644,113 @@ class Logger(object):
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class LogStats(object):
     '''
-    Provides a simple count for each call to the Logger.
+    Provides a count for each call to the Logger, by logger and by level,
+    as well as the time spent writing messages.
+
+    Each Logger registers for its own list of counters, which it updates
+    without any lookup or shared lock (the Logger's own mutex serialises
+    its updates). The counters of all Loggers are only merged when read.
     '''
+    DEBUG    = 0
+    INFO     = 1
+    WARN     = 2
+    ERROR    = 3
+    CRITICAL = 4
+    NANOS    = 5 # time spent writing, in nanoseconds
+
     def __init__(self):
-        self._debug_count    = 0
-        self._info_count     = 0
-        self._warn_count     = 0
-        self._error_count    = 0
-        self._critical_count = 0
-        pass
+        self._counters   = {} # logger name to list of counters
+        self._other      = self.register('(other)')
+        self._start_time = time.monotonic()
+        self._mark_time  = self._start_time
+        self._mark_total = 0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def register(self, name):
+        '''
+        Returns the list of counters for the named logger, indexed by the
+        class constants DEBUG through CRITICAL, and NANOS.
 
+        :param name:  the logger name
+        '''
+        return self._counters.setdefault(name, [0, 0, 0, 0, 0, 0])
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def debug_count(self):
-        self._debug_count += 1
+        self._other[LogStats.DEBUG] += 1
 
     def info_count(self):
-        self._info_count += 1
+        self._other[LogStats.INFO] += 1
 
     def warn_count(self):
-        self._warn_count += 1
+        self._other[LogStats.WARN] += 1
 
     def error_count(self):
-        self._error_count += 1
+        self._other[LogStats.ERROR] += 1
 
     def critical_count(self):
-        self._critical_count += 1
+        self._other[LogStats.CRITICAL] += 1
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     @property
     def counts(self):
-        return ( self._debug_count, self._info_count, self._warn_count,
-                self._error_count, self._critical_count )
+        '''
+        Returns the total counts of all loggers as a tuple of debug, info,
+        warn, error and critical counts.
+        '''
+        _totals = [0, 0, 0, 0, 0]
+        for _counts in list(self._counters.values()):
+            for _i in range(5):
+                _totals[_i] += _counts[_i]
+        return tuple(_totals)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def counts_by_logger(self):
+        '''
+        Returns a dict of logger name to a tuple of its debug, info, warn,
+        error and critical counts, for loggers with any messages.
+        '''
+        return { _name: tuple(_counts[:5]) for _name, _counts in list(self._counters.items()) if any(_counts[:5]) }
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def rates(self):
+        '''
+        Returns a tuple of the overall messages per second since these
+        statistics began, and the messages per second since the previous
+        call, which begins a new interval.
+        '''
+        _now   = time.monotonic()
+        _total = sum(self.counts)
+        _overall  = _total / max(_now - self._start_time, 1e-9)
+        _interval = ( _total - self._mark_total ) / max(_now - self._mark_time, 1e-9)
+        self._mark_time  = _now
+        self._mark_total = _total
+        return _overall, _interval
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_report(self, log, limit=10):
+        '''
+        Prints the total counts, rates and time spent logging, then the
+        loggers with the most messages, with their counts by level, rate
+        and time spent writing.
+
+        :param log:    the Logger to print to
+        :param limit:  the maximum number of loggers listed
+        '''
+        _elapsed_sec = max(time.monotonic() - self._start_time, 1e-9)
+        _overall, _interval = self.rates()
+        _totals = self.counts
+        _nanos  = sum(_counts[LogStats.NANOS] for _counts in list(self._counters.values()))
+        log.info('log stats:' + Fore.YELLOW + '\t{:d} messages in {:.1f}s ({:.1f}/s; {:.1f}/s recently); {:.1f}ms writing.'.format(
+                sum(_totals), _elapsed_sec, _overall, _interval, _nanos / 1e6))
+        log.info(Fore.YELLOW + '\t{:d} debug; {:d} info; {:d} warn; {:d} error; {:d} critical.'.format(*_totals))
+        _ranked = sorted(list(self._counters.items()), key=lambda item: sum(item[1][:5]), reverse=True)
+        for _name, _counts in _ranked[:limit]:
+            _count = sum(_counts[:5])
+            if _count == 0:
+                break
+            log.info(Fore.YELLOW + '\t{:<14} {:6d} ({:6.1f}/s; {:7.2f}ms)  D:{:d} I:{:d} W:{:d} E:{:d} C:{:d}'.format(
+                    _name, _count, _count / _elapsed_sec, _counts[LogStats.NANOS] / 1e6, *_counts[:5]))
 
 #EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2021-03-10
-# modified: 2021-03-16
+# modified: 2026-10-18
 #
 # NOTE: to guarantee exactly-once delivery each message must contain a list
 # of the identifiers for all current subscribers, with each subscriber
@@ -53,6 +53,10 @@ class Message(object):
         self._gc            = False
         self._processors    = {} # list of processor names who've processed message
         self._subscribers   = {} # list of subscriber names who've acknowledged message
+        self._pending       = 0  # count of expected subscribers yet to complete
+        self._holders       = set() # subscribers that have taken the message for processing
+        self._completed     = set() # subscribers that have completed the message
+        self._deadline      = None  # the event loop handle scheduling expiry
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def set_subscribers(self, subscribers):
@@ -61,6 +65,8 @@ class Message(object):
         '''
         for subscriber in subscribers:
             self._subscribers[subscriber] = False
+            if not subscriber.is_gc:
+                self._pending += 1
 
     # instance_name ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -213,6 +219,28 @@ class Message(object):
             raise Exception('already garbage collected.')
         self._gc = True
 
+    # deadline ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    @property
+    def deadline(self):
+        '''
+        Returns the event loop handle scheduling the message's expiry, or
+        None if none has been scheduled.
+        '''
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, handle):
+        self._deadline = handle
+
+    def cancel_deadline(self):
+        '''
+        Cancels the scheduled expiry of the message, if any.
+        '''
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+
     # acknowledged ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     def print_acks(self):
@@ -238,6 +266,14 @@ class Message(object):
                 _count += 1
         return _count
 
+    @property
+    def unacknowledged_names(self):
+        '''
+        Returns a list of the names of subscribers (not including the garbage
+        collector) that have not acknowledged this message.
+        '''
+        return [ subscriber.name for subscriber in self._subscribers if not subscriber.is_gc and not self._subscribers[subscriber] ]
+
     @property
     def fully_acknowledged(self):
         '''
@@ -251,6 +287,13 @@ class Message(object):
                 return False
         return True
 
+    def expects(self, subscriber):
+        '''
+        Returns True if the subscriber is among the message's recipients,
+        i.e., it was not excluded by a value filter when routed.
+        '''
+        return subscriber in self._subscribers
+
     def acknowledged_by(self, subscriber):
         '''
         Returns True if the message has been acknowledged by the specified subscriber.
@@ -260,6 +303,43 @@ class Message(object):
                 return True
         return False
 
+    # completion ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    @property
+    def pending(self):
+        '''
+        Returns the number of expected subscribers (not including the garbage
+        collector) that have yet to complete this message.
+        '''
+        return self._pending
+
+    @property
+    def held(self):
+        '''
+        Returns True if any subscriber has taken this message for processing
+        and not yet completed it.
+        '''
+        return len(self._holders) > 0
+
+    def hold(self, subscriber):
+        '''
+        To be called by a subscriber that has taken the message for processing.
+        '''
+        self._holders.add(subscriber)
+
+    def complete(self, subscriber):
+        '''
+        To be called by each expected subscriber once it is done with the
+        message, either having acknowledged it as unacceptable or having
+        processed it. Returns True if this was the last expected completion.
+        '''
+        if subscriber.is_gc or subscriber in self._completed or subscriber not in self._subscribers:
+            return False
+        self._holders.discard(subscriber)
+        self._completed.add(subscriber)
+        self._pending -= 1
+        return self._pending == 0
+
     def acknowledge(self, subscriber):
         '''
         To be called by each subscriber, acknowledging receipt of the message.
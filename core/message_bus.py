@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2021-03-10
-# modified: 2024-06-03
+# modified: 2026-10-18
 #
 # An asyncio-based publish/subscribe-style message bus guaranteeing exactly-once
 # delivery for each message. This is done by populating each message with the
@@ -31,6 +31,7 @@
 import sys, time, traceback, logging
 import asyncio, signal
 from asyncio.queues import Queue, QueueEmpty
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime as dt
 from colorama import init, Fore, Style
 init()
@@ -41,6 +42,7 @@ from core.component import Component
 from core.event import Event
 from core.message import Message
 from core.arbitrator import Arbitrator
+from core.dead_letter import DeadLetterStore
 from core.numbers import Numbers
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -48,9 +50,17 @@ class MessageBus(Component):
     '''
     An asyncio-based asynchronous message bus.
 
+    Messages are retired as soon as their last expected subscriber completes
+    them or their deadline (the maximum age) passes, with the garbage
+    collector subscriber remaining as a fallback.
+
     :param config:  the application configuration
     :param level:   the optional log level
     '''
+    RETIRED_COMPLETED = 'completed' # all expected subscribers completed
+    RETIRED_EXPIRED   = 'expired'   # deadline passed
+    RETIRED_COLLECTED = 'collected' # by the garbage collector
+
     def __init__(self, config, level):
         self._log = Logger("bus", level)
         Component.__init__(self, self._log, suppressed=False, enabled=False)
@@ -62,7 +72,7 @@ class MessageBus(Component):
             self._log.debug('logging message bus set to debug level.')
             logging.basicConfig(level=logging.DEBUG)
         self._queue = PeekableQueue(level)
-        self._arbitrator = Arbitrator(level)
+        self._arbitrator = Arbitrator(config, level)
         _cfg = config['kros'].get('message_bus')
         self._max_age_ms             = _cfg.get('max_age_ms') # was: 20.0ms
         self._publish_delay_sec      = _cfg.get('publish_delay_sec') # was: 0.01 sec
@@ -74,6 +84,12 @@ class MessageBus(Component):
         self._clip_event_list        = _cfg.get('clip_event_list') # used for printing only
         self._clip_length            = _cfg.get('clip_length')
         self._closing                = False # used during shutdown
+        self._thread_pool_workers    = _cfg.get('thread_pool_workers', 2)
+        self._process_pool_workers   = _cfg.get('process_pool_workers', 2)
+        self._executors              = {} # created on demand, keyed by offload mode
+        self._retired_counts         = { MessageBus.RETIRED_COMPLETED: 0, MessageBus.RETIRED_EXPIRED: 0, MessageBus.RETIRED_COLLECTED: 0 }
+        self._undelivered_count      = 0
+        self._dead_letters           = DeadLetterStore(_cfg.get('dead_letter_capacity', 100))
         self._log.info('ready.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -126,7 +142,7 @@ class MessageBus(Component):
                 print('\n')
                 self._log.error('Ctrl-C caught; exiting…')
             except RuntimeError as e:
-                self._log.debug('cannot get task list: {}'.format(e))
+                self._log.debug('cannot get task list: %s', e)
         return _tasks
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -136,7 +152,7 @@ class MessageBus(Component):
         '''
         _tasks = self.get_all_tasks()
         if len(_tasks) > 0:
-            self._log.info('clearing {:d} outstanding task{}…'.format(len(_tasks), '' if len(_tasks) == 1 else 's'))
+            self._log.info('clearing %d outstanding task%s…', len(_tasks), '' if len(_tasks) == 1 else 's')
             for _task in _tasks:
                 _task_name = _task.get_name()
                 if 'shutdown' in _task_name:
@@ -144,10 +160,10 @@ class MessageBus(Component):
                 else:
                     try:
                         if not _task.cancelled():
-                            self._log.info("cancelling task '{}'…".format(_task_name))
+                            self._log.info("cancelling task '%s'…", _task_name)
                             _task.cancel()
                         if _task.done():
-                            self._log.info("task '{}' is already done.".format(_task_name))
+                            self._log.info("task '%s' is already done.", _task_name)
                             _tasks.remove(_task)
                             pass
                         else:
@@ -165,7 +181,7 @@ class MessageBus(Component):
                                 _task.cancel()
                                 _tasks.remove(_task)
                                 if not self.closing:
-                                    self._log.warning("removed unfinished task: '{}' ({})".format(_task.get_name(), _task))
+                                    self._log.warning("removed unfinished task: '%s' (%s)", _task.get_name(), _task)
                     except CancelledError:
                         self._log.warning('cancelled error: ignored.')
                     except Exception as e:
@@ -261,8 +277,8 @@ class MessageBus(Component):
         if publisher in self._publishers:
             raise ValueError('publisher list already contains \'{}\''.format(publisher.name))
         self._publishers.append(publisher)
-        self._log.info('registered publisher: \'{}\'; {:d} publisher{} in list.'.format( \
-                publisher.name, len(self._publishers), 's' if len(self._publishers) > 1 else ''))
+        self._log.info('registered publisher: \'%s\'; %d publisher%s in list.',
+                publisher.name, len(self._publishers), 's' if len(self._publishers) > 1 else '')
 
     def get_publisher(self, name):
         '''
@@ -292,10 +308,14 @@ class MessageBus(Component):
         '''
         Print the stats available from the arbitrator.
         '''
-        self._log.info('arbitrator:' + Fore.YELLOW + '\t{} payloads.'.format(self._arbitrator.count))
+        self._arbitrator.print_statistics()
         for _controller in self._arbitrator.controllers:
             _controller.print_statistics()
 
+    @property
+    def arbitrator(self):
+        return self._arbitrator
+
     @property
     def publishers(self):
         return self._publishers
@@ -315,8 +335,8 @@ class MessageBus(Component):
         if subscriber in self._subscribers:
             raise ValueError('subscriber list already contains \'{}\''.format(subscriber.name))
         self._subscribers.insert(0, subscriber)
-        self._log.debug('registered subscriber: \'{}\'; {:d} subscriber{} in list.'.format( \
-                subscriber.name, len(self._subscribers), 's' if len(self._subscribers) > 1 else ''))
+        self._log.debug('registered subscriber: \'%s\'; %d subscriber%s in list.',
+                subscriber.name, len(self._subscribers), 's' if len(self._subscribers) > 1 else '')
 
     def get_subscriber(self, name):
         '''
@@ -348,6 +368,21 @@ class MessageBus(Component):
                     + Fore.CYAN + 'listening for: '
                     + Fore.YELLOW + '{}'.format(_event_list))
 
+    def route(self, message):
+        '''
+        Returns the list of subscribers to which the message is to be routed,
+        being all registered subscribers except those whose value filters
+        reject the message's payload value.
+        '''
+        return [ subscriber for subscriber in self._subscribers if subscriber.accepts_value(message.payload) ]
+
+    def print_subscriber_statistics(self):
+        '''
+        Print the worker pool statistics of each registered subscriber.
+        '''
+        for subscriber in self._subscribers:
+            subscriber.print_statistics()
+
     @property
     def subscribers(self):
         return self._subscribers
@@ -418,8 +453,11 @@ class MessageBus(Component):
         '''
         self.print_task_info()
         self.print_arbitrator_info()
+        self.print_retirement_info()
+        self.print_dead_letters()
         self.print_publishers()
         self.print_subscribers()
+        self.print_subscriber_statistics()
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def print_task_info(self):
@@ -453,6 +491,30 @@ class MessageBus(Component):
         '''
         return self._queue.get()
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def remove_message(self, message):
+        '''
+        Without waiting, removes the specific (e.g., peeked) message from the
+        queue, returning True if it was present. Unlike consume_message() this
+        does not require a subsequent call to consumed().
+        '''
+        return self._queue.discard(message)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def drain_messages(self, f_accept, limit):
+        '''
+        Without waiting, removes and returns (in queue order) up to 'limit'
+        messages currently on the queue for which the filter function returns
+        True. Those not accepted remain on the queue in their original order.
+
+        NOTE: as with consume_message(), each message returned should
+        correspond with a subsequent call to consumed().
+
+        :param f_accept:  a function taking a message and returning a bool
+        :param limit:     the maximum number of messages to remove
+        '''
+        return self._queue.drain(f_accept, limit)
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def consumed(self):
         '''
@@ -469,6 +531,9 @@ class MessageBus(Component):
         NOTE: calls to this function should be await'd.
         '''
         _publish_task = asyncio.create_task(self._queue.put(message), name='publish-message-{}'.format(message.name))
+        # schedule retirement of the message upon its deadline
+        message.cancel_deadline()
+        message.deadline = asyncio.get_running_loop().call_later(self._max_age_ms / 1000.0, self._on_deadline, message)
         # the first time the message is published we update the 'last_message_timestamp'
         self.update_last_message_timestamp()
         await asyncio.sleep(self._publish_delay_sec)
@@ -481,10 +546,196 @@ class MessageBus(Component):
 
         NOTE: calls to this function should be await'd.
         '''
-        asyncio.create_task(self._queue.put(message), name='republish-message-{}'.format(message.name))
+        asyncio.create_task(self._requeue(message), name='republish-message-{}'.format(message.name))
         # when the message is republished we also update the 'last_message_timestamp'
         self.update_last_message_timestamp()
 
+    async def _requeue(self, message):
+        '''
+        Puts the message back onto the queue unless it has since been retired.
+        '''
+        if not message.gcd:
+            await self._queue.put(message)
+
+    # retirement ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    def complete(self, message, subscriber):
+        '''
+        Called by a subscriber once done with the message, either having
+        acknowledged it as unacceptable or having processed it. The message
+        is retired immediately upon its last expected completion, or if
+        its deadline has already passed and no other subscriber holds it.
+        As for the deadline, a message whose sent count is -1 never expires.
+
+        :param message:     the message
+        :param subscriber:  the subscriber that has completed the message
+        '''
+        if message.complete(subscriber):
+            self.retire(message, MessageBus.RETIRED_COMPLETED)
+        elif not message.held and message.sent != -1 and message.age > self._max_age_ms:
+            self.retire(message, MessageBus.RETIRED_EXPIRED)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def retire(self, message, reason):
+        '''
+        Retires the message: removes it from the queue if present and marks
+        it as garbage collected so it is not republished, counting it by
+        the reason for its retirement, and cancels its scheduled deadline.
+        A warning is logged if the message's payload was never sent to the
+        arbitrator. Messages that expired or were never sent are recorded in
+        the dead letter store. Returns False if the message had already been
+        retired.
+
+        :param message:  the message to retire
+        :param reason:   one of the MessageBus.RETIRED_* constants
+        '''
+        if message.gcd:
+            return False
+        self._queue.discard(message)
+        message.cancel_deadline()
+        message.gc() # mark as garbage collected and don't republish
+        self._retired_counts[reason] += 1
+        if reason != MessageBus.RETIRED_COMPLETED or not message.sent:
+            self._dead_letters.add(message, reason)
+        if not message.sent:
+            self._undelivered_count += 1
+            self._log.warning('garbage collected undelivered message: %s; event %s of group %s; value: %s',
+                    message.name, message.event.name, message.event.group.name, message.value)
+        return True
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _on_deadline(self, message):
+        '''
+        Called by the event loop once the message has reached its maximum
+        age. If no subscriber currently holds the message it is retired,
+        otherwise it is retired when the holder completes it. A message
+        whose sent count is -1 never expires.
+        '''
+        if not message.gcd and not message.held and message.sent != -1:
+            self.retire(message, MessageBus.RETIRED_EXPIRED)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def retired_counts(self):
+        '''
+        Returns a copy of the dict of retired message counts by reason.
+        '''
+        return dict(self._retired_counts)
+
+    @property
+    def undelivered_count(self):
+        '''
+        Returns the number of retired messages never sent to the arbitrator.
+        '''
+        return self._undelivered_count
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def get_dead_letters(self, event=None, subscriber=None, reason=None, limit=None):
+        '''
+        Returns a list of the most recent dead letters (messages that expired
+        or were never sent to the arbitrator), most recent first, optionally
+        filtered.
+
+        :param event:       only those with this Event
+        :param subscriber:  only those never acknowledged by the named subscriber
+        :param reason:      only those retired for this reason (a RETIRED_* constant)
+        :param limit:       the maximum number returned
+        '''
+        return self._dead_letters.query(event=event, subscriber=subscriber, reason=reason, limit=limit)
+
+    @property
+    def dead_letter_counts(self):
+        '''
+        Returns a dict of the total number of dead letters by Event.
+        '''
+        return self._dead_letters.event_counts
+
+    @property
+    def dead_letter_subscriber_counts(self):
+        '''
+        Returns a dict of the total number of dead letters by the name of each
+        subscriber that never acknowledged them, indicating bottlenecks.
+        '''
+        return self._dead_letters.subscriber_counts
+
+    def clear_dead_letters(self):
+        self._dead_letters.clear()
+
+    def print_dead_letters(self, limit=10):
+        '''
+        Print the dead letter counts and the most recent dead letters.
+
+        :param limit:  the maximum number of dead letters printed
+        '''
+        _counts = self._dead_letters.event_counts
+        if not _counts:
+            self._log.info('no dead letters.')
+            return
+        self._log.info('dead letters by event:')
+        for _event, _count in sorted(_counts.items(), key=lambda x: x[1], reverse=True):
+            self._log.info(Fore.YELLOW + '\t{}: {:d}'.format(_event.name, _count))
+        self._log.info('dead letters by unacknowledging subscriber:')
+        for _name, _count in sorted(self._dead_letters.subscriber_counts.items(), key=lambda x: x[1], reverse=True):
+            self._log.info(Fore.YELLOW + '\t{}: {:d}'.format(_name, _count))
+        self._log.info('most recent {:d} of {:d} retained dead letters:'.format(min(limit, len(self._dead_letters)), len(self._dead_letters)))
+        for _letter in self._dead_letters.query(limit=limit):
+            self._log.info(Fore.YELLOW + '\t{}'.format(_letter))
+
+    def print_retirement_info(self):
+        '''
+        Print the counts of retired messages.
+        '''
+        self._log.info('retired:' + Fore.YELLOW + '\t{:d} completed; {:d} expired; {:d} collected; {:d} undelivered.'.format(
+                self._retired_counts[MessageBus.RETIRED_COMPLETED], self._retired_counts[MessageBus.RETIRED_EXPIRED],
+                self._retired_counts[MessageBus.RETIRED_COLLECTED], self._undelivered_count))
+
+    # executors ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    async def run_offloaded(self, offload, function, *args):
+        '''
+        Runs the synchronous function with its arguments in the executor for
+        the offload mode, awaiting and returning its result on the event loop.
+        This keeps CPU-bound work from stalling message delivery.
+
+        For the 'process' mode the function and its arguments must be picklable,
+        i.e., the function should be a module-level function or staticmethod.
+
+        :param offload:   the offload mode, either 'thread' or 'process'
+        :param function:  the function to call
+        :param args:      the arguments to the function
+        '''
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(offload), function, *args)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_executor(self, offload):
+        '''
+        Returns the executor owned by the message bus for the offload mode,
+        creating it upon first use.
+        '''
+        _executor = self._executors.get(offload)
+        if _executor is None:
+            if offload == 'thread':
+                _workers  = self._thread_pool_workers
+                _executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix='bus-offload')
+            elif offload == 'process':
+                _workers  = self._process_pool_workers
+                _executor = ProcessPoolExecutor(max_workers=_workers)
+            else:
+                raise ValueError('unrecognised offload mode: {}'.format(offload))
+            self._executors[offload] = _executor
+            self._log.info('created {} pool executor with {:d} workers.'.format(offload, _workers))
+        return _executor
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _shutdown_executors(self):
+        '''
+        Shuts down any executors without waiting, cancelling pending work.
+        '''
+        for _offload, _executor in self._executors.items():
+            self._log.info('shutting down {} pool executor…'.format(_offload))
+            _executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
     # exception handling ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     def _handle_exception(self, loop, context):
@@ -499,8 +750,10 @@ class MessageBus(Component):
                     self._log.warning('caught system exit with code {}.'.format(_code))
             else:
                 self._log.error('handle {} exception on loop: {} with context: {}\n{}'.format(type(_exception), loop, context, traceback.format_exc()))
+                Logger.dump_flight_recorder('{} exception on loop: {}'.format(_type.__name__, _exception))
         else:
             self._log.error('handling error: {}'.format(context.get('message')))
+            Logger.dump_flight_recorder('error on loop: {}'.format(context.get('message')))
         if loop.is_running() and not loop.is_closed():
             asyncio.create_task(self.shutdown(loop), name='shutdown-on-exception')
         elif not isinstance(_exception, SystemExit):
@@ -621,6 +874,8 @@ class MessageBus(Component):
             for s in signals:
                 self._loop.add_signal_handler(
                     s, lambda s = s: asyncio.create_task(self.shutdown(s), name='shutdown'),)
+            # dump the flight recorder on demand, e.g., 'kill -USR1 <pid>'
+            self._loop.add_signal_handler(signal.SIGUSR1, Logger.dump_flight_recorder, 'signal SIGUSR1')
             self._loop.set_exception_handler(self._handle_exception)
             self._loop.create_task(self._start_consuming(), name='__message-bus-event-loop')
         if not self._loop.is_running():
@@ -661,6 +916,8 @@ class MessageBus(Component):
             self._subscribers.clear()
             self.clear_tasks()
             self.clear_queue()
+            self._arbitrator.disable()
+            self._shutdown_executors()
             _nil = self.__close_message_bus()
             self._log.info('disabled: {}'.format(_nil))
 
@@ -688,7 +945,7 @@ class MessageBus(Component):
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class PeekableQueue(Queue):
     '''
-    Extends the asyncio Queue to add peek() and clear() methods.
+    Extends the asyncio Queue to add peek(), discard(), drain() and clear() methods.
     '''
     def __init__(self, level=Level.INFO):
         Queue.__init__(self, maxsize=0)
@@ -709,6 +966,39 @@ class PeekableQueue(Queue):
         self.put_nowait(_message)
         return _message
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def discard(self, message):
+        '''
+        Removes the message (by identity) from the queue without waiting,
+        also marking its task as done. Returns True if it was present.
+        '''
+        for _index, _queued in enumerate(self._queue):
+            if _queued is message:
+                del self._queue[_index]
+                self.task_done()
+                return True
+        return False
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def drain(self, f_accept, limit):
+        '''
+        Removes and returns up to 'limit' messages for which the filter
+        function returns True, in a single pass over the queue and without
+        waiting. The remaining messages retain their order. As with get(),
+        each removed message should be followed by a call to task_done().
+        '''
+        _drained = []
+        _kept    = []
+        for _message in self._queue:
+            if len(_drained) < limit and f_accept(_message):
+                _drained.append(_message)
+            else:
+                _kept.append(_message)
+        if _drained:
+            self._queue.clear()
+            self._queue.extend(_kept)
+        return _drained
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def clear(self):
         '''
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2019-12-23
-# modified: 2024-09-06
+# modified: 2026-10-18
 #
 
 from datetime import datetime as dt
@@ -38,9 +38,12 @@ class MessageFactory(Component):
         '''
         Create and return a new message with the supplied event and optional
         value. Not all event types are associated with a value.
+
+        The message's subscribers are those to which the message bus routes
+        it, i.e., excluding any whose value filters reject the value.
         '''
         _message = Message(event=event, value=value)
-        _message.set_subscribers(self._message_bus.subscribers)
+        _message.set_subscribers(self._message_bus.route(_message))
         return _message
 
 #EOF
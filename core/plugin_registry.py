@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# A registry of optional components, imported and constructed only if enabled
+# in the configuration.
+#
+
+import time
+import importlib
+from contextlib import nullcontext
+from collections import OrderedDict
+from colorama import init, Fore, Style
+init()
+
+from core.logger import Logger, Level
+
+# the optional components, by name: the 'kros.component' flag that enables
+# each, and the module and class that provides it
+PLUGINS = OrderedDict([
+    ( 'queue-publisher',     ( 'enable_queue_publisher',     'core.queue_publisher',                 'QueuePublisher' ) ),
+    ( 'clock-publisher',     ( 'enable_clock_publisher',     'core.clock_publisher',                 'ClockPublisher' ) ),
+    ( 'distance-sensors',    ( 'enable_distance_publisher',  'hardware.distance_sensors',            'DistanceSensors' ) ),
+    ( 'distance-publisher',  ( 'enable_distance_publisher',  'hardware.distance_sensors_publisher',  'DistanceSensorsPublisher' ) ),
+    ( 'distance-subscriber', ( 'enable_distance_subscriber', 'hardware.distance_sensors_subscriber', 'DistanceSensorsSubscriber' ) ),
+    ( 'behaviour-manager',   ( 'enable_behaviours',          'behave.behaviour_manager',             'BehaviourManager' ) ),
+])
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PluginRegistry(object):
+    '''
+    Imports and constructs optional components by name, but only if the
+    'kros.component' configuration flag of each is enabled (or if enabling
+    is forced, e.g., from a command line argument). A disabled component's
+    module is never imported, so that startup neither pays for nor fails on
+    hardware support that isn't in use, e.g., a missing pigpio library.
+
+    The time taken to import and construct each component is recorded, and
+    may be printed as a startup report.
+
+    :param config:    the application configuration
+    :param plugins:   the optional dict of plugins, by default PLUGINS
+    :param profiler:  the optional StartupProfiler, which times each plugin created as a phase
+    :param level:     the log level
+    '''
+    def __init__(self, config, plugins=None, profiler=None, level=Level.INFO):
+        if config is None:
+            raise ValueError('no configuration provided.')
+        self._log = Logger('plugins', level)
+        self._cfg = config['kros'].get('component')
+        self._plugins = PLUGINS if plugins is None else plugins
+        self._profiler = profiler
+        self._records = OrderedDict() # name: ( status, import_ms, construct_ms )
+        self._log.info('ready.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def is_enabled(self, name):
+        '''
+        Returns True if the configuration flag of the named plugin is enabled.
+
+        :param name:  the name of the plugin
+        '''
+        return bool(self._cfg.get(self._get_plugin(name)[0]))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def create(self, name, *args, force=False, **kwargs):
+        '''
+        If the named plugin is enabled, imports its module, constructs its
+        class with the remaining arguments and returns the instance;
+        otherwise returns None without importing anything.
+
+        :param name:   the name of the plugin
+        :param args:   the positional arguments of the constructor
+        :param force:  if True create the plugin even if its flag is disabled
+        :param kwargs: the keyword arguments of the constructor
+        '''
+        _flag, _module_name, _class_name = self._get_plugin(name)
+        if not ( force or self._cfg.get(_flag) ):
+            self._records[name] = ( 'disabled', None, None )
+            return None
+        with self._profiler.phase(name) if self._profiler else nullcontext():
+            _start = time.perf_counter()
+            _class = getattr(importlib.import_module(_module_name), _class_name)
+            _imported = time.perf_counter()
+            _instance = _class(*args, **kwargs)
+            _constructed = time.perf_counter()
+        self._records[name] = ( 'loaded', ( _imported - _start ) * 1000.0, ( _constructed - _imported ) * 1000.0 )
+        self._log.debug('created %s in %.2fms.', name, ( _constructed - _start ) * 1000.0)
+        return _instance
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_plugin(self, name):
+        _plugin = self._plugins.get(name)
+        if _plugin is None:
+            raise ValueError('unrecognised plugin: {}'.format(name))
+        return _plugin
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def loaded(self):
+        '''
+        Returns the names of the plugins that have been created.
+        '''
+        return [ _name for _name, _record in self._records.items() if _record[0] == 'loaded' ]
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_report(self):
+        '''
+        Prints each plugin, whether it was loaded, disabled or not requested,
+        with the time taken to import and construct those loaded.
+        '''
+        _total_ms = 0.0
+        self._log.info('plugins:')
+        for _name, ( _flag, _module_name, _class_name ) in self._plugins.items():
+            _status, _import_ms, _construct_ms = self._records.get(_name, ( 'not requested', None, None ))
+            if _status == 'loaded':
+                _total_ms += _import_ms + _construct_ms
+                self._log.info('  {:<20}'.format(_name) + Fore.GREEN + '{:<14}'.format(_status)
+                        + Fore.YELLOW + 'import: {:7.2f}ms; construct: {:7.2f}ms'.format(_import_ms, _construct_ms))
+            else:
+                self._log.info('  {:<20}'.format(_name) + Style.DIM + '{:<14}({}: {})'.format(_status, _flag, self._cfg.get(_flag)))
+        self._log.info('{:d} of {:d} plugins loaded in {:.2f}ms.'.format(len(self.loaded), len(self._plugins), _total_ms))
+
+#EOF
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Priority aging for events competing for a single resource, so that a steady
+# stream of high priority events cannot starve lower priority ones forever.
+#
+
+import time
+from colorama import init, Fore, Style
+init()
+
+from core.timing_stats import TimingStats
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PriorityAging(object):
+    '''
+    Tracks how long each Event has been waiting (i.e., present but passed
+    over in favour of a higher priority Event) and, if aging is enabled,
+    lowers its effective priority number in proportion to that wait, up to
+    a bound. As with Event priorities, a lower number is a higher priority.
+
+    The wait-time and starvation statistics are kept whether or not aging
+    is enabled, so that starvation can be measured before it is corrected.
+
+    A wait begins when an Event is first passed over; it ends when the Event
+    is served, or is forgotten if the Event has not been seen again within
+    the starvation threshold (i.e., the demand has gone away). Each wait
+    that exceeds the starvation threshold is counted once as a starvation.
+
+    Configuration, from the section dict provided:
+
+      aging:          if True enable priority aging (default False)
+      aging_rate:     priority units gained per second of waiting
+      max_aging:      the maximum number of priority units gained
+      starvation_ms:  the wait beyond which an event is considered starved
+
+    :param cfg:  the configuration section (may be None)
+    '''
+    def __init__(self, cfg):
+        _cfg = cfg or {}
+        self._enabled       = _cfg.get('aging', False)
+        self._rate          = _cfg.get('aging_rate', 100.0)
+        self._max_aging     = _cfg.get('max_aging', 90)
+        self._starvation_ms = _cfg.get('starvation_ms', 1000)
+        if self._rate < 0:
+            raise ValueError('expected a non-negative aging rate, not: {}'.format(self._rate))
+        if self._max_aging < 0:
+            raise ValueError('expected a non-negative maximum aging, not: {}'.format(self._max_aging))
+        self._waiting     = {} # event to [start time, last seen time, starved]
+        self._wait_stats  = {} # event to TimingStats
+        self._starvations = {} # event to count
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def enabled(self):
+        return self._enabled
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def effective_priority(self, event, now=None):
+        '''
+        Returns the priority of the Event less any aging accrued while it
+        has been waiting.
+
+        :param event:  the Event
+        :param now:    the optional current time as from time.perf_counter()
+        '''
+        if not self._enabled:
+            return event.priority
+        _entry = self._waiting.get(event)
+        if _entry is None:
+            return event.priority
+        _wait_sec = ( now if now is not None else time.perf_counter() ) - _entry[0]
+        return event.priority - min(self._max_aging, _wait_sec * self._rate)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def waiting(self, event, since=None):
+        '''
+        Notes that the Event has been passed over, beginning a wait if one
+        is not already in progress, and counting a starvation if the wait
+        has exceeded the threshold.
+
+        :param event:  the Event
+        :param since:  the optional time the Event arrived, as from time.perf_counter()
+        '''
+        _now = time.perf_counter()
+        _entry = self._waiting.get(event)
+        if _entry is None or ( _now - _entry[1] ) * 1000.0 > self._starvation_ms:
+            _entry = self._waiting[event] = [ since if since is not None else _now, _now, False ]
+        else:
+            _entry[1] = _now
+        if not _entry[2] and ( _now - _entry[0] ) * 1000.0 > self._starvation_ms:
+            _entry[2] = True
+            self._starvations[event] = self._starvations.get(event, 0) + 1
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def served(self, event, since=None):
+        '''
+        Notes that the Event has been served, ending any wait in progress
+        and recording its duration. If there was no wait in progress the
+        time since the Event arrived is recorded instead, if provided.
+
+        :param event:  the Event
+        :param since:  the optional time the Event arrived, as from time.perf_counter()
+        '''
+        _now = time.perf_counter()
+        _entry = self._waiting.pop(event, None)
+        if _entry is not None and ( _now - _entry[1] ) * 1000.0 <= self._starvation_ms:
+            since = _entry[0]
+            if not _entry[2] and ( _now - since ) * 1000.0 > self._starvation_ms:
+                self._starvations[event] = self._starvations.get(event, 0) + 1
+        if since is None:
+            return
+        _stats = self._wait_stats.get(event)
+        if _stats is None:
+            _stats = self._wait_stats[event] = TimingStats('{} wait'.format(event.name))
+        _stats.record(( _now - since ) * 1000.0)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def wait_stats(self):
+        '''
+        Returns a copy of the dict of wait-time TimingStats by Event.
+        '''
+        return dict(self._wait_stats)
+
+    @property
+    def starvation_counts(self):
+        '''
+        Returns a copy of the dict of starvation counts by Event.
+        '''
+        return dict(self._starvations)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def reset(self):
+        '''
+        Clears all waits in progress and all statistics.
+        '''
+        self._waiting.clear()
+        self._wait_stats.clear()
+        self._starvations.clear()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self, log, prefix):
+        '''
+        Prints the per-event wait-time and starvation statistics to the log.
+
+        :param log:     the Logger to print to
+        :param prefix:  the label for the first line
+        '''
+        log.info('{}:'.format(prefix) + Fore.YELLOW + '\taging {}; {} waiting; {} starved.'.format(
+                'enabled' if self._enabled else 'disabled', len(self._waiting), sum(self._starvations.values())))
+        for _event in sorted(set(self._wait_stats) | set(self._starvations), key=lambda e: e.priority):
+            _stats = self._wait_stats.get(_event)
+            log.info(Fore.YELLOW + '\t{}; {} starvations.'.format(
+                    _stats if _stats is not None else '{} wait: 0 samples'.format(_event.name),
+                    self._starvations.get(_event, 0)))
+
+#EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2021-10-11
-# modified: 2024-09-06
+# modified: 2026-10-18
 #
 
 import itertools
@@ -20,7 +20,9 @@ init()
 
 from core.dequeue import DeQueue
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.publisher import Publisher
+from core.rate import AsyncRate
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class QueuePublisher(Publisher):
@@ -46,10 +48,10 @@ class QueuePublisher(Publisher):
     '''
     def __init__(self, config, message_bus, message_factory, level=Level.INFO):
         Publisher.__init__(self, 'queue', config, message_bus, message_factory, suppressed=False, level=level)
-        _cfg = self._config['kros'].get('publisher').get('queue')
-        _loop_freq_hz  = _cfg.get('loop_freq_hz')
+        _cfg = ConfigSection.of(self._config, 'kros.publisher.queue')
+        _loop_freq_hz  = _cfg.loop_freq_hz
         self._log.info('queue publisher loop frequency: {:d}Hz'.format(_loop_freq_hz))
-        self._publish_delay_sec = 1.0 / _loop_freq_hz
+        self._rate     = AsyncRate(_loop_freq_hz, name='queue', level=level)
         self._queue    = DeQueue()
         self._counter  = itertools.count()
 #       globals.put('queue-publisher', self)
@@ -63,13 +65,13 @@ class QueuePublisher(Publisher):
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def put(self, message):
         if not self.enabled:
-            self._log.warning('message {} ignored: queue publisher disabled.'.format(message.name))
+            self._log.warning('message %s ignored: queue publisher disabled.', message.name)
         elif not self.is_active:
-            self._log.warning('message {} ignored: queue publisher inactive.'.format(message.name))
+            self._log.warning('message %s ignored: queue publisher inactive.', message.name)
         else:
             self._queue.put(message)
-            self._log.info('put message \'{}\' ({}) into queue ({:d} {})'.format(
-                    message.event.name, message.name, self._queue.size, 'item' if self._queue.size == 1 else 'items'))
+            self._log.info('put message \'%s\' (%s) into queue (%d %s)',
+                    message.event.name, message.name, self._queue.size, 'item' if self._queue.size == 1 else 'items')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def enable(self):
@@ -91,20 +93,22 @@ class QueuePublisher(Publisher):
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     async def _publisher_loop(self, f_is_enabled):
         self._log.info('starting queue publisher loop:\t' + Fore.YELLOW + ( '; (suppressed, type \'m\' to release)' if self.suppressed else '(released)') )
+        self._rate.reset()
         while f_is_enabled():
             _count = next(self._counter)
-            self._log.debug('[{:03d}] begin publisher loop…'.format(_count))
+            self._log.debug('[%03d] begin publisher loop…', _count)
             if not self.suppressed:
                 while not self._queue.empty:
                     _message = self._queue.poll()
                     await Publisher.publish(self, _message)
-                    self._log.info('[{:03d}] published message '.format(_count)
-                            + Fore.WHITE + '{} '.format(_message.name)
-                            + Fore.CYAN + 'for event \'{}\' with group \'{}\' and value: '.format(_message.event.name, _message.event.group.name)
-                            + Fore.YELLOW + '{}'.format(_message.payload.value))
+                    self._log.info('[%03d] published message '
+                            + Fore.WHITE + '%s '
+                            + Fore.CYAN + 'for event \'%s\' with group \'%s\' and value: '
+                            + Fore.YELLOW + '%s', _count, _message.name, _message.event.name, _message.event.group.name, _message.payload.value)
             else:
                 self._log.info('suppressed.')
-            await asyncio.sleep(self._publish_delay_sec)
+            await self._rate.wait()
+        self._rate.print_statistics()
         self._log.info('publisher loop complete.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -7,10 +7,11 @@
 #
 # author:   Murray Altheim
 # created:  2020-08-23
-# modified: 2024-08-07 - using time.perf_counter()
+# modified: 2026-10-18 - added AsyncRate
 #
 
 import time
+import asyncio
 from colorama import init, Fore, Style
 init()
 
@@ -132,4 +133,145 @@ class Rate():
                 self._log.debug('no additional delay in rate loop (diff: {:7.4f}ms)'.format(_diff * 1000.0))
             self._last_time = time.perf_counter()
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class AsyncRate():
+    '''
+    The asyncio counterpart to Rate, for use within a coroutine: awaiting
+    wait() yields to the event loop rather than blocking it.
+
+    Unlike a fixed asyncio.sleep(delay), which ignores how long the loop
+    body took and so drifts, each wait is until an absolute deadline on the
+    event loop's clock, the deadlines being fixed multiples of the period
+    from the first call. If the loop body overruns one or more deadlines
+    the overrun is counted and the missed periods are skipped (rather than
+    run back-to-back to catch up), so the loop stays in phase.
+
+    The period jitter (the difference between the actual and nominal time
+    between successive wakes) is accumulated into a histogram.
+
+    E.g.:
+
+        # execute loop at 20Hz
+        rate = AsyncRate(20)
+
+        while True:
+            # do something...
+            await rate.wait()
+
+    :param hertz:    the frequency of the loop in Hertz
+    :param name:     the name used for logging
+    :param level:    the log level
+    :param bins_ms:  (optional) the upper bounds of the jitter histogram bins in milliseconds
+    '''
+    JITTER_BINS_MS = [ 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0 ]
+
+    def __init__(self, hertz, name='async', level=Level.INFO, bins_ms=None):
+        if hertz <= 0:
+            raise ValueError('expected a positive frequency, not: {}'.format(hertz))
+        self._log = Logger('{}-rate'.format(name), level)
+        self._period_sec = 1.0 / hertz
+        self._bins_ms    = sorted(bins_ms) if bins_ms is not None else AsyncRate.JITTER_BINS_MS
+        self._log.info('async rate set for {:5.2f}Hz (period: {:>6.4f}sec)'.format(hertz, self._period_sec))
+        self.reset()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def reset(self):
+        '''
+        Clears the statistics and restarts the schedule upon the next wait().
+        '''
+        self._deadline  = None
+        self._last_wake = None
+        self._count     = 0
+        self._overruns  = 0
+        self._skipped   = 0
+        self._histogram = [0] * ( len(self._bins_ms) + 1 ) # last bin is overflow
+        self._max_jitter_ms = 0.0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def period_sec(self):
+        return self._period_sec
+
+    @property
+    def count(self):
+        '''
+        The number of completed waits.
+        '''
+        return self._count
+
+    @property
+    def overruns(self):
+        '''
+        The number of waits called after their deadline had already passed.
+        '''
+        return self._overruns
+
+    @property
+    def skipped(self):
+        '''
+        The total number of periods skipped due to overruns.
+        '''
+        return self._skipped
+
+    @property
+    def max_jitter_ms(self):
+        return self._max_jitter_ms
+
+    @property
+    def jitter_histogram(self):
+        '''
+        Returns the jitter histogram as a list of (upper bound in ms, count)
+        tuples, the final bound being None for the overflow bin.
+        '''
+        return list(zip(self._bins_ms + [None], self._histogram))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def wait(self):
+        '''
+        Waits until the next deadline. The first call establishes the
+        schedule, waiting one full period.
+        '''
+        _loop = asyncio.get_running_loop()
+        _now  = _loop.time()
+        if self._deadline is None:
+            self._deadline = _now + self._period_sec
+        else:
+            self._deadline += self._period_sec
+        if _now >= self._deadline:
+            # overrun: skip any missed periods to stay in phase
+            _missed = int(( _now - self._deadline ) / self._period_sec) + 1
+            self._overruns += 1
+            self._skipped  += _missed - 1
+            self._deadline += ( _missed - 1 ) * self._period_sec
+            await asyncio.sleep(0) # still yield to the event loop
+        else:
+            await asyncio.sleep(self._deadline - _now)
+        _wake = _loop.time()
+        if self._last_wake is not None:
+            self._record_jitter(( _wake - self._last_wake - self._period_sec ) * 1000.0)
+        self._last_wake = _wake
+        self._count += 1
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _record_jitter(self, jitter_ms):
+        _abs_ms = abs(jitter_ms)
+        if _abs_ms > self._max_jitter_ms:
+            self._max_jitter_ms = _abs_ms
+        for _index, _bound in enumerate(self._bins_ms):
+            if _abs_ms <= _bound:
+                self._histogram[_index] += 1
+                return
+        self._histogram[-1] += 1
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self):
+        '''
+        Prints the wait count, overruns and jitter histogram.
+        '''
+        self._log.info('rate:' + Fore.YELLOW + '\t{:d} waits; {:d} overruns; {:d} periods skipped; max jitter: {:.2f}ms'.format(
+                self._count, self._overruns, self._skipped, self._max_jitter_ms))
+        self._log.info('jitter:' + Fore.YELLOW + '\t' + '; '.join('{}{}: {:d}'.format(
+                '≤' if _bound is not None else '>', _bound if _bound is not None else self._bins_ms[-1], _count)
+                for _bound, _count in self.jitter_histogram))
+
 #EOF
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Times the phases of startup and the import of each module. This imports
+# only from the standard library, so that it may be imported first.
+#
+
+import sys
+import json
+import time
+import platform
+from contextlib import contextmanager, nullcontext
+from importlib.abc import MetaPathFinder
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class _TimedLoader(object):
+    '''
+    Wraps the loader of a module so that the time taken to create and
+    execute the module is reported to the ImportTimer. Any other attribute
+    is that of the wrapped loader.
+    '''
+    def __init__(self, loader, name, timer):
+        self._loader = loader
+        self._name   = name
+        self._timer  = timer
+
+    def create_module(self, spec):
+        self._timer.enter(self._name)
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._timer.leave(self._name)
+
+    def exec_module(self, module):
+        self._timer.enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ImportTimer(MetaPathFinder):
+    '''
+    A finder placed first on sys.meta_path that finds nothing itself but
+    wraps the loader of each module found by the other finders, recording
+    for each module imported the module that imported it, its cumulative
+    time (including the modules it imports) and its self time, much as
+    'python -X importtime', but from within the process.
+    '''
+    def __init__(self):
+        self._stack   = [] # [ name, start, child time ]
+        self._modules = {} # name: [ parent, cumulative sec, self sec ]
+        self._order   = []
+        self._finding = False
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def find_spec(self, fullname, path=None, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for _finder in sys.meta_path:
+                if _finder is self or not hasattr(_finder, 'find_spec'):
+                    continue
+                _spec = _finder.find_spec(fullname, path, target)
+                if _spec is not None:
+                    if _spec.loader is not None and hasattr(_spec.loader, 'exec_module') \
+                            and not isinstance(_spec.loader, _TimedLoader):
+                        _spec.loader = _TimedLoader(_spec.loader, fullname, self)
+                    return _spec
+            return None
+        finally:
+            self._finding = False
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def enter(self, name):
+        self._stack.append([ name, time.perf_counter(), 0.0 ])
+
+    def leave(self, name):
+        _name, _start, _child_sec = self._stack.pop()
+        _elapsed_sec = time.perf_counter() - _start
+        if self._stack:
+            self._stack[-1][2] += _elapsed_sec
+        _parent = self._stack[-1][0] if self._stack else None
+        _module = self._modules.get(name)
+        if _module is None:
+            self._modules[name] = [ _parent, _elapsed_sec, _elapsed_sec - _child_sec ]
+            self._order.append(name)
+        else: # create then exec
+            _module[1] += _elapsed_sec
+            _module[2] += _elapsed_sec - _child_sec
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def modules(self):
+        '''
+        Returns a list of ( name, parent, cumulative ms, self ms ) for each
+        module imported, in the order in which their imports completed.
+        '''
+        return [ ( _name, self._modules[_name][0], self._modules[_name][1] * 1000.0, self._modules[_name][2] * 1000.0 )
+                for _name in self._order ]
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class StartupProfiler(object):
+    '''
+    Times named, possibly nested, phases of startup and, from its creation
+    until stopped, the import of each module. A disabled profiler records
+    nothing and its phases cost almost nothing, so that it need not be
+    tested for before each use.
+
+    Phases are used as context managers:
+
+        with profiler.phase('read config'):
+            …
+
+    A nested phase is named by the path of its enclosing phases, e.g.,
+    'configure/read config'. Alternately, a sequence of steps within a
+    phase may be timed by calling lap() at the end of each step, e.g.,
+    profiler.lap('read config'), which records the time since the start
+    of the phase or the previous lap.
+
+    :param enabled:  if True record phases and install the import timer
+    '''
+    def __init__(self, enabled=False):
+        self._enabled    = enabled
+        self._start_time = time.perf_counter()
+        self._end_time   = None
+        self._path       = [] # [ name, time of start or last lap ]
+        self._last_lap   = self._start_time # at the top level
+        self._phases     = [] # ( path, start ms, duration ms )
+        self._importer   = None
+        if self._enabled:
+            self._importer = ImportTimer()
+            self._importer.install()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def enabled(self):
+        return self._enabled
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def phase(self, name):
+        '''
+        Returns a context manager timing the named phase.
+
+        :param name:  the name of the phase
+        '''
+        if not self._enabled or self._end_time is not None:
+            return nullcontext()
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        _start = time.perf_counter()
+        self._path.append([ name, _start ])
+        _path  = self._get_path()
+        try:
+            yield
+        finally:
+            _end = time.perf_counter()
+            self._path.pop()
+            if self._path:
+                self._path[-1][1] = _end
+            else:
+                self._last_lap = _end
+            self._phases.append(( _path, ( _start - self._start_time ) * 1000.0, ( _end - _start ) * 1000.0 ))
+
+    def _get_path(self, name=None):
+        _names = [ _item[0] for _item in self._path ]
+        if name is not None:
+            _names.append(name)
+        return '/'.join(_names)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def lap(self, name):
+        '''
+        Records the time since the start of the current phase, or since the
+        previous lap within it, as a step of the phase.
+
+        :param name:  the name of the step
+        '''
+        if self._enabled and self._end_time is None:
+            _now = time.perf_counter()
+            if self._path:
+                _start = self._path[-1][1]
+                self._path[-1][1] = _now
+            else:
+                _start = self._last_lap
+                self._last_lap = _now
+            self._phases.append(( self._get_path(name), ( _start - self._start_time ) * 1000.0, ( _now - _start ) * 1000.0 ))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def record(self, name, duration_ms):
+        '''
+        Records a phase timed elsewhere as nested within the current phase.
+
+        :param name:         the name of the phase
+        :param duration_ms:  its duration in milliseconds
+        '''
+        if self._enabled and self._end_time is None:
+            _path = self._get_path(name)
+            self._phases.append(( _path, ( time.perf_counter() - self._start_time ) * 1000.0 - duration_ms, duration_ms ))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def stop(self):
+        '''
+        Stops profiling, removing the import timer. Phases begun after this
+        are not recorded.
+        '''
+        if self._enabled and self._end_time is None:
+            self._end_time = time.perf_counter()
+            self._importer.uninstall()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def total_ms(self):
+        _end_time = self._end_time if self._end_time is not None else time.perf_counter()
+        return ( _end_time - self._start_time ) * 1000.0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def to_dict(self):
+        '''
+        Returns the profile as a dict, suitable for writing as JSON.
+        '''
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'python':    platform.python_version(),
+            'machine':   platform.machine(),
+            'total_ms':  round(self.total_ms, 3),
+            'phases':    [ { 'name': _path, 'start_ms': round(_start_ms, 3), 'ms': round(_ms, 3) }
+                    for _path, _start_ms, _ms in self._phases ],
+            'imports':   [ { 'module': _name, 'parent': _parent, 'ms': round(_cumulative_ms, 3), 'self_ms': round(_self_ms, 3) }
+                    for _name, _parent, _cumulative_ms, _self_ms in ( self._importer.modules if self._importer else [] ) ]
+        }
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def write_json(self, path):
+        '''
+        Writes the profile as JSON to the file at the path.
+
+        :param path:  the path of the file
+        '''
+        with open(path, 'w', encoding='utf-8') as _file:
+            json.dump(self.to_dict(), _file, indent=2)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_report(self, log, limit=20, min_import_ms=1.0, max_depth=3):
+        '''
+        Prints the phases, longest first, then the tree of imports, each
+        module's children sorted longest first.
+
+        :param log:            the Logger to print to
+        :param limit:          the maximum number of phases listed
+        :param min_import_ms:  imports quicker than this are not listed
+        :param max_depth:      the maximum depth of the import tree listed
+        '''
+        _total_ms = max(self.total_ms, 1e-9)
+        log.info('startup profile:' + '\t{:.1f}ms total.'.format(_total_ms))
+        for _path, _start_ms, _ms in sorted(self._phases, key=lambda phase: phase[2], reverse=True)[:limit]:
+            log.info('  {:<44} {:9.2f}ms {:5.1f}%  (at {:.1f}ms)'.format(_path, _ms, 100.0 * _ms / _total_ms, _start_ms))
+        if not self._importer:
+            return
+        _modules  = self._importer.modules
+        _children = {}
+        for _name, _parent, _cumulative_ms, _self_ms in _modules:
+            _children.setdefault(_parent, []).append(( _name, _cumulative_ms, _self_ms ))
+        log.info('imports:' + '\t{:d} modules in {:.1f}ms (cumulative; self).'.format(
+                len(_modules), sum(_item[1] for _item in _children.get(None, []))))
+        def _print_tree(parent, depth):
+            for _name, _cumulative_ms, _self_ms in sorted(_children.get(parent, []), key=lambda item: item[1], reverse=True):
+                if _cumulative_ms < min_import_ms:
+                    break
+                log.info('  {:<44} {:9.2f}ms {:8.2f}ms'.format('  ' * depth + _name, _cumulative_ms, _self_ms))
+                if depth + 1 < max_depth:
+                    _print_tree(_name, depth + 1)
+        _print_tree(None, 0)
+
+#EOF
@@ -7,11 +7,12 @@
 #
 # author:   Murray Altheim
 # created:  2021-03-10
-# modified: 2021-06-29
+# modified: 2026-10-18
 #
 
 import asyncio
 import random
+import time
 import traceback
 from asyncio import CancelledError
 #from typing import final
@@ -26,11 +27,14 @@ from core.event import Event, Group
 from core.message import Message
 from core.fsm import FiniteStateMachine, State
 from core.message_bus import MessageBus
+from core.timing_stats import TimingStats
+from core.value_filter import ValueFilter
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class Subscriber(Component, FiniteStateMachine):
 
     LOG_INDENT = ( ' ' * 60 ) + Fore.CYAN + ': ' + Fore.CYAN
+    OFFLOAD    = None # may be declared by subclasses as 'thread' or 'process'
 
     '''
     Extends Component and FiniteStateMachine as a subscriber to messages
@@ -66,11 +70,44 @@ class Subscriber(Component, FiniteStateMachine):
         Component.__init__(self, self._log, suppressed, enabled)
         FiniteStateMachine.__init__(self, self._log, self._name)
         self._events = [] # list of acceptable event types
+        self._value_filters  = {} # dict of event to list of value filters
+        self._filtered_count = 0  # messages not routed to this subscriber
         self._brief  = True # brief messages by default
         self._message_bus.register_subscriber(self)
         self._permit_resend = False
+        _cfg = self._get_subscriber_config()
+        self._batch_size = _cfg.get('batch_size', 1) # 1 disables batch mode
+        if not isinstance(self._batch_size, int) or self._batch_size < 1:
+            raise ValueError('expected batch size as a positive int, not: {}'.format(self._batch_size))
+        self._max_in_flight = _cfg.get('max_in_flight', 1)
+        if not isinstance(self._max_in_flight, int) or self._max_in_flight < 1:
+            raise ValueError('expected max in flight as a positive int, not: {}'.format(self._max_in_flight))
+        self._inbox         = None # created with the workers
+        self._workers       = []
+        self._in_flight     = 0
+        self._offload       = _cfg.get('offload', self.OFFLOAD)
+        if self._offload not in (None, 'thread', 'process'):
+            raise ValueError('expected offload as \'thread\' or \'process\', not: {}'.format(self._offload))
+        self._computes      = type(self).compute is not Subscriber.compute
+        if self._offload == 'process' and not self._computes:
+            raise ValueError('\'process\' offload of {} requires compute() to be implemented.'.format(self._name))
+        self._queue_stats   = TimingStats('queue time')
+        self._service_stats = TimingStats('service time')
 #       self._log.info(Fore.BLACK + 'ready (superclass).')
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_subscriber_config(self):
+        '''
+        Returns the configuration for this subscriber, being the 'default'
+        section of 'kros.subscriber' overlaid by any section whose key
+        matches the name of this subscriber. Returns an empty dict if
+        neither exists.
+        '''
+        _cfg = self._config['kros'].get('subscriber') or {}
+        _sub_cfg = dict(_cfg.get('default') or {})
+        _sub_cfg.update(_cfg.get(self._name) or {})
+        return _sub_cfg
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def permit_resend(self):
         '''
@@ -103,6 +140,59 @@ class Subscriber(Component, FiniteStateMachine):
     def is_gc(self):
         return False
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def batch_size(self):
+        '''
+        Returns the maximum number of messages consumed in a single pass.
+        A value of 1 indicates batch mode is disabled.
+        '''
+        return self._batch_size
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def max_in_flight(self):
+        '''
+        Returns the number of worker coroutines, i.e., the maximum number of
+        messages (or batches) this subscriber will process concurrently.
+        '''
+        return self._max_in_flight
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def offload(self):
+        '''
+        Returns the executor offload mode for compute(): 'thread', 'process',
+        or None if it runs on the event loop. process_message() always runs
+        on the event loop. This is declared by the OFFLOAD class attribute,
+        overridden by the 'offload' configuration.
+        '''
+        return self._offload
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def in_flight(self):
+        '''
+        Returns the number of messages (or batches) currently being processed.
+        '''
+        return self._in_flight
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def queue_stats(self):
+        '''
+        Returns the statistics on time spent by messages waiting in the inbox.
+        '''
+        return self._queue_stats
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def service_stats(self):
+        '''
+        Returns the statistics on time spent by workers processing messages.
+        '''
+        return self._service_stats
+
     # events ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     @property
@@ -142,6 +232,48 @@ class Subscriber(Component, FiniteStateMachine):
         self._events.append(event)
 #       self._log.debug('added \'{}\' event to subscriber {} ({:d} events).'.format(event.name, self._name, len(self._events)))
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def add_value_filter(self, event, value_filter):
+        '''
+        Adds a predicate on the payload value of messages with the given event.
+        When routing a message the message bus only includes this subscriber
+        among its recipients if all filters for its event accept the value,
+        so rejected messages are neither delivered to nor acknowledged by
+        this subscriber.
+
+        :param event:         the Event whose values are filtered
+        :param value_filter:  the ValueFilter, e.g., Threshold(below=100)
+        '''
+        if not isinstance(event, Event):
+            raise TypeError('expected Event argument, not {}'.format(type(event)))
+        if not isinstance(value_filter, ValueFilter):
+            raise TypeError('expected ValueFilter argument, not {}'.format(type(value_filter)))
+        self._value_filters.setdefault(event, []).append(value_filter)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def accepts_value(self, payload):
+        '''
+        Called by the message bus when routing a message, returns True if
+        every value filter registered for the payload's event accepts its
+        value, or if there are none.
+        '''
+        _filters = self._value_filters.get(payload.event)
+        if _filters:
+            for _filter in _filters:
+                if not _filter.accept(payload.value):
+                    self._filtered_count += 1
+                    return False
+        return True
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def filtered_count(self):
+        '''
+        Returns the number of messages not routed to this subscriber due to
+        a value filter.
+        '''
+        return self._filtered_count
+
     def print_events(self):
         if self._events == [Event.ANY]:
             return '[ANY]'
@@ -174,16 +306,21 @@ class Subscriber(Component, FiniteStateMachine):
         Awaits a message on the message bus, first peeking at it from the queue,
         filtering on event type.
 
-        Kick off various tasks to consume (process) the message by first creating
-        an asyncio event. Tasks are then created to process the message followed
-        by a cleanup task. If the latter is overridden it should also called
-        by the subclass method as it flags the message as expired. Once these
-        tasks have been created the asyncio event flag is set, indicating that
-        the message has been consumed, and can subsequently garbage collected.
+        Kick off the consumption (processing) of the message by first creating
+        an asyncio event. The message is then put into this subscriber's inbox,
+        from which one of its worker coroutines processes the message followed
+        by its cleanup. If the latter is overridden it should also called by
+        the subclass method as it flags the message as expired. Once queued
+        the asyncio event flag is set, indicating that the message has been
+        consumed, and can subsequently garbage collected.
 
         This method is not meant to be overridden, except by the garbage
         collector. The process_message() method can be overridden.
+
+        If the batch size is greater than one this defers to _consume_batch().
         '''
+        if self._batch_size > 1:
+            return await self._consume_batch()
         try:
 
 #           self._log.debug('consume() called on {}.'.format(self.name))
@@ -194,11 +331,12 @@ class Subscriber(Component, FiniteStateMachine):
                 raise GarbageCollectedError('{} cannot consume: message has been garbage collected. [1]'.format(self.name))
     
 #           self._log.debug('consume() continuing for {}…'.format(self.name))
-            _ackd = _peeked_message.acknowledged_by(self)
+            # a message not routed to this subscriber is treated as acknowledged
+            _ackd = not _peeked_message.expects(self) or _peeked_message.acknowledged_by(self)
             if not _ackd and self.acceptable(_peeked_message):
                 _event = asyncio.Event()
                 self._log.debug(Fore.RED + 'begin event tracking for message:' + Fore.WHITE
-                        + ' {}; event: {}'.format(_peeked_message.name, _peeked_message.event.name))
+                        + ' %s; event: %s', _peeked_message.name, _peeked_message.event.name)
     
                 # acknowledge we've seen the message
                 _peeked_message.acknowledge(self)
@@ -207,8 +345,10 @@ class Subscriber(Component, FiniteStateMachine):
 #               self._log.debug('waiting to consume acceptable message:'
 #                       + Fore.WHITE + ' {}; event: {}'.format(_peeked_message.name, _peeked_message.event.name))
     
-                _message = await self._message_bus.consume_message()
-                self._message_bus.consumed()
+                # take the peeked message itself from the queue, holding it until completed
+                _message = _peeked_message
+                self._message_bus.remove_message(_message)
+                _message.hold(self)
 #               if self._message_bus.verbose:
 #                   self._log.debug('consumed acceptable message:' + Fore.WHITE + ' {}; event: {}'.format(_message.name, _message.event.name))
     
@@ -216,13 +356,8 @@ class Subscriber(Component, FiniteStateMachine):
                 if self._message_bus.verbose:
                     _elapsed_ms = (dt.now() - _message.timestamp).total_seconds() * 1000.0
                     self._print_message_info('process message:', _message, _elapsed_ms)
-#               self._log.debug('creating task for processing message:' + Fore.WHITE + ' {}; event: {}'.format(_message.name, _message.event.name))
-                # create message processing task
-                asyncio.create_task(self.process_message(_message), name='{}:process-message-{}'.format(self.name, _message.name))
-    
-                # create message cleanup task
-                _cleanup_task = asyncio.create_task(self._cleanup_message(_message), name='{}:cleanup-message-{}'.format(self.name, _message.name))
-                _cleanup_task.add_done_callback(self._done_callback)
+                # queue message for processing and cleanup by a worker
+                self._dispatch([_message])
     
 #               breakpoint()
     
@@ -230,47 +365,212 @@ class Subscriber(Component, FiniteStateMachine):
                 _event.set()
     
                 # we've handled message so pass along to arbitrator
-                if _message.sent == 0:
-                    self._log.debug('sending message: {}; event: {} to arbitrator…'.format(_message.name, _message.event.name))
-                    await self._arbitrate_message(_message)
-                    self._log.debug('message:' + Fore.WHITE + ' {}; event: {} sent to arbitrator; sent? {}'.format(_message.name, _message.event.name, _message.sent))
-                    if _message.sent > 0:
-                        self._log.debug('message:' + Fore.WHITE + ' {}; event: {} already sent'.format(_message.name, _message.event.name))
-                        return
-                elif _message.sent == -1:
-                    self._log.info('dont arbitrate, just republish message: {}; event: {}.'.format(_message.name, _message.event.name))
-                    # don't arbitrate, just keep republishing this message
-                    pass
-                elif not self._permit_resend:
-#                   self._log.warning('message: {} already sent; event: {}'.format(_message.name, _message.event.name))
-                    self._log.info('message: {} already sent; event: {}'.format(_message.name, _message.event.name))
-    
-#               # keep track of timestamp of last message
-#               self._log.debug('last message timestamp: {}'.format(_message.timestamp))
-#               self._message_bus.last_message_timestamp = _message.timestamp
-                # republish the message
-#               self._log.debug('awaiting republication of message:' \
-#                   + Fore.WHITE + ' {}; event: {}'.format(_message.name, _message.event.name))
-                await self._message_bus.republish_message(_message)
-#               self._log.debug('message:' + Fore.WHITE + ' {} with event: {}'.format(_message.name, _message.event.name) + ' has been republished.')
+                await self._arbitrate_or_republish(_message)
     
             elif not _ackd:
                 # if not already ack'd, acknowledge we've seen the message
 #               self._log.debug('acknowledging unacceptable message:' + Fore.WHITE + ' {}; event: {} (queue: {:d} elements)'.format(
 #                       _peeked_message.name, _peeked_message.event.name, self._message_bus.queue_size))
                 _peeked_message.acknowledge(self)
+                self._message_bus.complete(_peeked_message, self)
 #           self._log.debug('consume() complete on {}.'.format(self.name))
 
         except Exception as e:
             self._log.error('{} thrown during consume: {}\n{}'.format(type(e), e, traceback.format_exc()))
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _done_callback(self, task):
+    async def _consume_batch(self):
         '''
-        Signal the message bus callback has completed.
+        The batch (or "drain") mode variant of consume(). Once woken by a
+        message on the bus this takes every message currently on the queue
+        that is acceptable to and not yet acknowledged by this subscriber,
+        up to the batch size, in a single pass.
+
+        The batch is queued to the inbox as a single item, to be processed by
+        a worker via process_messages() followed by a single cleanup, after
+        which each message is passed along to the arbitrator or republished
+        just as in consume().
         '''
-        self._message_bus.clear_tasks()
-#       self._log.debug('callback on cleanup task complete; {}'.format(task.get_name()))
+        try:
+
+            _peeked_message = await self._message_bus.peek_message()
+            if not _peeked_message:
+                raise QueueEmptyOnPeekError('peek returned none.')
+            elif _peeked_message.gcd:
+                raise GarbageCollectedError('{} cannot consume: message has been garbage collected. [2]'.format(self.name))
+
+            _messages = self._message_bus.drain_messages(self._accepts_unseen, self._batch_size)
+            if _peeked_message.expects(self) and not _peeked_message.acknowledged_by(self) \
+                    and not self.acceptable(_peeked_message):
+                # acknowledge we've seen the unacceptable message
+                _peeked_message.acknowledge(self)
+                self._message_bus.complete(_peeked_message, self)
+            if not _messages:
+                return
+            for _message in _messages:
+                # acknowledge we've seen the message
+                _message.acknowledge(self)
+                _message.hold(self)
+                self._message_bus.consumed()
+                if self._message_bus.verbose:
+                    _elapsed_ms = (dt.now() - _message.timestamp).total_seconds() * 1000.0
+                    self._print_message_info('process message:', _message, _elapsed_ms)
+            self._log.debug('consumed batch of %d message%s.', len(_messages), '' if len(_messages) == 1 else 's')
+
+            # queue batch for processing and cleanup by a worker
+            self._dispatch(_messages)
+
+            # we've handled the messages so pass each along to arbitrator
+            for _message in _messages:
+                await self._arbitrate_or_republish(_message)
+
+        except Exception as e:
+            self._log.error('{} thrown during batch consume: {}\n{}'.format(type(e), e, traceback.format_exc()))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _accepts_unseen(self, message):
+        '''
+        A filter used when draining the queue, returning True if the message
+        has not been garbage collected, was routed to but has not already been
+        acknowledged by this subscriber, and is acceptable.
+        '''
+        return not message.gcd and message.expects(self) and not message.acknowledged_by(self) and self.acceptable(message)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _arbitrate_or_republish(self, message):
+        '''
+        Having consumed the message, pass its payload along to the arbitrator
+        if it has not yet been sent, otherwise republish it.
+        '''
+        if message.sent == 0:
+            self._log.debug('sending message: %s; event: %s to arbitrator…', message.name, message.event.name)
+            await self._arbitrate_message(message)
+            self._log.debug('message:' + Fore.WHITE + ' %s; event: %s sent to arbitrator; sent? %s', message.name, message.event.name, message.sent)
+            if message.sent > 0:
+                self._log.debug('message:' + Fore.WHITE + ' %s; event: %s already sent', message.name, message.event.name)
+                return
+        elif message.sent == -1:
+            self._log.info('dont arbitrate, just republish message: %s; event: %s.', message.name, message.event.name)
+            # don't arbitrate, just keep republishing this message
+            pass
+        elif not self._permit_resend:
+#           self._log.warning('message: {} already sent; event: {}'.format(message.name, message.event.name))
+            self._log.info('message: %s already sent; event: %s', message.name, message.event.name)
+
+#       # keep track of timestamp of last message
+#       self._log.debug('last message timestamp: {}'.format(message.timestamp))
+#       self._message_bus.last_message_timestamp = message.timestamp
+        # republish the message
+#       self._log.debug('awaiting republication of message:' \
+#           + Fore.WHITE + ' {}; event: {}'.format(message.name, message.event.name))
+        await self._message_bus.republish_message(message)
+#       self._log.debug('message:' + Fore.WHITE + ' {} with event: {}'.format(message.name, message.event.name) + ' has been republished.')
+
+    # workers ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+
+    def _dispatch(self, messages):
+        '''
+        Puts the list of consumed messages into the inbox, timestamped so that
+        its queue time can be measured, starting the workers if necessary.
+        In batch mode the list is handled as a single item.
+
+        :param messages:  the list of consumed messages
+        '''
+        if not self._workers:
+            self._start_workers()
+        self._inbox.put_nowait((time.perf_counter(), messages))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _start_workers(self):
+        '''
+        Creates the inbox and the pool of long-lived worker coroutines, the
+        latter named with a '__' prefix so they're not cancelled by the
+        message bus' clear_tasks().
+        '''
+        self._inbox = asyncio.Queue()
+        for _index in range(self._max_in_flight):
+            self._workers.append(asyncio.create_task(self._worker_loop(), name='__{}:worker-{:d}'.format(self.name, _index)))
+        self._log.debug('started %d worker%s.', self._max_in_flight, '' if self._max_in_flight == 1 else 's')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _stop_workers(self):
+        '''
+        Cancels the worker coroutines. Any messages remaining in the inbox
+        are completed unprocessed, releasing this subscriber's hold on each
+        so that they may be retired (or expire) as usual.
+        '''
+        if self._workers:
+            for _worker in self._workers:
+                _worker.cancel()
+            self._workers.clear()
+            while not self._inbox.empty():
+                _queued_time, _messages = self._inbox.get_nowait()
+                for _message in _messages:
+                    self._message_bus.complete(_message, self)
+                self._inbox.task_done()
+            self._inbox = None
+            self._log.debug('stopped workers.')
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _worker_loop(self):
+        '''
+        The worker coroutine: repeatedly takes an item from the inbox, then
+        processes and cleans up its message(s), recording the time the item
+        waited in the inbox and the time taken to service it. An exception
+        thrown while processing is logged and the worker continues.
+        '''
+        _inbox = self._inbox
+        while True:
+            _queued_time, _messages = await _inbox.get()
+            _start_time = time.perf_counter()
+            self._queue_stats.record((_start_time - _queued_time) * 1000.0)
+            self._in_flight += 1
+            try:
+                if self._batch_size > 1:
+                    await self.process_messages(_messages)
+                else:
+                    await self.process_message(_messages[0])
+                if self._computes:
+                    for _message in _messages:
+                        await self._compute(_message)
+                if self._batch_size > 1:
+                    await self._cleanup_messages(_messages)
+                else:
+                    await self._cleanup_message(_messages[0])
+            except CancelledError:
+                raise
+            except Exception as e:
+                self._log.error('{} thrown processing message: {}\n{}'.format(type(e), e, traceback.format_exc()))
+            finally:
+                for _message in _messages:
+                    self._message_bus.complete(_message, self)
+                self._in_flight -= 1
+                self._service_stats.record((time.perf_counter() - _start_time) * 1000.0)
+                _inbox.task_done()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _compute(self, message):
+        '''
+        Calls compute() with the message's payload, in the message bus'
+        executor if offloaded, then passes the result to on_computed() back
+        on the event loop.
+        '''
+        if self._offload:
+            _result = await self._message_bus.run_offloaded(self._offload, self.compute, message.payload)
+        else:
+            _result = self.compute(message.payload)
+        await self.on_computed(message, _result)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def print_statistics(self):
+        '''
+        Prints the worker pool queue-time and service-time statistics.
+        '''
+        self._log.info('{}:'.format(self.name) + Fore.YELLOW + '\t{:d} worker{}; {:d} in flight; {:d} queued; {:d} filtered.'.format(
+                self._max_in_flight, '' if self._max_in_flight == 1 else 's', self._in_flight,
+                self._inbox.qsize() if self._inbox else 0, self._filtered_count))
+        self._log.info(Fore.YELLOW + '\t{}'.format(self._queue_stats))
+        self._log.info(Fore.YELLOW + '\t{}'.format(self._service_stats))
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     async def process_message(self, message):
@@ -291,6 +591,49 @@ class Subscriber(Component, FiniteStateMachine):
         message.process(self)
 #       self._log.debug('processed message {}'.format(message.name))
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def process_messages(self, messages):
+        '''
+        Process a batch of messages consumed in a single pass when in batch
+        mode, in the order they were taken from the queue.
+
+        This may be overridden by subclasses that can make use of an entire
+        batch at once, e.g., to aggregate sensor readings. An override must
+        still mark each message as processed, either by calling this method
+        or Subscriber.process_message() on each. By default this calls
+        process_message() on each message.
+
+        :param messages:  the list of messages to process.
+        '''
+        for _message in messages:
+            await self.process_message(_message)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def compute(payload):
+        '''
+        An optional hook for CPU-bound work on each processed message's
+        payload, called by a worker after process_message(). If the subscriber
+        is offloaded this runs in the message bus' thread or process pool
+        executor rather than on the event loop; for the latter it must remain
+        a staticmethod, and both payload and result must be picklable. This
+        is only called if overridden by a subclass.
+
+        :param payload:  the message's Payload
+        '''
+        return None
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def on_computed(self, message, result):
+        '''
+        Receives the result of compute() back on the event loop, prior to
+        cleanup of the message. This does nothing by default.
+
+        :param message:  the message whose payload was computed
+        :param result:   the value returned by compute()
+        '''
+        pass
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     async def _arbitrate_message(self, message):
         '''
@@ -320,11 +663,27 @@ class Subscriber(Component, FiniteStateMachine):
             self._log.warning('cannot cleanup message: message has been garbage collected. [4]')
             return
         # set message flag as expired
-        self._log.debug('message {} expired by subscriber: {}.'.format(message.name, self._name))
+        self._log.debug('message %s expired by subscriber: %s.', message.name, self._name)
         message.expire()
         # clear any tasks related to the message
         self._message_bus.clear_tasks()
-        self._log.debug('end cleanup of message: {}'.format(message.name))
+        self._log.debug('end cleanup of message: %s', message.name)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def _cleanup_messages(self, messages):
+        '''
+        The batch mode equivalent of _cleanup_message(), expiring each of the
+        messages then telling the message bus to clear any completed tasks.
+
+        :param messages:  consumed messages that are done being processed.
+        '''
+        for _message in messages:
+            if _message.gcd:
+                self._log.warning('cannot cleanup message: message has been garbage collected. [5]')
+                continue
+            _message.expire()
+        self._message_bus.clear_tasks()
+        self._log.debug('end cleanup of %d messages.', len(messages))
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def _print_message_info(self, title, message, elapsed):
@@ -368,6 +727,7 @@ class Subscriber(Component, FiniteStateMachine):
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def disable(self):
         if self.enabled:
+            self._stop_workers()
             Component.disable(self)
             FiniteStateMachine.disable(self)
             self._log.debug('subscriber {} disabled.'.format(self.name))
@@ -377,6 +737,7 @@ class Subscriber(Component, FiniteStateMachine):
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def close(self):
         if not self.closed:
+            self._stop_workers()
             Component.close(self)
             FiniteStateMachine.close(self)
             self._log.debug('subscriber {} closed.'.format(self.name))
@@ -400,6 +761,9 @@ class GarbageCollector(Subscriber):
     Extends subscriber as a garbage collector that eliminates messages after
     they've passed the publish cycle. This subscriber accepts ANY event type.
 
+    As messages are normally retired by the message bus upon completion or
+    their deadline, this serves as a fallback for any that remain queued.
+
     :param name:         the subscriber name (for logging)
     :param config:       the application configuration
     :param message_bus:  the message bus
@@ -418,9 +782,9 @@ class GarbageCollector(Subscriber):
     def acceptable(self, message):
         '''
         A filter that returns True if the message is either expired and/or
-        fully acknowledged.
+        fully acknowledged, and is not held for processing by a subscriber.
         '''
-        return self._message_bus.is_expired(message) or message.fully_acknowledged
+        return not message.held and ( self._message_bus.is_expired(message) or message.fully_acknowledged )
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     async def consume(self):
@@ -437,16 +801,11 @@ class GarbageCollector(Subscriber):
 #       if self._message_bus.verbose:
 #           self._log.debug('gc-consume() message:' + Fore.WHITE + ' {}; event: {}'.format(_peeked_message.name, _peeked_message.event.name))
 
-        # garbage collect (consume) if filter accepts the peeked message
+        # garbage collect (retire) if filter accepts the peeked message
         if self.acceptable(_peeked_message):
-            _message = await self._message_bus.consume_message()
-            self._message_bus.consumed()
-            _message.gc() # mark as garbage collected and don't republish
-            if not _message.sent:
-                self._log.warning('garbage collected undelivered message: {}; event {} of group {}; value: {}'.format(
-                        _message.name, _message.event.name, _message.event.group.name, _message.value))
-#           elif self._message_bus.verbose:
-#           self._log.info('garbage collected message:' + Fore.WHITE + ' {}; event: {}'.format(_message.name, _message.event.name))
+            self._message_bus.retire(_peeked_message, MessageBus.RETIRED_COLLECTED)
+#           if self._message_bus.verbose:
+#               self._log.info('garbage collected message:' + Fore.WHITE + ' {}; event: {}'.format(_peeked_message.name, _peeked_message.event.name))
         else:
             # acknowledge we've seen the message
             _peeked_message.acknowledge(self)
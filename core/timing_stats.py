@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class TimingStats(object):
+    '''
+    Accumulates simple running statistics (count, mean, min, max, last) over
+    a series of durations in milliseconds, without retaining the samples.
+
+    :param name:  the name of the statistic, used when printed
+    '''
+    def __init__(self, name):
+        self._name = name
+        self.reset()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def name(self):
+        return self._name
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def reset(self):
+        '''
+        Clears all accumulated values.
+        '''
+        self._count    = 0
+        self._total_ms = 0.0
+        self._min_ms   = 0.0
+        self._max_ms   = 0.0
+        self._last_ms  = 0.0
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def record(self, elapsed_ms):
+        '''
+        Adds a single duration to the statistics.
+
+        :param elapsed_ms:  the duration in milliseconds
+        '''
+        if self._count == 0 or elapsed_ms < self._min_ms:
+            self._min_ms = elapsed_ms
+        if elapsed_ms > self._max_ms:
+            self._max_ms = elapsed_ms
+        self._count    += 1
+        self._total_ms += elapsed_ms
+        self._last_ms   = elapsed_ms
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def mean_ms(self):
+        return self._total_ms / self._count if self._count > 0 else 0.0
+
+    @property
+    def min_ms(self):
+        return self._min_ms
+
+    @property
+    def max_ms(self):
+        return self._max_ms
+
+    @property
+    def last_ms(self):
+        return self._last_ms
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def __str__(self):
+        return '{}: {:d} samples; mean: {:.2f}ms; min: {:.2f}ms; max: {:.2f}ms'.format(
+                self._name, self._count, self.mean_ms, self._min_ms, self._max_ms)
+
+#EOF
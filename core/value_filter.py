@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Predicates on Payload values, registered by a Subscriber for a given Event
+# and evaluated by the MessageBus when routing a message, so that a message
+# whose value is rejected is never delivered to (nor tracked for) that
+# Subscriber.
+#
+
+from abc import ABC, abstractmethod
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ValueFilter(ABC):
+    '''
+    The abstract base class for value predicates. As Payload values may be
+    tuples, the optional index selects the element of the value to test.
+
+    :param index:  the optional index of the element of a tuple value
+    '''
+    def __init__(self, index=None):
+        if index is not None and not isinstance(index, int):
+            raise ValueError('expected index as an int, not: {}'.format(type(index)))
+        self._index = index
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def accept(self, value):
+        '''
+        Returns True if the value (or its indexed element) passes the filter.
+        A None value is never accepted.
+        '''
+        if self._index is not None and value is not None:
+            value = value[self._index]
+        if value is None:
+            return False
+        return self.test(value)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @abstractmethod
+    def test(self, value):
+        '''
+        Returns True if the (non-None) value passes the filter.
+        '''
+        raise NotImplementedError('test() must be implemented in subclasses.')
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class Threshold(ValueFilter):
+    '''
+    Accepts values below and/or above a threshold (exclusive), e.g., an
+    infrared reading below 100mm is Threshold(below=100).
+
+    :param below:  accept values less than this, if provided
+    :param above:  accept values greater than this, if provided
+    :param index:  the optional index of the element of a tuple value
+    '''
+    def __init__(self, below=None, above=None, index=None):
+        ValueFilter.__init__(self, index)
+        if below is None and above is None:
+            raise ValueError('expected at least one of below or above arguments.')
+        self._below = below
+        self._above = above
+
+    def test(self, value):
+        return ( self._below is not None and value < self._below ) \
+                or ( self._above is not None and value > self._above )
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class Range(ValueFilter):
+    '''
+    Accepts values within (or if 'inside' is False, outside of) the closed
+    range from minimum to maximum.
+
+    :param minimum:  the lower bound of the range (inclusive)
+    :param maximum:  the upper bound of the range (inclusive)
+    :param inside:   if True (the default) accept values inside the range
+    :param index:    the optional index of the element of a tuple value
+    '''
+    def __init__(self, minimum, maximum, inside=True, index=None):
+        ValueFilter.__init__(self, index)
+        if minimum > maximum:
+            raise ValueError('minimum {} greater than maximum {}.'.format(minimum, maximum))
+        self._minimum = minimum
+        self._maximum = maximum
+        self._inside  = inside
+
+    def test(self, value):
+        return ( self._minimum <= value <= self._maximum ) is self._inside
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class ChangedBy(ValueFilter):
+    '''
+    Accepts a value only if it differs by more than delta from the last value
+    this filter accepted. The first value is always accepted. This is stateful
+    so an instance should not be shared between subscribers.
+
+    :param delta:  the minimum change (exclusive) for acceptance
+    :param index:  the optional index of the element of a tuple value
+    '''
+    def __init__(self, delta, index=None):
+        ValueFilter.__init__(self, index)
+        if delta < 0:
+            raise ValueError('expected a non-negative delta, not: {}'.format(delta))
+        self._delta = delta
+        self._last  = None
+
+    def test(self, value):
+        if self._last is None or abs(value - self._last) > self._delta:
+            self._last = value
+            return True
+        return False
+
+#EOF
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2024-11-16
-# modified: 2025-04-08
+# modified: 2026-10-18
 #
 
 import time
@@ -22,9 +22,10 @@ import core.globals as globals
 globals.init()
 
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.component import Component
 from core.orientation import Orientation
-from hardware.pigpiod_util import PigpiodUtility
+from hardware.pigpiod_util import PigpiodReadiness
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class DistanceSensor(Component):
@@ -52,7 +53,7 @@ class DistanceSensor(Component):
         Component.__init__(self, self._log, suppressed=False, enabled=True)
         if config is None:
             raise ValueError('no configuration provided.')
-        _cfg = config['kros'].get('hardware').get('distance_sensor')
+        _cfg = ConfigSection.of(config, 'kros.hardware.distance_sensor')
         match orientation:
             case Orientation.PORT:
                 self._pin = _cfg.get('pin_port') # pin connected to the port sensor
@@ -89,7 +90,9 @@ class DistanceSensor(Component):
         '''
         Make sure that pigpio is running.
         '''
-        PigpiodUtility.ensure_pigpiod_is_running()
+        # shared by all sensors, so only the first does any work
+        if not PigpiodReadiness.shared().ensure():
+            raise Exception("pigpio daemon is not available")
         self._pi = pigpio.pi()
         if not self._pi.connected:
             raise Exception("Failed to connect to pigpio daemon")
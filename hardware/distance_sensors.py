@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2025-05-07
-# modified: 2025-05-08
+# modified: 2026-10-18
 #
 
 from colorama import init, Fore, Style
@@ -15,6 +15,7 @@ init()
 
 from core.component import Component
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.orientation import Orientation
 from hardware.distance_sensor import DistanceSensor
 
@@ -38,7 +39,7 @@ class DistanceSensors(Component):
         # configuration ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         if config is None:
             raise ValueError('no configuration provided.')
-        _cfg = config['kros'].get('hardware').get('distance_sensors')
+        _cfg = ConfigSection.of(config, 'kros.hardware.distance_sensors')
         self._reverse_curve    = _cfg.get('reverse', False)
         self._min_distance     = _cfg.get('min_distance', 80)
         self._default_distance = _cfg.get('max_distance', 300)
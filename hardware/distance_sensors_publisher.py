@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2020-05-19
-# modified: 2025-05-08
+# modified: 2026-10-18
 #
 
 import asyncio
@@ -18,10 +18,12 @@ import core.globals as globals
 globals.init()
 
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.event import Event
 from core.orientation import Orientation
 from core.message_factory import MessageFactory
 from core.publisher import Publisher
+from core.rate import AsyncRate
 from hardware.distance_sensors import DistanceSensors
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -45,12 +47,13 @@ class DistanceSensorsPublisher(Publisher):
         # configuration ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         if config is None:
             raise ValueError('no configuration provided.')
-        _cfg = config['kros'].get('publisher').get('distance_sensors')
-        _loop_freq_hz          = _cfg.get('loop_freq_hz')
-        self._publish_delay_sec = 1.0 / _loop_freq_hz
-        self._sense_threshold  = _cfg.get('sense_threshold')
-        self._bump_threshold   = _cfg.get('bump_threshold')
+        _cfg = ConfigSection.of(config, 'kros.publisher.distance_sensors')
+        _loop_freq_hz          = _cfg.loop_freq_hz
+        self._rate             = AsyncRate(_loop_freq_hz, name=DistanceSensorsPublisher.CLASS_NAME, level=self._level)
+        self._sense_threshold  = _cfg.sense_threshold
+        self._bump_threshold   = _cfg.bump_threshold
         self._exit_on_cancel   = True # FIXME
+        self._clock            = None # if set, sample upon each clock tick
         # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         self._reverse_curve    = False # reverse normalisation curve
         self._default_distance = 300   # max sensor range in mm
@@ -79,6 +82,17 @@ class DistanceSensorsPublisher(Publisher):
         else:
             self._log.warning('failed to enable publisher.')
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def use_clock(self, clock):
+        '''
+        Samples the sensors upon each tick of the ClockPublisher rather than
+        at the publisher's own rate, aligning sampling with arbitration.
+
+        :param clock:  the ClockPublisher
+        '''
+        self._clock = clock
+        self._log.info('sampling driven by clock.')
+
     # weighted averages support ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     @staticmethod
@@ -141,6 +155,7 @@ class DistanceSensorsPublisher(Publisher):
             # enable all sensors
             for _sensor in self._sensors:
                 _sensor.enable()
+            self._rate.reset()
             while f_is_enabled():
                 for _sensor in self._sensors:
                     _distance_mm = _sensor.distance
@@ -155,7 +170,11 @@ class DistanceSensorsPublisher(Publisher):
                                 self._log.info(Fore.WHITE + "infrared: {:<10} {:>10.1f}mm".format(_sensor.orientation.name, _distance_mm))
                             _message = self.message_factory.create_message(self._get_infrared_event(_sensor.orientation), (_distance_mm))
                             await Publisher.publish(self, _message)
-                await asyncio.sleep(self._publish_delay_sec)
+                if self._clock:
+                    if await self._clock.wait_for_tick() is None:
+                        break # the clock has been disabled
+                else:
+                    await self._rate.wait()
         except asyncio.CancelledError:
             self._log.info('closing kros from Ctrl-C…')
             if self._exit_on_cancel:
@@ -168,6 +187,7 @@ class DistanceSensorsPublisher(Publisher):
                 _kros = _component_registry.get('kros')
                 _kros.shutdown()
 
+        self._rate.print_statistics()
         self._log.info('distance sensors publish loop complete.')
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -7,13 +7,14 @@
 #
 # author:   Murray Altheim
 # created:  2024-11-23
-# modified: 2025-05-08
+# modified: 2026-10-18
 #
 
 from colorama import init, Fore, Style
 init(autoreset=True)
 
 from core.logger import Logger, Level
+from core.config_section import ConfigSection
 from core.event import Event, Group
 from core.subscriber import Subscriber
 
@@ -30,7 +31,7 @@ class DistanceSensorsSubscriber(Subscriber):
     def __init__(self, config, message_bus, level=Level.INFO):
         Subscriber.__init__(self, DistanceSensorsSubscriber.CLASS_NAME, config, message_bus=message_bus, suppressed=False, enabled=False, level=level)
         self.add_events(Event.by_groups([Group.BUMPER, Group.INFRARED]))
-        _cfg = config['kros'].get('subscriber').get('distance_sensors')
+        _cfg = ConfigSection.of(config, 'kros.subscriber.distance_sensors')
         self._verbose = _cfg.get('verbose')
         self._log.info('ready.')
 
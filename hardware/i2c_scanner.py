@@ -7,10 +7,13 @@
 #
 # author:   altheim
 # created:  2020-02-14
-# modified: 2024-10-31
+# modified: 2026-10-18
 #
 #  Scans the I²C bus, returning a list of devices.
 #
+#  Scan results are cached to a file for a configurable time, and if the
+#  configuration's 'devices' map is populated only those addresses are probed.
+#
 # see: https://www.raspberrypi.org/forums/viewtopic.php?t=114401
 # see: https://raspberrypi.stackexchange.com/questions/62612/is-there-anyway-to-scan-i2c-using-pure-python-libraries:q
 #
@@ -23,18 +26,51 @@
 # DeviceNotFound class at bottom.
 #
 
+import os
+import json
+import time
 import errno
+import asyncio
+import hashlib
+import threading
 from colorama import init, Fore, Style
 init()
 
 from core.logger import Level, Logger
 
+# the range of addresses probed by a full scan
+SCAN_RANGE = range(3, 128)
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class I2CScanner(object):
     '''
     Scans the I²C bus, returning a list of devices.
+
+    The scan is performed once, upon the first request for its results,
+    or in the background if begun by scan_in_background() or scan_async(),
+    in which case a request for the results waits for it to complete.
+
+    If the configuration's 'devices' map (of address to device name) is
+    populated and 'targeted' is enabled, only the expected addresses are
+    probed, otherwise all addresses from 0x03 to 0x7F. The result is
+    written to a cache file and reused until it is older than its time to
+    live, or until the bus, the 'devices' map or the addresses probed
+    change. A failed scan (e.g., with no I²C bus) is not cached.
+
+    Configuration, from the 'kros.hardware.i2c_scanner' section, if any:
+
+      targeted:       if True probe only the addresses in the 'devices' map (default True)
+      cache_file:     the path of the cache file, or None to not cache (default None)
+      cache_ttl_sec:  the time to live of a cached result (default 86400)
+
+    :param config:       the application configuration (optional)
+    :param bus_number:   the I²C bus number, default 1 (/dev/i2c-1)
+    :param bus_factory:  an optional callable returning an SMBus-like context
+                         manager for a bus number, e.g., a fake for testing.
+                         The default imports smbus2.SMBus when first needed.
+    :param level:        the log level
     '''
-    def __init__(self, config, bus_number=1, level=Level.INFO):
+    def __init__(self, config=None, bus_number=1, level=Level.INFO, bus_factory=None):
         super().__init__()
         if not isinstance(bus_number, int):
             raise ValueError('expected bus number as an int.')
@@ -43,6 +79,16 @@ class I2CScanner(object):
         self._log = Logger('i2cscan', level)
         self._config = config
         self._bus_number = bus_number # bus number 1 indicates /dev/i2c-1
+        self._bus_factory = bus_factory
+        _cfg = ( config['kros'].get('hardware', {}).get('i2c_scanner') if config else None ) or {}
+        self._targeted = _cfg.get('targeted', True)
+        _cache_file = _cfg.get('cache_file')
+        self._cache_file = os.path.expanduser(_cache_file) if _cache_file else None
+        self._cache_ttl_sec = _cfg.get('cache_ttl_sec', 86400)
+        self._devices = ( config.get('devices') if config else None ) or {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._scanned = False
         self._int_list = []
         self._hex_list = []
 
@@ -97,46 +143,160 @@ class I2CScanner(object):
         return '0x{}'.format(address[2:].upper())
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-    def _scan_addresses(self):
+    def scan_in_background(self):
         '''
-        Scans the bus and returns the available device addresses. After being
-        called and populating the int and hex lists, this closes the connection
-        to smbus.
+        Begins the scan on a daemon thread, so that it may overlap with other
+        startup tasks, returning immediately. A subsequent request for the
+        scan results waits for the scan to complete.
         '''
-        if len(self._int_list) == 0:
-            self._log.info('scanning I²C address bus…')
-            device_count = 0
-            try:
-                self._log.info('initialising…')
-                from smbus2 import SMBus
-                with SMBus(self._bus_number) as _bus:
-                    self._log.info('scanning…')
-                    for address in range(3, 128):
-                        try:
-                            _bus.write_byte(address, 0)
-                            _hex_address = hex(address)
-                            self._log.debug('found I²C device at 0x{:02X} (hex: {})'.format(address, _hex_address))
-                            self._int_list.append(address)
-                            self._hex_list.append('0x{:02X}'.format(address))
-                            device_count = device_count + 1
-                        except IOError as e:
-                            if e.errno != errno.EREMOTEIO:
-                                self._log.debug('{0} on address {1}'.format(e, hex(address)))
-#                               self._log.warning('{0} on address {1}'.format(e, hex(address)))
-                        except Exception as e: # exception if read_byte fails
-                            self._log.error('{0} error on address {1}'.format(e, hex(address)))
-                self._log.info('scanning complete.')
-            except ImportError:
-                self._log.warning('import error, unable to initialise: this script requires smbus2. Scan will return an empty result.')
-            except Exception as e:
-                self._log.warning('{} while initialising I²C bus: scan will return an empty result.'.format(e))
+        with self._lock:
+            if self._scanned or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._scan_addresses, name='i2c-scan', daemon=True)
+            self._thread.start()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    async def scan_async(self):
+        '''
+        Performs the scan (if necessary) in the event loop's default executor
+        and returns the list of int addresses found.
+        '''
+        return await asyncio.get_running_loop().run_in_executor(None, self._scan_addresses)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def rescan(self):
+        '''
+        Discards the results of any previous scan, ignoring the cache, and
+        scans the bus again, returning the list of int addresses found.
+        '''
+        with self._lock:
+            self._scanned = False
+            self._int_list = []
+            self._hex_list = []
+        return self._scan_addresses(use_cache=False)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_targets(self):
+        '''
+        Returns the sorted list of int addresses to probe in a targeted scan,
+        or None for a full scan.
+        '''
+        if not self._targeted or not self._devices:
+            return None
+        return sorted({ int(_address) for _address in self._devices.keys() })
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _get_devices_hash(self):
+        _items = sorted(( int(_address), str(_name) ) for _address, _name in self._devices.items())
+        return hashlib.sha1(json.dumps(_items).encode('utf-8')).hexdigest()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _read_cache(self, targets):
+        '''
+        Returns the cached list of int addresses, or None if there is no
+        cache, or if it has expired or was written for a different bus,
+        'devices' map or set of targets.
+        '''
+        if not self._cache_file:
+            return None
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as _file:
+                _cached = json.load(_file)
+            _age_sec = time.time() - _cached['time']
+            if _cached['bus'] == self._bus_number and _cached['devices'] == self._get_devices_hash() \
+                    and _cached['targets'] == targets and 0 <= _age_sec < self._cache_ttl_sec:
+                self._log.info('using cached I²C scan from {:.0f}s ago.'.format(_age_sec))
+                return [ int(_address) for _address in _cached['addresses'] ]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self._log.warning('ignoring I²C scan cache: {}'.format(e))
+        return None
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _write_cache(self, targets, addresses):
+        if not self._cache_file:
+            return
+        _tmp_path = self._cache_file + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self._cache_file)), exist_ok=True)
+            with open(_tmp_path, 'w', encoding='utf-8') as _file:
+                json.dump({ 'bus': self._bus_number, 'time': time.time(), 'devices': self._get_devices_hash(),
+                        'targets': targets, 'addresses': addresses }, _file)
+            os.replace(_tmp_path, self._cache_file)
+        except OSError as e:
+            self._log.warning('unable to write I²C scan cache: {}'.format(e))
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _scan_addresses(self, use_cache=True):
+        '''
+        Scans the bus (or reads the cache) and returns the available device
+        addresses. After being called and populating the int and hex lists,
+        this closes the connection to smbus. This is serialised by a lock,
+        so that a caller waits for any scan already in progress.
+
+        :param use_cache:  if False ignore any cached result
+        '''
+        with self._lock:
+            if self._scanned:
+                return self._int_list
+            _targets = self._get_targets()
+            _addresses = self._read_cache(_targets) if use_cache else None
+            if _addresses is None:
+                _addresses = self._probe(_targets)
+                if _addresses is not None:
+                    self._write_cache(_targets, _addresses)
+            self._int_list = _addresses if _addresses is not None else []
+            self._hex_list = [ '0x{:02X}'.format(_address) for _address in self._int_list ]
+            self._scanned = True
+            device_count = len(self._int_list)
             if device_count == 1:
-                self._log.info("found one I²C device.".format(device_count))
+                self._log.info("found one I²C device.")
             elif device_count > 1:
                 self._log.info("found {:d} I²C devices.".format(device_count))
             else:
                 self._log.info("found no devices (no smbus available).")
-        return self._int_list
+            return self._int_list
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def _probe(self, targets):
+        '''
+        Probes the target addresses, or if None all addresses, returning the
+        list of int addresses that respond, or None if the bus could not be
+        opened.
+
+        :param targets:  the list of int addresses to probe, or None
+        '''
+        _addresses = SCAN_RANGE if targets is None else targets
+        if targets is None:
+            self._log.info('scanning I²C address bus…')
+        else:
+            self._log.info('probing {:d} expected I²C addresses…'.format(len(targets)))
+        _found = []
+        try:
+            self._log.info('initialising…')
+            if self._bus_factory is None:
+                from smbus2 import SMBus
+                self._bus_factory = SMBus
+            with self._bus_factory(self._bus_number) as _bus:
+                self._log.info('scanning…')
+                for address in _addresses:
+                    try:
+                        _bus.write_byte(address, 0)
+                        self._log.debug('found I²C device at 0x{:02X} (hex: {})'.format(address, hex(address)))
+                        _found.append(address)
+                    except IOError as e:
+                        if e.errno != errno.EREMOTEIO:
+                            self._log.debug('{0} on address {1}'.format(e, hex(address)))
+                    except Exception as e: # exception if read_byte fails
+                        self._log.error('{0} error on address {1}'.format(e, hex(address)))
+            self._log.info('scanning complete.')
+            return _found
+        except ImportError:
+            self._log.warning('import error, unable to initialise: this script requires smbus2. Scan will return an empty result.')
+        except Exception as e:
+            self._log.warning('{} while initialising I²C bus: scan will return an empty result.'.format(e))
+        return None
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def print_device_list(self):
@@ -151,7 +311,7 @@ class I2CScanner(object):
         Returns the lookup device name from the device registry found in
         the YAML configuration.
         '''
-        _device = self._config['devices'].get(address)
+        _device = self._devices.get(address)
         return 'Unknown' if _device is None else _device
 
     # end class ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
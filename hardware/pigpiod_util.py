@@ -7,10 +7,13 @@
 #
 # author:   altheim
 # created:  2020-11-18
-# modified: 2024-11-18
+# modified: 2026-10-18
 #
 
-import psutil
+import os
+import time
+import socket
+import threading
 import subprocess
 from datetime import datetime as dt, timedelta
 from colorama import init, Fore, Style
@@ -18,18 +21,148 @@ init()
 
 from core.logger import Logger, Level
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PigpiodReadiness(object):
+    '''
+    Determines whether the pigpio daemon is ready by connecting to its
+    socket, as the pigpio library itself will, rather than by searching
+    the process table or polling systemctl. While waiting for the daemon
+    the socket is probed with exponential backoff, beginning quickly so
+    that a daemon that is just starting is found promptly.
+
+    Once the daemon has been found ready, or ensure() has given up on it,
+    the result is cached for the lifetime of the process, so that any
+    number of sensors may call ensure() at the cost of a single check.
+    Use shared() to obtain the instance for the default host and port.
+
+    :param host:           the daemon's host, default $PIGPIO_ADDR or 'localhost'
+    :param port:           the daemon's port, default $PIGPIO_PORT or 8888
+    :param probe_timeout:  the timeout of each connection attempt, in seconds
+    '''
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, host=None, port=None, probe_timeout=0.25):
+        self._log  = Logger('pig-ready', Level.INFO)
+        self._host = host if host else os.environ.get('PIGPIO_ADDR', 'localhost')
+        self._port = int(port if port else os.environ.get('PIGPIO_PORT', 8888))
+        self._probe_timeout = probe_timeout
+        self._lock = threading.Lock()
+        self._ready = None # the cached result of ensure()
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @staticmethod
+    def shared(host=None, port=None):
+        '''
+        Returns the process-wide instance for the host and port.
+        '''
+        _instance = PigpiodReadiness(host, port)
+        with PigpiodReadiness._shared_lock:
+            return PigpiodReadiness._shared.setdefault(( _instance._host, _instance._port ), _instance)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    @property
+    def ready(self):
+        '''
+        Returns the cached result of ensure(), None if not yet determined.
+        '''
+        return self._ready
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def probe(self):
+        '''
+        Returns True if a connection to the daemon's socket succeeds. This is
+        never cached.
+        '''
+        try:
+            with socket.create_connection(( self._host, self._port ), timeout=self._probe_timeout):
+                return True
+        except OSError:
+            return False
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def wait_until_ready(self, timeout=10.0, initial_delay=0.01, max_delay=0.5):
+        '''
+        Probes the daemon's socket until it accepts a connection or the
+        timeout passes, doubling the delay between probes each time up to
+        the maximum delay. Returns True if the daemon became ready.
+
+        :param timeout:        the time to wait, in seconds
+        :param initial_delay:  the delay after the first failed probe, in seconds
+        :param max_delay:      the maximum delay between probes, in seconds
+        '''
+        _deadline = time.monotonic() + timeout
+        _delay = initial_delay
+        while True:
+            if self.probe():
+                return True
+            _remaining = _deadline - time.monotonic()
+            if _remaining <= 0:
+                return False
+            time.sleep(min(_delay, _remaining))
+            _delay = min(_delay * 2.0, max_delay)
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def ensure(self, start=True, timeout=10.0):
+        '''
+        Returns True if the daemon is ready, first starting it via systemctl
+        if it isn't and 'start' is True, then waiting for it. The result is
+        cached, so only the first call does any work; concurrent callers
+        wait for that call to complete.
+
+        :param start:    if True attempt to start the daemon if it isn't ready
+        :param timeout:  the time to wait for a started daemon, in seconds
+        '''
+        with self._lock:
+            if self._ready is not None:
+                return self._ready
+            _start_time = time.monotonic()
+            if self.probe():
+                self._log.debug('pigpiod is ready on %s:%d.', self._host, self._port)
+                self._ready = True
+            elif start:
+                self._log.info(Fore.YELLOW + 'pigpiod is not running: attempting to start it…')
+                try:
+                    subprocess.run(['sudo', 'systemctl', 'start', 'pigpiod'], check=True)
+                    self._ready = self.wait_until_ready(timeout)
+                except subprocess.CalledProcessError as e:
+                    self._log.warning('failed to start pigpiod service: {}'.format(e))
+                    self._ready = False
+                except FileNotFoundError:
+                    self._log.warning("the 'systemctl' command is not found: cannot start pigpiod.")
+                    self._ready = False
+                if self._ready:
+                    self._log.info(Fore.GREEN + 'pigpiod ready; elapsed time: {:.2f}ms'.format(( time.monotonic() - _start_time ) * 1000.0))
+                else:
+                    self._log.warning('pigpiod is not ready on {}:{:d}.'.format(self._host, self._port))
+            else:
+                self._ready = False
+            return self._ready
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def reset(self):
+        '''
+        Discards the cached result, e.g., after stopping the daemon.
+        '''
+        with self._lock:
+            self._ready = None
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class PigpiodUtility:
     '''
     A simple class to determine if pigpiod is running, and if not, start it.
+    Readiness is determined by the shared PigpiodReadiness.
     '''
     @staticmethod
     def is_pigpiod_running():
         '''
-        Check if the pigpiod process is running.
+        Check if the pigpiod process is running. This searches the process
+        table: to determine if the daemon is ready to accept connections use
+        PigpiodReadiness.
 
         :return: True if pigpiod is running, False otherwise.
         '''
+        import psutil
         for process in psutil.process_iter(['name']):
             if process.info['name'] == 'pigpiod':
                 return True
@@ -38,14 +171,11 @@ class PigpiodUtility:
     @staticmethod
     def ensure_pigpiod_is_running():
         '''
-        Ensure the pigpiod service is running, starting it if necessary.
+        Ensure the pigpiod service is running, starting it if necessary,
+        returning True if it is ready. Only the first call in the process
+        does any work.
         '''
-        _log = Logger('pig-util', Level.INFO)
-        if PigpiodUtility.is_pigpiod_running():
-            _log.debug("pigpiod is already running.")
-        else:
-            _log.info(Fore.YELLOW + "pigpiod is not running: attempting to start it…")
-            PigpiodUtility.start_pigpiod(skip_check=True)
+        return PigpiodReadiness.shared().ensure()
 
     @staticmethod
     def start_pigpiod(skip_check=False):
@@ -54,14 +184,16 @@ class PigpiodUtility:
 
         :param skip_check: If True, skip the check for whether pigpiod is already running.
         '''
-        _log = Logger('pig-util', Level.INFO)
-        if not skip_check and PigpiodUtility.is_pigpiod_running():
+        _log = Logger('pig-util')
+        _readiness = PigpiodReadiness.shared()
+        if not skip_check and _readiness.probe():
             _log.info("pigpiod is already running.")
             return
         try:
             start_time = dt.now()
             subprocess.run(['sudo', 'systemctl', 'start', 'pigpiod'], check=True)
-            PigpiodUtility.wait_for_daemon('pigpiod', timeout=10)
+            _readiness.reset()
+            _readiness.wait_until_ready(timeout=10)
             end_time = dt.now()
             elapsed_time_ms = (end_time - start_time).total_seconds() * 1000
             _log.info(Fore.GREEN + f'pigpiod service started, elapsed time: {elapsed_time_ms:.2f} ms')
@@ -72,17 +204,14 @@ class PigpiodUtility:
 
     @staticmethod
     def wait_for_daemon(service_name, timeout=10):
-        _log = Logger('pig-util', Level.INFO)
+        _log = Logger('pig-util')
         deadline = dt.now() + timedelta(seconds=timeout)
         while dt.now() < deadline:
             result = subprocess.run(["systemctl", "is-active", service_name], capture_output=True, text=True)
             if result.stdout.strip() == "active":
                 _log.info(f"{service_name} is now active.")
                 return True
-            # busy-wait for 1 second
-            wait_until = dt.now() + timedelta(seconds=1)
-            while dt.now() < wait_until:
-                pass  # busy wait
+            time.sleep(1.0)
         _log.warning(f"timeout: {service_name} did not become active within {timeout} seconds.")
         return False
 
@@ -93,13 +222,15 @@ class PigpiodUtility:
 
         :param skip_check: If True, skip the check for whether pigpiod is already stopped.
         '''
-        _log = Logger('pig-util', Level.INFO)
-        if not skip_check and not PigpiodUtility.is_pigpiod_running():
+        _log = Logger('pig-util')
+        _readiness = PigpiodReadiness.shared()
+        if not skip_check and not _readiness.probe():
             _log.info("pigpiod is already stopped.")
             return
         try:
             start_time = dt.now()
             subprocess.run(['sudo', 'systemctl', 'stop', 'pigpiod'], check=True)
+            _readiness.reset()
             PigpiodUtility.wait_for_daemon_to_stop('pigpiod', timeout=10)
             end_time = dt.now()
             elapsed_time_ms = (end_time - start_time).total_seconds() * 1000
@@ -111,17 +242,14 @@ class PigpiodUtility:
 
     @staticmethod
     def wait_for_daemon_to_stop(service_name, timeout=10):
-        _log = Logger('pig-util', Level.INFO)
+        _log = Logger('pig-util')
         deadline = dt.now() + timedelta(seconds=timeout)
         while dt.now() < deadline:
             result = subprocess.run(["systemctl", "is-active", service_name], capture_output=True, text=True)
             if result.stdout.strip() in ("inactive", "failed", "unknown"):  # includes "failed" in case it crashes
                 _log.info(f"{service_name} has stopped.")
                 return True
-            # busy-wait for 1 second
-            wait_until = dt.now() + timedelta(seconds=1)
-            while dt.now() < wait_until:
-                pass
+            time.sleep(1.0)
         _log.warning(f"timeout: {service_name} did not stop within {timeout} seconds.")
         return False
 
@@ -7,7 +7,7 @@
 #
 # author:   Murray Altheim
 # created:  2019-12-23
-# modified: 2025-05-09
+# modified: 2026-10-18
 #
 # The K-Series Robot Operating System (KROS), including its command line 
 # interface (CLI) is a minimisation of earlier versions, essentially the
@@ -15,11 +15,17 @@
 #
 
 import os, sys, time, traceback
+
+from core.startup_profiler import StartupProfiler
+# created before the remaining imports so as to time them
+_profiler = StartupProfiler(enabled=any(_arg.startswith('--profile-startup') for _arg in sys.argv[1:]))
+
 import argparse
 import itertools
 from pathlib import Path
 from colorama import init, Fore, Style
-init()
+with _profiler.phase('colorama init'):
+    init()
 
 import core.globals as globals
 globals.init()
@@ -33,17 +39,15 @@ from core.message import Message
 from core.message_bus import MessageBus
 from core.message_factory import MessageFactory
 from core.config_loader import ConfigLoader
+from core.config_section import ConfigSection
 from core.controller import Controller
 from core.publisher import Publisher
-from core.queue_publisher import QueuePublisher
 from core.subscriber import Subscriber, GarbageCollector
-
-from hardware.distance_sensors import DistanceSensors
-from hardware.distance_sensors_publisher import DistanceSensorsPublisher
-from hardware.distance_sensors_subscriber import DistanceSensorsSubscriber
+from core.plugin_registry import PluginRegistry
 
 from hardware.i2c_scanner import I2CScanner
-from behave.behaviour_manager import BehaviourManager
+
+_profiler.lap('imports')
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class KROS(Component, FiniteStateMachine):
@@ -58,11 +62,15 @@ class KROS(Component, FiniteStateMachine):
     to determine the highest priority action to execute for that task cycle,
     by passing it on to the Controller.
     '''
-    def __init__(self, level=Level.INFO):
+    def __init__(self, level=Level.INFO, profiler=None):
         '''
         This initialises KROS and calls the YAML configurer.
+
+        :param level:     the log level
+        :param profiler:  the optional StartupProfiler timing configuration and start
         '''
         _name = 'kros'
+        self._profiler = profiler if profiler else StartupProfiler()
         self._level = level
         self._log = Logger(_name, self._level)
         self._print_banner()
@@ -72,13 +80,17 @@ class KROS(Component, FiniteStateMachine):
         # configuration…
         self._config                      = None
         self._component_registry          = None
+        self._plugin_registry             = None
+        self._i2c_scanner                 = None
         self._controller                  = None
         self._message_bus                 = None
         self._queue_publisher             = None
+        self._clock_publisher             = None
         self._distance_sensors            = None
         self._distance_sensors_publisher  = None
         self._distance_sensors_subscriber = None
         self._behaviour_mgr               = None
+        self._profile_path                = None
         self._started                     = False
         self._closing                     = False
         self._log.info('oid: {}'.format(id(self)))
@@ -101,7 +113,23 @@ class KROS(Component, FiniteStateMachine):
         _config_filename = arguments.config_file
         _filename = _config_filename if _config_filename is not None else 'config.yaml'
         self._config = _loader.configure(_filename)
-        _i2c_scanner = I2CScanner(self._config, level=Level.INFO)
+        self._profiler.lap('read config')
+        # the I²C scan is performed upon the first request for its results,
+        # unless configured to begin now so that it overlaps what follows
+        self._i2c_scanner = I2CScanner(self._config, level=Level.INFO)
+        if ConfigSection.of(self._config, 'kros.hardware.i2c_scanner').get('scan_at_startup'):
+            self._i2c_scanner.scan_in_background()
+        self._profiler.lap('i2c scanner')
+        _logger_cfg = self._config['kros'].get('logger')
+        if _logger_cfg and _logger_cfg.get('queue_mode'):
+            Logger.enable_queue_mode(_logger_cfg.get('queue_capacity'))
+            self._log.info('logging in queue mode.')
+        if _logger_cfg and 'flight_recorder_capacity' in _logger_cfg:
+            Logger.configure_flight_recorder(_logger_cfg.get('flight_recorder_capacity'))
+        if _logger_cfg and _logger_cfg.get('rate_limits'):
+            Logger.configure_rate_limits(_logger_cfg)
+            self._log.info('rate limiting loggers: {}'.format(', '.join(_logger_cfg.get('rate_limits'))))
+        self._profiler.lap('logger setup')
 
         # configuration from command line arguments ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -114,6 +142,8 @@ class KROS(Component, FiniteStateMachine):
         # print remaining arguments
         self._log.info('argument config-file: {}'.format(arguments.config_file))
         self._log.info('argument level:       {}'.format(arguments.level))
+        self._profile_path = getattr(arguments, 'profile_startup', None) or None
+        self._profiler.lap('arguments')
 
         # establish basic subsumption components ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -121,8 +151,10 @@ class KROS(Component, FiniteStateMachine):
 
         self._message_bus = MessageBus(self._config, self._level)
         self._message_factory = MessageFactory(self._message_bus, self._level)
+        self._profiler.lap('message bus')
 
         self._controller = Controller(self._message_bus, self._level)
+        self._profiler.lap('controller')
 
         # create components ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -131,34 +163,47 @@ class KROS(Component, FiniteStateMachine):
 
         # basic hardware ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
+        # optional components are only imported if enabled
+        self._plugin_registry = PluginRegistry(self._config, profiler=self._profiler, level=self._level)
+
         # create subscribers ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
         _subs = arguments.subs if arguments.subs else ''
 
-        if _cfg.get('enable_distance_subscriber'):
-            self._distance_sensors_subscriber = DistanceSensorsSubscriber(self._config, self._message_bus, level=self._level) # reacts to IR sensors
+        self._distance_sensors_subscriber = self._plugin_registry.create('distance-subscriber',
+                self._config, self._message_bus, level=self._level) # reacts to IR sensors
 
         # create publishers  ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
         _pubs = arguments.pubs if arguments.pubs else ''
 
-        if _cfg.get('enable_queue_publisher') or 'q' in _pubs:
-            self._queue_publisher = QueuePublisher(self._config, self._message_bus, self._message_factory, self._level)
+        self._queue_publisher = self._plugin_registry.create('queue-publisher',
+                self._config, self._message_bus, self._message_factory, self._level, force='q' in _pubs)
 
-        _enable_distance_sensors = _cfg.get('enable_distance_publisher')
-        if _enable_distance_sensors:
-            self._distance_sensors = DistanceSensors(self._config, level=self._level)
-            self._distance_sensors_publisher = DistanceSensorsPublisher(self._config, self._message_bus, self._message_factory, self._distance_sensors, level=self._level)
+        self._clock_publisher = self._plugin_registry.create('clock-publisher',
+                self._config, self._message_bus, self._message_factory, self._level, force='c' in _pubs)
+        if self._clock_publisher:
+            self._message_bus.arbitrator.use_clock(self._clock_publisher)
+
+        self._distance_sensors = self._plugin_registry.create('distance-sensors', self._config, level=self._level)
+        self._distance_sensors_publisher = self._plugin_registry.create('distance-publisher',
+                self._config, self._message_bus, self._message_factory, self._distance_sensors, level=self._level)
+        if self._distance_sensors_publisher and self._clock_publisher:
+            self._distance_sensors_publisher.use_clock(self._clock_publisher)
 
         # and finally, the garbage collector:
         self._garbage_collector = GarbageCollector(self._config, self._message_bus, level=self._level)
+        self._profiler.lap('garbage collector')
 
         # create behaviours ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
-        _enable_behaviours = _cfg.get('enable_behaviours') or Util.is_true(arguments.behave)
-        if _enable_behaviours:
-            self._behaviour_mgr = BehaviourManager(self._config, self._message_bus, self._message_factory, self._level) # a specialised subscriber
+        self._behaviour_mgr = self._plugin_registry.create('behaviour-manager',
+                self._config, self._message_bus, self._message_factory, self._level,
+                force=Util.is_true(arguments.behave)) # a specialised subscriber
+        if self._behaviour_mgr:
             self._log.info('behaviour manager enabled.')
 
+        self._plugin_registry.print_report()
+
         # finish up ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
         self._export_config = False
@@ -177,20 +222,22 @@ class KROS(Component, FiniteStateMachine):
             self._log.warning('already started.')
             # could toggle callback on pushbutton?
             return
-        self._log.heading('starting', 'starting k-series robot operating system (kros)…', '[2/2]' )
-        FiniteStateMachine.start(self)
+        with self._profiler.phase('start'):
+            self._log.heading('starting', 'starting k-series robot operating system (kros)…', '[2/2]' )
+            FiniteStateMachine.start(self)
 
-        # begin main loop ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+            # begin main loop ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
-        self._log.notice('Press Ctrl-C to exit.')
-        self._log.info('begin main os loop.\r')
+            self._log.notice('Press Ctrl-C to exit.')
+            self._log.info('begin main os loop.\r')
 
-        # we enable ourself if we get this far successfully
-        Component.enable(self)
-        FiniteStateMachine.enable(self)
+            # we enable ourself if we get this far successfully
+            Component.enable(self)
+            FiniteStateMachine.enable(self)
 
-        # print registry of components
-        self._component_registry.print_registry()
+            # print registry of components
+            self._component_registry.print_registry()
+        self.report_startup_profile()
 
         # ════════════════════════════════════════════════════════════════════
         # now in main application loop until quit or Ctrl-C…
@@ -202,6 +249,26 @@ class KROS(Component, FiniteStateMachine):
 
         # end main loop ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def report_startup_profile(self):
+        '''
+        If profiling startup, stops the profiler, prints its report and, if
+        a file was named by the --profile-startup argument, writes the
+        report to it as JSON. The profiler is stopped just before the main
+        loop begins, so the starting of publishers and subscribers when the
+        message bus is enabled is not included.
+        '''
+        if not self._profiler.enabled:
+            return
+        self._profiler.stop()
+        self._profiler.print_report(self._log)
+        if self._profile_path:
+            try:
+                self._profiler.write_json(self._profile_path)
+                self._log.info('startup profile written to: ' + Fore.YELLOW + '{}'.format(self._profile_path))
+            except Exception as e:
+                self._log.error('{} writing startup profile: {}'.format(type(e), e))
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def get_config(self):
         '''
@@ -258,6 +325,21 @@ class KROS(Component, FiniteStateMachine):
         '''
         return self._queue_publisher
 
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def get_clock_publisher(self):
+        '''
+        Returns the ClockPublisher, None if not used.
+        '''
+        return self._clock_publisher
+
+    # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+    def get_i2c_scanner(self):
+        '''
+        Returns the I2CScanner, whose scan may not yet have been performed,
+        or if begun at startup may still be in progress.
+        '''
+        return self._i2c_scanner
+
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
     def _set_pi_leds(self, enable):
         '''
@@ -290,6 +372,7 @@ class KROS(Component, FiniteStateMachine):
             self._pushbutton.cancel()
             self._pushbutton = None
         self._log.info(Fore.MAGENTA + 'shutting down…')
+        Logger.dump_flight_recorder('shutdown')
         self.close()
         # we never get here if we shut down properly
         self._log.error('shutdown error.')
@@ -307,6 +390,8 @@ class KROS(Component, FiniteStateMachine):
             self._log.info('disabling…')
             if self._queue_publisher:
                 self._queue_publisher.disable()
+            if self._clock_publisher:
+                self._clock_publisher.disable()
             Component.disable(self)
             FiniteStateMachine.disable(self)
             self._log.info('disabled.')
@@ -350,6 +435,7 @@ class KROS(Component, FiniteStateMachine):
                 while not Component.close(self): # will call disable()
                     self._log.info('closing component…')
                 FiniteStateMachine.close(self)
+                self._log.stats.print_report(self._log)
                 # stop using logger here
                 print(Fore.CYAN + '\n-- application closed.\n' + Style.RESET_ALL)
             except Exception as e:
@@ -454,7 +540,10 @@ def parse_args(passed_args=None):
     parser.add_argument('--behave',       '-b', help='override behaviour configuration (1, y, yes or true, otherwise false)')
     parser.add_argument('--config-file',  '-f', help='use alternative configuration file')
     parser.add_argument('--log',          '-L', action='store_true', help='write log to timestamped file')
+    parser.add_argument('--log-format',   '-F', choices=['csv', 'jsonl'], default='csv', help='format of log file \'csv\'|\'jsonl\' (default: \'csv\')')
     parser.add_argument('--level',        '-l', help='specify logging level \'DEBUG\'|\'INFO\'|\'WARN\'|\'ERROR\' (default: \'INFO\')')
+    parser.add_argument('--profile-startup',    nargs='?', const='', metavar='JSON_FILE',
+            help='time the phases of startup and the imports and print a report,\noptionally also writing it as JSON to the file')
 
     try:
         print('')
@@ -467,6 +556,7 @@ def parse_args(passed_args=None):
             return -1
         else:
             globals.put('log-to-file', args.log)
+            globals.put('log-format', args.log_format)
             return args
 
 
@@ -500,10 +590,13 @@ def main(argv):
             _level = Level.from_string(_args.level) if _args.level != None else Level.INFO
             _log.level = _level
             _log.debug('arguments: {}'.format(_args))
-            _kros = KROS(level=_level)
+            with _profiler.phase('construct'):
+                _kros = KROS(level=_level, profiler=_profiler)
             if _args.configure or _args.start:
-                _kros.configure(_args)
+                with _profiler.phase('configure'):
+                    _kros.configure(_args)
                 if not _args.start:
+                    _kros.report_startup_profile()
                     _log.info('configure only: ' + Fore.YELLOW + 'specify the -s argument to start kros.')
             if _args.start:
                 _counter = itertools.count() 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2025 by Murray Altheim. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Murray Altheim
+# created:  2026-10-18
+# modified: 2026-10-18
+#
+# Measures the per-message cost of a suppressed (below level) debug message,
+# comparing eager str.format() arguments with deferred %-style arguments and
+# with an enabled_for() guard. Nothing is actually written by the benchmark.
+#
+# usage:  log_benchmark.py [count]
+#
+
+import sys
+import timeit
+from colorama import init, Fore, Style
+init()
+
+from core.logger import Logger, Level
+from core.event import Event
+
+# ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+def main():
+
+    _count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    _log = Logger('benchmark', level=Level.INFO)
+    _bench = Logger('bench-target', level=Level.INFO)
+    _name = 'msg-0042'
+    _event = Event.INFRARED_PORT
+
+    def _eager():
+        _bench.debug('message {} expired by subscriber: {}; event: {}.'.format(_name, 'subscriber', _event.name))
+
+    def _lazy():
+        _bench.debug('message %s expired by subscriber: %s; event: %s.', _name, 'subscriber', _event.name)
+
+    def _guarded():
+        if _bench.enabled_for(Level.DEBUG):
+            _bench.debug('message {} expired by subscriber: {}; event: {}.'.format(_name, 'subscriber', _event.name))
+
+    _log.info('timing {:d} suppressed debug messages at level {}…'.format(_count, _bench.level.name))
+    _results = []
+    for _label, _function in [ ('eager format', _eager), ('lazy %-args', _lazy), ('enabled_for guard', _guarded) ]:
+        _sec = min(timeit.repeat(_function, number=_count, repeat=5))
+        _results.append((_label, _sec * 1e9 / _count))
+    _baseline_ns = _results[0][1]
+    for _label, _ns in _results:
+        _log.info('{:<18}'.format(_label) + Fore.YELLOW + '{:8.1f}ns per message; {:5.1f}% of eager.'.format(_ns, 100.0 * _ns / _baseline_ns))
+
+# ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
+if __name__== "__main__":
+    main()
+
+#EOF